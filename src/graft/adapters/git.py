@@ -3,6 +3,8 @@
 Real git operations using git CLI via subprocess.
 """
 
+import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -14,6 +16,13 @@ from graft.domain.exceptions import (
     SubmoduleOperationError,
 )
 
+# Refs that name a commit directly rather than a branch or tag
+_COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{7,40}$")
+
+# Full object name as printed by `git cat-file --batch-check`: 40 hex
+# characters in SHA-1 repositories, 64 in SHA-256 repositories
+_OBJECT_NAME_PATTERN = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
 
 class SubprocessGitOperations:
     """Git operations using subprocess.
@@ -34,7 +43,10 @@ class SubprocessGitOperations:
     ) -> None:
         """Clone git repository using subprocess.
 
-        Uses shallow clone (--depth 1) for efficiency.
+        Uses shallow clone (--depth 1) for efficiency. Commit SHAs cannot
+        be passed to --branch, so they use a blobless partial clone
+        (--filter=blob:none) instead and check out the commit afterwards;
+        only the blobs for that commit are downloaded.
 
         Args:
             url: Git repository URL
@@ -46,18 +58,30 @@ class SubprocessGitOperations:
             GitAuthenticationError: If authentication fails
             GitNotFoundError: If repository or ref not found
         """
+        is_commit = _COMMIT_SHA_PATTERN.match(ref) is not None
         try:
-            # Clone with specific ref (shallow clone for efficiency)
-            cmd = [
-                "git",
-                "clone",
-                "--branch",
-                ref,
-                "--depth",
-                "1",
-                url,
-                destination,
-            ]
+            if is_commit:
+                # Full history without blobs; checkout fetches the rest
+                cmd = [
+                    "git",
+                    "clone",
+                    "--filter=blob:none",
+                    "--no-checkout",
+                    url,
+                    destination,
+                ]
+            else:
+                # Clone with specific ref (shallow clone for efficiency)
+                cmd = [
+                    "git",
+                    "clone",
+                    "--branch",
+                    ref,
+                    "--depth",
+                    "1",
+                    url,
+                    destination,
+                ]
 
             result = subprocess.run(
                 cmd,
@@ -92,6 +116,9 @@ class SubprocessGitOperations:
                         returncode=result.returncode,
                     )
 
+            if is_commit:
+                self.checkout(destination, ref)
+
         except subprocess.SubprocessError as e:
             raise GitCloneError(
                 dependency_name=Path(destination).name,
@@ -178,7 +205,8 @@ class SubprocessGitOperations:
     def is_repository(self, path: str) -> bool:
         """Check if path is a git repository.
 
-        Checks for presence of .git directory.
+        Checks for presence of .git directory with a single stat; a
+        missing path and a missing .git both report False.
 
         Args:
             path: Path to check
@@ -186,8 +214,7 @@ class SubprocessGitOperations:
         Returns:
             True if path is a git repository
         """
-        git_dir = Path(path) / ".git"
-        return git_dir.exists() and git_dir.is_dir()
+        return os.path.isdir(os.path.join(path, ".git"))
 
     def resolve_ref(self, repo_path: str, ref: str) -> str:
         """Resolve git ref to commit hash.
@@ -232,6 +259,47 @@ class SubprocessGitOperations:
                 f"Failed to resolve ref '{ref}' in {repo_path}: {e}"
             ) from e
 
+    def batch_resolve_refs(self, repo_path: str, refs: list[str]) -> dict[str, str | None]:
+        """Resolve many git refs with a single `git cat-file --batch-check`.
+
+        Args:
+            repo_path: Path to git repository
+            refs: Git references (branches, tags, or commit hashes)
+
+        Returns:
+            Mapping of each ref to its object hash, or None if it doesn't resolve
+
+        Raises:
+            ValueError: If repo is invalid
+        """
+        if not refs:
+            return {}
+
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "--batch-check=%(objectname)"],
+                cwd=repo_path,
+                input="".join(f"{ref}\n" for ref in refs),
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            raise ValueError(f"Failed to resolve refs in {repo_path}: {e}") from e
+
+        if result.returncode != 0:
+            raise ValueError(
+                f"Failed to resolve refs in {repo_path}: {result.stderr.strip()}"
+            )
+
+        # One output line per input ref; unknown refs print "<ref> missing"
+        # (or "<ref> ambiguous") instead of an object name
+        lines = result.stdout.splitlines()
+        return {
+            ref: line if _OBJECT_NAME_PATTERN.match(line) else None
+            for ref, line in zip(refs, lines, strict=True)
+        }
+
     def fetch_all(self, repo_path: str) -> None:
         """Fetch all refs from remote without checking out.
 
@@ -278,6 +346,53 @@ class SubprocessGitOperations:
                 returncode=1,
             ) from e
 
+    def fetch_ref(self, repo_path: str, ref: str) -> None:
+        """Fetch a single ref from remote without checking out.
+
+        Updates the remote-tracking branch for ref (if it is a branch)
+        without modifying working directory.
+
+        Args:
+            repo_path: Path to existing git repository
+            ref: Git reference to fetch (branch, tag, or commit hash)
+
+        Raises:
+            GitFetchError: If fetch fails
+            GitAuthenticationError: If authentication fails
+        """
+        try:
+            fetch_cmd = ["git", "-C", repo_path, "fetch", "origin", ref]
+            result = subprocess.run(fetch_cmd, capture_output=True, text=True, check=False)
+
+            if result.returncode != 0:
+                dep_name = Path(repo_path).name
+                stderr = result.stderr.strip()
+
+                # Detect authentication errors
+                if "Permission denied" in stderr or "publickey" in stderr:
+                    raise GitAuthenticationError(
+                        dependency_name=dep_name,
+                        url=repo_path,
+                        suggestion="Check SSH keys and repository access",
+                    )
+                else:
+                    raise GitFetchError(
+                        dependency_name=dep_name,
+                        repo_path=repo_path,
+                        ref=ref,
+                        stderr=stderr,
+                        returncode=result.returncode,
+                    )
+
+        except subprocess.SubprocessError as e:
+            raise GitFetchError(
+                dependency_name=Path(repo_path).name,
+                repo_path=repo_path,
+                ref=ref,
+                stderr=f"Subprocess error: {e}",
+                returncode=1,
+            ) from e
+
     def checkout(self, repo_path: str, ref: str) -> None:
         """Checkout a specific ref in a repository.
 
@@ -634,6 +749,64 @@ class SubprocessGitOperations:
         except subprocess.SubprocessError as e:
             raise ValueError(f"Failed to get submodule status for {path}: {e}") from e
 
+    def list_submodules(self) -> dict[str, dict[str, str]]:
+        """Get status info for every submodule in one call.
+
+        Runs a single `git submodule status` and parses each line
+        (format: <status><commit> <path> (<description>)).
+
+        Returns:
+            Dictionary mapping submodule path to 'commit' and 'status'
+
+        Raises:
+            ValueError: If unable to list submodules
+        """
+        try:
+            result = subprocess.run(
+                ["git", "submodule", "status"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+            if result.returncode != 0:
+                raise ValueError(f"Failed to list submodules: {result.stderr.strip()}")
+
+            submodules: dict[str, dict[str, str]] = {}
+            for line in result.stdout.splitlines():
+                if len(line) < 2:
+                    continue
+
+                commit, _, path = line[1:].partition(" ")
+                if path.endswith(")") and " (" in path:
+                    path = path.rsplit(" (", 1)[0]
+
+                submodules[path] = {"commit": commit, "status": line[0]}
+
+            return submodules
+
+        except subprocess.SubprocessError as e:
+            raise ValueError(f"Failed to list submodules: {e}") from e
+
+    def init_submodule(self, path: str) -> None:
+        """Register a submodule in the superproject's .git/config.
+
+        Args:
+            path: Path to the submodule
+
+        Raises:
+            ValueError: If initialization fails
+        """
+        try:
+            init_cmd = ["git", "submodule", "init", path]
+            result = subprocess.run(init_cmd, capture_output=True, text=True, check=False)
+
+            if result.returncode != 0:
+                raise ValueError(f"Failed to init submodule: {result.stderr.strip()}")
+
+        except subprocess.SubprocessError as e:
+            raise ValueError(f"Failed to init submodule {path}: {e}") from e
+
     def sync_submodule(self, path: str) -> None:
         """Sync submodule URL with .gitmodules.
 
@@ -779,6 +952,40 @@ class SubprocessGitOperations:
                 f"Failed to create worktree at {worktree_path}: {e}"
             ) from e
 
+    def reset_worktree(self, worktree_path: str, commit: str) -> None:
+        """Reset a worktree to a commit and delete untracked files.
+
+        Runs `git reset --hard <commit>` followed by `git clean -ffdx`, so
+        no build outputs or other artifacts survive from earlier use.
+
+        Args:
+            worktree_path: Path to existing worktree
+            commit: Git commit hash to reset to
+
+        Raises:
+            ValueError: If the reset or clean fails
+        """
+        for cmd in (
+            ["git", "reset", "--hard", "--quiet", commit],
+            ["git", "clean", "-ffdx", "--quiet"],
+        ):
+            try:
+                result = subprocess.run(
+                    cmd,
+                    cwd=worktree_path,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                raise ValueError(f"Failed to reset worktree at {worktree_path}: {e}") from e
+
+            if result.returncode != 0:
+                raise ValueError(
+                    f"Failed to reset worktree at {worktree_path} to {commit}: "
+                    f"{result.stderr.strip()}"
+                )
+
     def remove_worktree(self, repo_path: str, worktree_path: str) -> None:
         """Remove a git worktree.
 
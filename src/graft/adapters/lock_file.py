@@ -3,12 +3,20 @@
 YAML-based lock file operations.
 """
 
+import os
+import threading
 from pathlib import Path
 
 import yaml
 
 from graft.domain.lock_entry import LockEntry
 
+# Parsed lock files shared by all adapter instances in the process, so the
+# separate YamlLockFile objects a command creates reuse one parse.
+# absolute path -> ((st_mtime_ns, st_size, st_ino), parsed entries)
+_parsed_lock_files: dict[str, tuple[tuple[int, int, int], dict[str, LockEntry]]] = {}
+_parsed_lock_files_lock = threading.Lock()
+
 
 class YamlLockFile:
     """YAML-based lock file implementation.
@@ -31,6 +39,10 @@ class YamlLockFile:
     def read_lock_file(self, path: str) -> dict[str, LockEntry]:
         """Read lock file and return dependency entries.
 
+        Parsed entries are cached per absolute path, across adapter
+        instances, and reused while the file's mtime, size and inode are
+        unchanged, so repeated reads skip YAML parsing.
+
         Args:
             path: Path to graft.lock file
 
@@ -41,10 +53,35 @@ class YamlLockFile:
             FileNotFoundError: If lock file doesn't exist
             ValueError: If lock file is malformed
         """
-        path_obj = Path(path)
-        if not path_obj.exists():
-            raise FileNotFoundError(f"Lock file not found: {path}")
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Lock file not found: {path}") from None
+
+        cache_key = os.path.abspath(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with _parsed_lock_files_lock:
+            cached = _parsed_lock_files.get(cache_key)
+        if cached is not None and cached[0] == stat_key:
+            return dict(cached[1])
+
+        entries = self._parse_lock_file(path)
+        with _parsed_lock_files_lock:
+            _parsed_lock_files[cache_key] = (stat_key, entries)
+        return dict(entries)
+
+    def _parse_lock_file(self, path: str) -> dict[str, LockEntry]:
+        """Parse lock file contents into dependency entries.
+
+        Args:
+            path: Path to existing graft.lock file
 
+        Returns:
+            Dictionary mapping dependency name to LockEntry
+
+        Raises:
+            ValueError: If lock file is malformed
+        """
         try:
             with open(path) as f:
                 data = yaml.safe_load(f)
@@ -122,6 +159,10 @@ class YamlLockFile:
             },
         }
 
+        # Drop cached parse; mtime granularity may hide a same-size rewrite
+        with _parsed_lock_files_lock:
+            _parsed_lock_files.pop(os.path.abspath(path), None)
+
         # Write to file
         try:
             # Ensure parent directory exists
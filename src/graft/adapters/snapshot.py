@@ -3,10 +3,13 @@
 Provides filesystem-based snapshot/rollback using file copying.
 """
 
+import os
 import shutil
 from datetime import UTC, datetime
 from pathlib import Path
 
+from graft.domain.snapshot import SnapshotInfo
+
 
 class FilesystemSnapshot:
     """Filesystem-based snapshot implementation.
@@ -157,6 +160,29 @@ class FilesystemSnapshot:
 
         return snapshot_dirs
 
+    def list_snapshot_info(self) -> list[SnapshotInfo]:
+        """List all snapshots with their metadata in one call.
+
+        Creation time comes from the timestamp in each ID; size is the
+        total of the files stored in the snapshot. Directories named like
+        snapshots but without a timestamp ID (e.g. snapshot-foo) are
+        skipped, so retention never acts on them.
+
+        Returns:
+            SnapshotInfo for every snapshot, newest first
+        """
+        infos = []
+        for snapshot_id in self.list_snapshots():
+            try:
+                info = SnapshotInfo.from_id(
+                    snapshot_id,
+                    size_bytes=_directory_size(str(self._get_snapshot_path(snapshot_id))),
+                )
+            except ValueError:
+                continue
+            infos.append(info)
+        return infos
+
     def _get_snapshot_path(self, snapshot_id: str) -> Path:
         """Get path to snapshot directory.
 
@@ -167,3 +193,19 @@ class FilesystemSnapshot:
             Path to snapshot directory
         """
         return Path(self._snapshot_dir) / snapshot_id
+
+
+def _directory_size(path: str) -> int:
+    """Sum the sizes of all files under a directory.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Total size in bytes (symlinks count as the link itself)
+    """
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            total += os.lstat(os.path.join(root, name)).st_size
+    return total
@@ -102,14 +102,19 @@ def changes_command(
         # Parse dependency's graft.yaml
         config = config_service.parse_graft_yaml(ctx, dep_config_path)
 
-        # Get changes (optionally filtered by range)
-        changes = query_service.get_changes_in_range(config, from_ref, to_ref)
-
-        # Apply filters
-        if breaking_only:
-            changes = query_service.filter_breaking_changes(changes)
-        elif change_type:
-            changes = query_service.filter_changes_by_type(changes, change_type)
+        # Get changes (optionally filtered by range and type)
+        if from_ref is None and to_ref is None and breaking_only:
+            changes = query_service.get_breaking_changes(config)
+        elif from_ref is None and to_ref is None and change_type:
+            changes = query_service.get_changes_by_type(config, change_type)
+        else:
+            changes = query_service.get_changes_in_range(config, from_ref, to_ref)
+
+            # Apply filters
+            if breaking_only:
+                changes = query_service.filter_breaking_changes(changes)
+            elif change_type:
+                changes = query_service.filter_changes_by_type(changes, change_type)
 
         # Display results
         if not changes:
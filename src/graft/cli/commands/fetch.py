@@ -3,7 +3,7 @@
 CLI command for fetching latest from remote repositories.
 """
 
-from pathlib import Path
+import os
 
 import typer
 
@@ -65,10 +65,10 @@ def fetch_command(
         error_count = 0
 
         for name, _dep_spec in deps_to_fetch.items():
-            dep_path = Path(ctx.deps_directory) / name
+            dep_path = os.path.join(ctx.deps_directory, name)
 
             # Check if dependency is cloned
-            if not dep_path.exists():
+            if not os.path.exists(dep_path):
                 typer.secho(
                     f"  ⚠ {name}: not cloned (run 'graft resolve')",
                     fg=typer.colors.YELLOW,
@@ -76,7 +76,7 @@ def fetch_command(
                 error_count += 1
                 continue
 
-            if not ctx.git.is_repository(str(dep_path)):
+            if not ctx.git.is_repository(dep_path):
                 typer.secho(
                     f"  ✗ {name}: not a git repository",
                     fg=typer.colors.RED,
@@ -87,7 +87,7 @@ def fetch_command(
 
             # Fetch from remote (all refs)
             try:
-                ctx.git.fetch_all(str(dep_path))
+                ctx.git.fetch_all(dep_path)
                 typer.secho(f"  ✓ {name}: fetched successfully", fg=typer.colors.GREEN)
                 success_count += 1
             except Exception as e:
@@ -19,7 +19,7 @@ from graft.domain.exceptions import (
     DependencyResolutionError,
     DomainError,
 )
-from graft.services import config_service, lock_service, resolution_service
+from graft.services import config_service, lock_service
 
 GITIGNORE_ENTRY = ".graft"
 
@@ -76,6 +76,9 @@ def resolve_command() -> None:
 
         All dependencies resolved successfully!
     """
+    # Imported here so other commands don't load resolution machinery
+    from graft.services import resolution_service
+
     ctx = get_dependency_context()
 
     # Find and parse configuration
@@ -116,9 +119,19 @@ def resolve_command() -> None:
     typer.echo("Resolving dependencies...")
     typer.echo()
 
+    lock_file = YamlLockFile()
+    lock_file_path = lock_service.find_lock_file(lock_file, ".") or "./graft.lock"
+
+    # Previous lock state lets unchanged pinned deps skip fetching
+    try:
+        locked_entries = lock_service.get_all_lock_entries(lock_file, lock_file_path)
+    except ValueError:
+        # Malformed lock file - it will be rewritten below
+        locked_entries = {}
+
     try:
         # Use flat resolution to get all direct dependencies
-        lock_entries = resolution_service.resolve_to_lock_entries(ctx, config)
+        lock_entries = resolution_service.resolve_to_lock_entries(ctx, config, locked_entries)
 
         # Display resolved dependencies
         for name in sorted(lock_entries.keys()):
@@ -132,8 +145,6 @@ def resolve_command() -> None:
         # Write lock file
         typer.echo()
         typer.echo("Writing lock file...")
-        lock_file = YamlLockFile()
-        lock_file_path = lock_service.find_lock_file(lock_file, ".") or "./graft.lock"
         lock_file.write_lock_file(lock_file_path, lock_entries)
         typer.secho(f"  ✓ Updated {lock_file_path}", fg=typer.colors.GREEN)
 
@@ -4,7 +4,7 @@ CLI command for viewing the current state of dependencies.
 """
 
 import json
-from pathlib import Path
+import os
 
 import typer
 
@@ -63,10 +63,10 @@ def _check_for_updates(dep_name: str | None, format_option: str) -> None:
 
         # Check each dependency
         for name, _dep_spec in deps_to_check.items():
-            dep_path = Path(ctx.deps_directory) / name
+            dep_path = os.path.join(ctx.deps_directory, name)
 
             # Skip if not cloned
-            if not dep_path.exists() or not ctx.git.is_repository(str(dep_path)):
+            if not os.path.exists(dep_path) or not ctx.git.is_repository(dep_path):
                 if format_option != "json":
                     typer.secho(
                         f"  ⚠ {name}: not cloned (run 'graft resolve')",
@@ -77,7 +77,7 @@ def _check_for_updates(dep_name: str | None, format_option: str) -> None:
 
             # Fetch from remote
             try:
-                ctx.git.fetch_all(str(dep_path))
+                ctx.git.fetch_all(dep_path)
             except Exception as e:
                 if format_option != "json":
                     typer.secho(
@@ -94,7 +94,7 @@ def _check_for_updates(dep_name: str | None, format_option: str) -> None:
             # Check if ref has moved
             has_update = False
             try:
-                current_commit = ctx.git.resolve_ref(str(dep_path), current_ref)
+                current_commit = ctx.git.resolve_ref(dep_path, current_ref)
                 lock_commit = lock_entries[name].commit if name in lock_entries else None
 
                 if lock_commit and current_commit != lock_commit:
@@ -4,6 +4,7 @@ Value objects for graft configuration.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from graft.domain.change import Change
@@ -146,13 +147,39 @@ class GraftConfig:
         """
         return name in self.commands
 
+    @cached_property
+    def changes_by_type(self) -> dict[str, list[Change]]:
+        """Index of changes grouped by type, built once on first use.
+
+        Changes without a type are not indexed. Lists keep declaration order.
+
+        Returns:
+            Mapping of change type to changes of that type
+        """
+        index: dict[str, list[Change]] = {}
+        for change in self.changes.values():
+            if change.type is not None:
+                index.setdefault(change.type, []).append(change)
+        return index
+
+    def get_changes_by_type(self, change_type: str) -> list[Change]:
+        """Get all changes of a given type.
+
+        Args:
+            change_type: Type to look up (breaking, feature, fix, etc.)
+
+        Returns:
+            List of changes with that type, in declaration order
+        """
+        return list(self.changes_by_type.get(change_type, ()))
+
     def get_breaking_changes(self) -> list[Change]:
         """Get all breaking changes.
 
         Returns:
             List of changes with type="breaking"
         """
-        return [c for c in self.changes.values() if c.is_breaking()]
+        return self.get_changes_by_type("breaking")
 
     def get_changes_needing_migration(self) -> list[Change]:
         """Get all changes that need migration.
@@ -0,0 +1,74 @@
+"""Snapshot domain model.
+
+Metadata about a stored workspace snapshot, used to apply retention
+policies without querying the snapshot backend once per snapshot.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+SNAPSHOT_ID_PREFIX = "snapshot-"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def is_snapshot_id(name: str) -> bool:
+    """Check if a name is a timestamp-based snapshot ID.
+
+    Args:
+        name: Snapshot directory name
+
+    Returns:
+        True if name has the form snapshot-<microseconds>
+
+    Example:
+        >>> is_snapshot_id("snapshot-1700000000000000")
+        True
+        >>> is_snapshot_id("snapshot-foo")
+        False
+    """
+    timestamp = name.removeprefix(SNAPSHOT_ID_PREFIX)
+    return timestamp != name and timestamp.isascii() and timestamp.isdigit()
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """Metadata for a single snapshot.
+
+    Attributes:
+        snapshot_id: ID returned from create_snapshot()
+        created_at: When the snapshot was taken
+        size_bytes: Total size of the snapshotted files
+
+    Example:
+        >>> info = SnapshotInfo.from_id("snapshot-1700000000000000", size_bytes=42)
+        >>> info.created_at.year
+        2023
+    """
+
+    snapshot_id: str
+    created_at: datetime
+    size_bytes: int
+
+    @classmethod
+    def from_id(cls, snapshot_id: str, size_bytes: int) -> "SnapshotInfo":
+        """Build info for a timestamp-based snapshot ID.
+
+        Snapshot IDs encode their creation time in microseconds since the
+        epoch, so no filesystem metadata is needed for created_at.
+
+        Args:
+            snapshot_id: ID of the form snapshot-<microseconds>
+            size_bytes: Total size of the snapshotted files
+
+        Returns:
+            SnapshotInfo for the snapshot
+
+        Raises:
+            ValueError: If snapshot_id is not timestamp-based
+        """
+        if not is_snapshot_id(snapshot_id):
+            raise ValueError(f"Not a snapshot ID: {snapshot_id}")
+        micros = int(snapshot_id.removeprefix(SNAPSHOT_ID_PREFIX))
+        created_at = _EPOCH + timedelta(microseconds=micros)
+        return cls(snapshot_id=snapshot_id, created_at=created_at, size_bytes=size_bytes)
@@ -39,6 +39,10 @@ class StateQuery:
     timeout: int | None = None
     """Command timeout in seconds. Default: 300 (5 minutes)."""
 
+    projection: tuple[str, ...] | None = None
+    """Dotted field paths to keep from the output (e.g., 'totals.percent_covered').
+    If None, the full output is kept."""
+
     @classmethod
     def from_dict(cls, name: str, data: dict[str, Any]) -> "StateQuery":
         """Create StateQuery from YAML data.
@@ -63,7 +67,21 @@ class StateQuery:
         if timeout is not None and not isinstance(timeout, int):
             raise ValueError(f"State query '{name}' timeout must be an integer")
 
-        return cls(name=name, run=data["run"], cache=cache, timeout=timeout)
+        projection = data.get("projection")
+        if projection is not None:
+            if not isinstance(projection, list) or not all(
+                isinstance(path, str) and path for path in projection
+            ):
+                raise ValueError(f"State query '{name}' projection must be a list of field paths")
+            projection = tuple(projection)
+
+        return cls(
+            name=name,
+            run=data["run"],
+            cache=cache,
+            timeout=timeout,
+            projection=projection,
+        )
 
 
 @dataclass(frozen=True)
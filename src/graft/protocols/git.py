@@ -81,6 +81,21 @@ class GitOperations(Protocol):
         """
         ...
 
+    def batch_resolve_refs(self, repo_path: str, refs: list[str]) -> dict[str, str | None]:
+        """Resolve many git refs with a single git invocation.
+
+        Args:
+            repo_path: Path to git repository
+            refs: Git references (branches, tags, or commit hashes)
+
+        Returns:
+            Mapping of each ref to its object hash, or None if it doesn't resolve
+
+        Raises:
+            Exception: If repo is invalid
+        """
+        ...
+
     def fetch_all(self, repo_path: str) -> None:
         """Fetch all refs from remote without checking out.
 
@@ -94,6 +109,21 @@ class GitOperations(Protocol):
         """
         ...
 
+    def fetch_ref(self, repo_path: str, ref: str) -> None:
+        """Fetch a single ref from remote without checking out.
+
+        Updates the remote-tracking branch for ref (if it is a branch)
+        without modifying working directory.
+
+        Args:
+            repo_path: Path to existing git repository
+            ref: Git reference to fetch (branch, tag, or commit hash)
+
+        Raises:
+            Exception: If fetch fails
+        """
+        ...
+
     def checkout(self, repo_path: str, ref: str) -> None:
         """Checkout a specific ref in a repository.
 
@@ -180,6 +210,38 @@ class GitOperations(Protocol):
         """
         ...
 
+    def list_submodules(self) -> dict[str, dict[str, str]]:
+        """Get status info for every submodule in one call.
+
+        Batch counterpart to is_submodule/get_submodule_status, so callers
+        processing many dependencies can avoid one git call per path.
+
+        Returns:
+            Dictionary mapping submodule path (as reported by git, relative
+            to the working directory) to:
+            - 'commit': Commit hash git reports for the submodule
+            - 'status': Status indicator (' ' clean, '+' modified,
+              '-' uninitialized, 'U' conflicts)
+
+        Raises:
+            Exception: If unable to list submodules
+        """
+        ...
+
+    def init_submodule(self, path: str) -> None:
+        """Register a submodule in the superproject's .git/config.
+
+        Only writes configuration; the clone happens in a later
+        update_submodule call.
+
+        Args:
+            path: Path to the submodule
+
+        Raises:
+            Exception: If initialization fails
+        """
+        ...
+
     def sync_submodule(self, path: str) -> None:
         """Sync submodule URL with .gitmodules.
 
@@ -258,6 +320,21 @@ class GitOperations(Protocol):
         """
         ...
 
+    def reset_worktree(self, worktree_path: str, commit: str) -> None:
+        """Reset a worktree to a commit and delete untracked files.
+
+        Moves the worktree's detached HEAD to commit, discards local changes,
+        and removes untracked and ignored files, leaving a pristine checkout.
+
+        Args:
+            worktree_path: Path to existing worktree
+            commit: Git commit hash to reset to
+
+        Raises:
+            Exception: If the reset or clean fails
+        """
+        ...
+
     def remove_worktree(self, repo_path: str, worktree_path: str) -> None:
         """Remove a git worktree.
 
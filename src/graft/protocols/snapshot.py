@@ -3,8 +3,11 @@
 Protocol for snapshot and rollback operations to enable atomic upgrades.
 """
 
+from collections.abc import Iterable
 from typing import Protocol
 
+from graft.domain.snapshot import SnapshotInfo
+
 
 class Snapshot(Protocol):
     """Protocol for snapshot and rollback operations.
@@ -63,10 +66,21 @@ class Snapshot(Protocol):
         """
         ...
 
-    def list_snapshots(self) -> list[str]:
+    def list_snapshots(self) -> Iterable[str]:
         """List all snapshot IDs.
 
+        Implementations may return a list or a lazy iterator; callers
+        should only iterate the result once.
+
+        Returns:
+            Snapshot IDs, newest first
+        """
+        ...
+
+    def list_snapshot_info(self) -> list[SnapshotInfo]:
+        """List all snapshots with their metadata in one call.
+
         Returns:
-            List of snapshot IDs, newest first
+            SnapshotInfo for every snapshot, newest first
         """
         ...
@@ -37,6 +37,8 @@ def update_dependency_lock(
     source: str,
     ref: str,
     commit: str,
+    *,
+    force_overwrite: bool = False,
 ) -> None:
     """Update lock file entry for a dependency.
 
@@ -49,6 +51,9 @@ def update_dependency_lock(
         source: Git URL or path
         ref: Git ref being consumed
         commit: Resolved commit hash
+        force_overwrite: Write a fresh lock file containing only this
+            entry, skipping the existence check. Use for initial writes
+            where any existing lock file should be replaced.
 
     Raises:
         IOError: If unable to write lock file
@@ -60,8 +65,9 @@ def update_dependency_lock(
         consumed_at=datetime.now(UTC),
     )
 
-    # If lock file doesn't exist, create it with this entry
-    if not lock_file.lock_file_exists(lock_path):
+    # If lock file doesn't exist (or caller asserts an initial write),
+    # create it with this entry
+    if force_overwrite or not lock_file.lock_file_exists(lock_path):
         lock_file.write_lock_file(lock_path, {dep_name: entry})
     else:
         lock_file.update_lock_entry(lock_path, dep_name, entry)
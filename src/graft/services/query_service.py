@@ -3,6 +3,7 @@
 Service functions for querying dependency status, changes, and details.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -42,24 +43,22 @@ def get_all_status(
         List of DependencyStatus for all dependencies
         Empty list if lock file doesn't exist
     """
-    # Read lock file
-    if not lock_file.lock_file_exists(lock_path):
+    # Read lock file (single read; missing file means no dependencies)
+    try:
+        entries = lock_file.read_lock_file(lock_path)
+    except FileNotFoundError:
         return []
 
-    entries = lock_file.read_lock_file(lock_path)
-
     # Convert to status objects
-    statuses = []
-    for name, entry in entries.items():
-        status = DependencyStatus(
+    return [
+        DependencyStatus(
             name=name,
             current_ref=entry.ref,
             consumed_at=entry.consumed_at,
             commit=entry.commit,
         )
-        statuses.append(status)
-
-    return statuses
+        for name, entry in entries.items()
+    ]
 
 
 def get_dependency_status(
@@ -75,12 +74,12 @@ def get_dependency_status(
     Returns:
         DependencyStatus if found, None otherwise
     """
-    # Read lock file
-    if not lock_file.lock_file_exists(lock_path):
+    # Read lock file (single read; missing file means no dependencies)
+    try:
+        entries = lock_file.read_lock_file(lock_path)
+    except FileNotFoundError:
         return None
 
-    entries = lock_file.read_lock_file(lock_path)
-
     if dep_name not in entries:
         return None
 
@@ -93,16 +92,19 @@ def get_dependency_status(
     )
 
 
-def get_changes_for_dependency(config: GraftConfig) -> list[Change]:
+def get_changes_for_dependency(config: GraftConfig) -> Iterable[Change]:
     """Get all changes from a dependency's config.
 
+    Returns a live view rather than a copy; wrap it in list() if you
+    need indexing or a snapshot.
+
     Args:
         config: Parsed graft.yaml configuration
 
     Returns:
-        List of changes in declaration order
+        Changes in declaration order
     """
-    return list(config.changes.values())
+    return config.changes.values()
 
 
 def get_changes_in_range(
@@ -126,16 +128,16 @@ def get_changes_in_range(
     """
     # For now, return all changes
     # TODO: Filter based on git ref ordering once git integration is added
-    return get_changes_for_dependency(config)
+    return list(get_changes_for_dependency(config))
 
 
 def filter_changes_by_type(
-    changes: list[Change], change_type: str
+    changes: Iterable[Change], change_type: str
 ) -> list[Change]:
     """Filter changes by type.
 
     Args:
-        changes: List of changes to filter
+        changes: Changes to filter
         change_type: Type to filter by (breaking, feature, fix, etc.)
 
     Returns:
@@ -144,11 +146,11 @@ def filter_changes_by_type(
     return [c for c in changes if c.type == change_type]
 
 
-def filter_breaking_changes(changes: list[Change]) -> list[Change]:
+def filter_breaking_changes(changes: Iterable[Change]) -> list[Change]:
     """Filter to only breaking changes.
 
     Args:
-        changes: List of changes to filter
+        changes: Changes to filter
 
     Returns:
         List of breaking changes
@@ -156,6 +158,37 @@ def filter_breaking_changes(changes: list[Change]) -> list[Change]:
     return [c for c in changes if c.is_breaking()]
 
 
+def get_changes_by_type(config: GraftConfig, change_type: str) -> list[Change]:
+    """Get all of a config's changes of a given type.
+
+    Equivalent to filter_changes_by_type over every change, but uses the
+    config's precomputed type index instead of scanning.
+
+    Args:
+        config: Parsed graft.yaml configuration
+        change_type: Type to filter by (breaking, feature, fix, etc.)
+
+    Returns:
+        List of changes in declaration order
+    """
+    return config.get_changes_by_type(change_type)
+
+
+def get_breaking_changes(config: GraftConfig) -> list[Change]:
+    """Get all of a config's breaking changes.
+
+    Equivalent to filter_breaking_changes over every change, but uses the
+    config's precomputed type index instead of scanning.
+
+    Args:
+        config: Parsed graft.yaml configuration
+
+    Returns:
+        List of breaking changes in declaration order
+    """
+    return config.get_breaking_changes()
+
+
 def get_change_by_ref(config: GraftConfig, ref: str) -> Change | None:
     """Get a specific change by ref.
 
@@ -198,22 +231,14 @@ def get_change_details(config: GraftConfig, ref: str) -> ChangeDetails | None:
         Command existence is validated by GraftConfig.__post_init__,
         so we can safely assume commands exist if referenced.
     """
-    # Get change
-    change = get_change_by_ref(config, ref)
-    if not change:
+    change = config.changes.get(ref)
+    if change is None:
         return None
 
     # Get command details (validated by GraftConfig, so safe to use .get())
-    migration_command = None
-    if change.migration:
-        migration_command = config.commands.get(change.migration)
-
-    verify_command = None
-    if change.verify:
-        verify_command = config.commands.get(change.verify)
-
+    commands = config.commands
     return ChangeDetails(
         change=change,
-        migration_command=migration_command,
-        verify_command=verify_command,
+        migration_command=commands.get(change.migration) if change.migration else None,
+        verify_command=commands.get(change.verify) if change.verify else None,
     )
@@ -33,7 +33,15 @@ with a clear error message. To fix this:
 2. Run `graft resolve` again
 """
 
+import contextlib
+import hashlib
+import json
 import os
+import re
+import stat
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -42,51 +50,229 @@ from graft.domain.dependency import DependencyResolution, DependencySpec, Depend
 from graft.domain.exceptions import DependencyResolutionError
 from graft.domain.lock_entry import LockEntry
 from graft.services.dependency_context import DependencyContext
+from graft.services.submodule_service import load_submodule_index, lookup_submodule
 
 DEFAULT_DEPS_DIRECTORY = ".graft"
 
+# Upper bound on concurrent clone/fetch operations
+MAX_PARALLEL_RESOLUTIONS = 8
 
-def _can_use_submodules(deps_directory: str) -> bool:
+# Refs that name a commit directly (full or abbreviated SHA)
+_COMMIT_REF_PATTERN = re.compile(r"^[0-9a-f]{7,40}$")
+
+
+def _can_use_submodules(deps_directory: str, cwd: str) -> bool:
     """Check if submodules can be used for the given deps directory.
 
     Submodules require the deps_directory to be inside the git repository.
     If the deps_directory is outside the repo (e.g., "../"), we must use
     regular git clones instead.
 
+    The result is memoized per (deps_directory, cwd), so resolving many
+    dependencies only spawns `git rev-parse` once. It is also kept in the
+    user cache directory so later invocations can skip the subprocess.
+
     Args:
         deps_directory: The configured deps directory
+        cwd: Working directory deps_directory is relative to
 
     Returns:
         True if submodules can be used, False if regular clones should be used
     """
-    import subprocess
+    return _SubmoduleSupportProbe(deps_directory, cwd).result()
+
+
+# (deps_directory, cwd) -> whether submodules can be used
+_submodule_support_cache: dict[tuple[str, str], bool] = {}
+
+
+def _submodule_support_cache_path(cwd: str) -> str:
+    """Path of the file carrying submodule-support results for cwd.
+
+    Lives under ~/.cache/graft, like the state query cache, so nothing is
+    written into the project checkout.
+
+    Args:
+        cwd: Working directory the results apply to
+
+    Returns:
+        Path to the cache file for cwd
+    """
+    cwd_hash = hashlib.sha256(cwd.encode()).hexdigest()[:16]
+    return os.path.join(
+        str(Path.home()), ".cache", "graft", "submodule-support", f"{cwd_hash}.json"
+    )
+
+
+def _load_persisted_submodule_support(cwd: str, deps_directory: str) -> bool | None:
+    """Read a still-valid persisted submodule-support result.
+
+    An entry is trusted only while its repo root still has a .git, no
+    nested repository sits between cwd and that root, and deps_directory
+    still resolves to the same place. All of these are stat calls, so a
+    warm start needs no git subprocess.
+
+    Args:
+        cwd: Current working directory
+        deps_directory: The configured deps directory
 
+    Returns:
+        The cached result, or None if missing or stale
+    """
     try:
-        # Get the git repository root
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            # Not in a git repo - can't use submodules
-            return False
+        with open(_submodule_support_cache_path(cwd)) as f:
+            entry = json.load(f)["submodule_support"][deps_directory]
+        repo_root: str = entry["repo_root"]
+        deps_path: str = entry["deps_path"]
+        can_use: bool = entry["can_use_submodules"]
+        cached_cwd: str = entry["cwd"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
-        repo_root = Path(result.stdout.strip()).resolve()
-        deps_path = Path(deps_directory).resolve()
+    if cached_cwd != cwd or not isinstance(can_use, bool):
+        return None
+    if os.path.realpath(os.path.join(cwd, deps_directory)) != deps_path:
+        return None
+    if not os.path.exists(os.path.join(repo_root, ".git")):
+        return None
+
+    # The innermost .git above cwd must still be repo_root's
+    current = os.path.realpath(cwd)
+    if current != repo_root and not current.startswith(repo_root.rstrip(os.sep) + os.sep):
+        return None
+    while current != repo_root:
+        if os.path.exists(os.path.join(current, ".git")):
+            return None
+        current = os.path.dirname(current)
+
+    return can_use
+
+
+def _persist_submodule_support(
+    cwd: str,
+    deps_directory: str,
+    repo_root: str,
+    deps_path: str,
+    can_use: bool,
+) -> None:
+    """Record a submodule-support result in the user cache directory.
+
+    Failures are ignored since the cache is purely an optimization.
+
+    Args:
+        cwd: Current working directory
+        deps_directory: The configured deps directory
+        repo_root: Resolved repository root
+        deps_path: Resolved deps_directory
+        can_use: Whether submodules can be used
+    """
+    cache_path = _submodule_support_cache_path(cwd)
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+
+    entries = data.get("submodule_support")
+    if not isinstance(entries, dict):
+        entries = data["submodule_support"] = {}
+    entries[deps_directory] = {
+        "cwd": cwd,
+        "repo_root": repo_root,
+        "deps_path": deps_path,
+        "can_use_submodules": can_use,
+    }
+
+    # Write atomically so concurrent runs never read a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+class _SubmoduleSupportProbe:
+    """In-flight check for whether submodules can be used.
+
+    Starts `git rev-parse --show-toplevel` on construction (unless the
+    answer is already cached in memory or on disk) and only
+    waits for it in result(), so callers can overlap the subprocess with
+    other setup work.
+    """
+
+    def __init__(self, deps_directory: str, cwd: str) -> None:
+        """Start the probe for deps_directory relative to cwd.
+
+        Args:
+            deps_directory: The configured deps directory
+            cwd: Working directory deps_directory is relative to
+        """
+        self._deps_directory = deps_directory
+        self._cwd = cwd
+        self._process: subprocess.Popen[str] | None = None
+
+        key = (deps_directory, self._cwd)
+        if key in _submodule_support_cache:
+            return
+
+        persisted = _load_persisted_submodule_support(self._cwd, deps_directory)
+        if persisted is not None:
+            _submodule_support_cache[key] = persisted
+            return
 
-        # Check if deps_directory is inside or equal to the repo root
         try:
-            deps_path.relative_to(repo_root)
-            return True
-        except ValueError:
-            # deps_path is not inside repo_root
-            return False
-
-    except Exception:
-        # If we can't determine, assume no submodules
-        return False
+            self._process = subprocess.Popen(
+                ["git", "rev-parse", "--show-toplevel"],
+                cwd=self._cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            # git not available - result() reports no submodule support
+            self._process = None
+
+    def result(self) -> bool:
+        """Wait for the probe and return whether submodules can be used.
+
+        Returns:
+            True if submodules can be used, False if regular clones should be used
+        """
+        key = (self._deps_directory, self._cwd)
+        cached = _submodule_support_cache.get(key)
+        if cached is not None:
+            return cached
+
+        can_use = False
+        if self._process is not None:
+            try:
+                stdout, _ = self._process.communicate(timeout=5)
+                if self._process.returncode == 0:
+                    repo_root = os.path.realpath(stdout.strip())
+                    deps_path = os.path.realpath(
+                        os.path.join(self._cwd, self._deps_directory)
+                    )
+
+                    # Check if deps_directory is inside or equal to the repo root
+                    can_use = deps_path == repo_root or deps_path.startswith(
+                        repo_root.rstrip(os.sep) + os.sep
+                    )
+                    _persist_submodule_support(
+                        self._cwd, self._deps_directory, repo_root, deps_path, can_use
+                    )
+            except subprocess.TimeoutExpired:
+                # If we can't determine, assume no submodules
+                self._process.kill()
+                self._process.communicate()
+
+        _submodule_support_cache[key] = can_use
+        return can_use
 
 
 def _create_symlink_if_needed(
@@ -100,6 +286,9 @@ def _create_symlink_if_needed(
     at .graft/<name> pointing to the actual checkout location. This
     ensures stable paths for linking regardless of where deps are stored.
 
+    Batch callers should call _ensure_graft_dir once and _make_symlink
+    per dependency instead.
+
     Args:
         deps_directory: The configured deps directory
         name: Dependency name
@@ -108,41 +297,192 @@ def _create_symlink_if_needed(
     Returns:
         Path to created symlink, or None if not needed
     """
-    # Only create symlink if using a non-default directory
+    graft_dir = _ensure_graft_dir(deps_directory)
+    if graft_dir is None:
+        return None
+    return _make_symlink(graft_dir, name, local_path)
+
+
+def _ensure_graft_dir(deps_directory: str) -> Path | None:
+    """Create the .graft/ symlink directory if deps_directory needs one.
+
+    Args:
+        deps_directory: The configured deps directory
+
+    Returns:
+        The .graft directory, or None if deps_directory is the default
+        and no symlinks are needed
+    """
+    # Only create symlinks if using a non-default directory
     if deps_directory == DEFAULT_DEPS_DIRECTORY:
         return None
 
-    # Ensure .graft directory exists
     graft_dir = Path(DEFAULT_DEPS_DIRECTORY)
     graft_dir.mkdir(parents=True, exist_ok=True)
+    return graft_dir
+
+
+def _link_prefix(graft_dir: Path, abs_deps_directory: str) -> str:
+    """Compute the relative path from .graft/ to deps_directory.
+
+    Every dependency lives directly under deps_directory, so batch callers
+    compute this once and join each name onto it.
+
+    Args:
+        graft_dir: The .graft directory
+        abs_deps_directory: Resolved absolute deps_directory
+
+    Returns:
+        Relative path usable as a symlink target prefix
+    """
+    return os.path.relpath(abs_deps_directory, graft_dir)
+
+
+def _make_symlink(
+    graft_dir: Path,
+    name: str,
+    local_path: str,
+    link_prefix: str | None = None,
+) -> str | None:
+    """Point .graft/<name> at a dependency's checkout.
+
+    Args:
+        graft_dir: Existing .graft directory (from _ensure_graft_dir)
+        name: Dependency name
+        local_path: Absolute path to the actual checkout
+        link_prefix: Relative path from graft_dir to the directory holding
+            local_path (from _link_prefix). When given, the link target is
+            built by joining strings instead of calling os.path.relpath.
 
+    Returns:
+        Path to created symlink, or None if not created
+    """
     symlink_path = graft_dir / name
 
-    # Remove existing symlink if it exists
-    if symlink_path.is_symlink():
-        symlink_path.unlink()
-    elif symlink_path.exists():
-        # Path exists but isn't a symlink - don't overwrite
-        return None
+    # One lstat tells whether an existing entry is ours to replace
+    try:
+        is_link = stat.S_ISLNK(os.lstat(symlink_path).st_mode)
+    except FileNotFoundError:
+        is_link = False
+    else:
+        if not is_link:
+            # Path exists but isn't a symlink - don't overwrite
+            return None
 
     # Only create symlink if target actually exists (avoids test artifacts)
     target = Path(local_path)
     if not target.exists():
+        if is_link:
+            # Drop the stale link
+            with contextlib.suppress(FileNotFoundError):
+                symlink_path.unlink()
         return None
 
     # Create relative symlink from .graft/<name> to actual location
     # Use relative path for portability
-    symlink_path.symlink_to(os.path.relpath(target, graft_dir))
+    if link_prefix is not None:
+        link_target = os.path.join(link_prefix, name)
+    else:
+        link_target = os.path.relpath(target, graft_dir)
+
+    # Create under a temporary name and rename over any old link, so the
+    # link is never missing and concurrent resolves never collide
+    tmp_path = graft_dir / f".{name}.tmp.{os.getpid()}.{threading.get_ident()}"
+    os.symlink(link_target, tmp_path, target_is_directory=True)
+    try:
+        os.replace(tmp_path, symlink_path)
+    except OSError:
+        # Something other than a symlink appeared at symlink_path
+        tmp_path.unlink()
+        return None
 
     return str(symlink_path.absolute())
 
 
+def _is_tag_at_commit(ctx: DependencyContext, local_path: str, ref: str, commit: str) -> bool:
+    """Check if ref is a local tag that points at commit.
+
+    Branches move, so only a tag may skip fetching when the checked-out
+    commit already matches the lock file. The tag is looked up under
+    refs/tags/ rather than guessed from its name: release branches are
+    often named like versions ("3.11", "v1.2").
+
+    Args:
+        ctx: Dependency context
+        local_path: Path to the dependency's repository
+        ref: Git ref from graft.yaml
+        commit: Full commit hash the tag is expected to point at
+
+    Returns:
+        True if refs/tags/<ref> exists locally and resolves to commit
+    """
+    try:
+        return ctx.git.resolve_ref(local_path, f"refs/tags/{ref}^{{commit}}") == commit
+    except ValueError:
+        return False
+
+
+def _is_checked_out_commit(current_commit: str, ref: str) -> bool:
+    """Check if ref is a commit SHA that HEAD already points at.
+
+    Args:
+        current_commit: Full commit hash of HEAD
+        ref: Git ref from graft.yaml
+
+    Returns:
+        True if ref is a (possibly abbreviated) SHA of current_commit
+    """
+    return _COMMIT_REF_PATTERN.match(ref) is not None and current_commit.startswith(ref)
+
+
+def _list_existing_deps(ctx: DependencyContext) -> frozenset[str]:
+    """List entries of deps_directory with a single directory read.
+
+    Args:
+        ctx: Dependency context
+
+    Returns:
+        Names present in deps_directory. Empty if it does not exist yet.
+    """
+    try:
+        return frozenset(ctx.filesystem.list_directory(ctx.deps_directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+def _resolve_fetched_ref(ctx: DependencyContext, local_path: str, ref: str) -> str:
+    """Resolve a just-fetched ref to a commit hash.
+
+    Prefers origin/<ref> for branches to get the latest from remote, and
+    falls back to <ref> for tags/commits.
+
+    Args:
+        ctx: Dependency context
+        local_path: Path to the checked-out dependency
+        ref: Git ref from graft.yaml
+
+    Returns:
+        The resolved commit hash
+
+    Raises:
+        ValueError: If ref cannot be resolved
+    """
+    try:
+        return ctx.git.resolve_ref(local_path, f"origin/{ref}")
+    except ValueError:
+        # Not a remote branch, try as-is (tag or commit)
+        return ctx.git.resolve_ref(local_path, ref)
+
+
 def _ensure_submodule_at_ref(
     ctx: DependencyContext,
     name: str,
     url: str,
     local_path: str,
     ref: str,
+    submodule_index: dict[str, dict[str, str]] | None = None,
+    expected_commit: str | None = None,
+    existing: frozenset[str] | None = None,
 ) -> str:
     """Ensure a submodule exists at the specified ref and return its commit.
 
@@ -155,6 +495,15 @@ def _ensure_submodule_at_ref(
         url: Git URL for the dependency
         local_path: Path where dependency should be placed
         ref: Git ref to checkout
+        submodule_index: Optional result of load_submodule_index. Paths
+            found in it skip the per-path is_submodule check, and clean
+            entries supply the current commit. Paths missing from it fall
+            back to querying git directly.
+        expected_commit: Commit recorded in graft.lock for this same
+            source and ref. When the submodule is already there and ref is
+            a local tag at that commit, the remote fetch is skipped.
+        existing: Optional result of _list_existing_deps. When given,
+            name is looked up in it instead of stat'ing local_path.
 
     Returns:
         The resolved commit hash
@@ -162,26 +511,43 @@ def _ensure_submodule_at_ref(
     Raises:
         DependencyResolutionError: If resolution fails
     """
-    if ctx.git.is_submodule(local_path):
+    indexed = lookup_submodule(submodule_index, local_path)
+
+    if indexed is not None or ctx.git.is_submodule(local_path):
         # Update existing submodule
         ctx.git.update_submodule(local_path, init=True)
 
-        # Fetch all refs from remote to get any new commits
-        ctx.git.fetch_all(local_path)
-
-        # Try to resolve the ref - prefer origin/<ref> for branches to get
-        # the latest from remote, fall back to <ref> for tags/commits
+        # A clean entry means HEAD already matches the recorded commit,
+        # which `submodule update` leaves checked out
+        if indexed is not None and indexed["status"] == " ":
+            current_commit = indexed["commit"]
+        else:
+            current_commit = ctx.git.get_current_commit(local_path)
+
+        # Already at the requested commit, or at the locked commit of a
+        # tag - nothing to fetch
+        if _is_checked_out_commit(current_commit, ref) or (
+            expected_commit is not None
+            and current_commit == expected_commit
+            and _is_tag_at_commit(ctx, local_path, ref, current_commit)
+        ):
+            return current_commit
+
+        # Fetch only the requested ref; fall back to fetching every ref
+        # if the server rejects it or it still can't be resolved
         try:
-            resolved_commit = ctx.git.resolve_ref(local_path, f"origin/{ref}")
-        except ValueError:
-            # Not a remote branch, try as-is (tag or commit)
-            resolved_commit = ctx.git.resolve_ref(local_path, ref)
+            ctx.git.fetch_ref(local_path, ref)
+            resolved_commit = _resolve_fetched_ref(ctx, local_path, ref)
+        except (DependencyResolutionError, ValueError):
+            ctx.git.fetch_all(local_path)
+            resolved_commit = _resolve_fetched_ref(ctx, local_path, ref)
 
-        current_commit = ctx.git.get_current_commit(local_path)
         if current_commit != resolved_commit:
             ctx.git.checkout(local_path, resolved_commit)
 
-    elif ctx.filesystem.exists(local_path):
+        return resolved_commit
+
+    elif _path_exists(ctx, local_path, name, existing):
         # Exists but not a submodule - error with clear message
         if ctx.git.is_repository(local_path):
             raise DependencyResolutionError(
@@ -202,14 +568,36 @@ def _ensure_submodule_at_ref(
         resolved_commit = ctx.git.resolve_ref(local_path, ref)
         ctx.git.checkout(local_path, resolved_commit)
 
-    # Return the current commit
-    return ctx.git.get_current_commit(local_path)
+        return resolved_commit
+
+
+def _path_exists(
+    ctx: DependencyContext,
+    local_path: str,
+    name: str,
+    existing: frozenset[str] | None,
+) -> bool:
+    """Check whether a dependency's checkout path exists.
+
+    Args:
+        ctx: Dependency context
+        local_path: Path where dependency should be placed
+        name: Dependency name (entry within deps_directory)
+        existing: Optional pre-scanned deps_directory entries
+
+    Returns:
+        True if the path exists
+    """
+    if existing is not None:
+        return name in existing
+    return ctx.filesystem.exists(local_path)
 
 
 def _resolve_with_submodule(
     ctx: DependencyContext,
     spec: DependencySpec,
     local_path: str,
+    existing: frozenset[str] | None = None,
 ) -> None:
     """Resolve dependency using git submodules.
 
@@ -217,6 +605,7 @@ def _resolve_with_submodule(
         ctx: Dependency context
         spec: Dependency specification
         local_path: Path where dependency should be placed
+        existing: Optional pre-scanned deps_directory entries
 
     Raises:
         DependencyResolutionError: If path exists but is not a submodule
@@ -227,6 +616,7 @@ def _resolve_with_submodule(
         url=spec.git_url.url,
         local_path=local_path,
         ref=spec.git_ref.ref,
+        existing=existing,
     )
 
 
@@ -234,6 +624,7 @@ def _resolve_with_clone(
     ctx: DependencyContext,
     spec: DependencySpec,
     local_path: str,
+    existing: frozenset[str] | None = None,
 ) -> None:
     """Resolve dependency using regular git clone.
 
@@ -244,11 +635,19 @@ def _resolve_with_clone(
         ctx: Dependency context
         spec: Dependency specification
         local_path: Path where dependency should be placed
+        existing: Optional pre-scanned deps_directory entries
     """
-    if ctx.filesystem.exists(local_path):
+    if _path_exists(ctx, local_path, spec.name, existing):
         if ctx.git.is_repository(local_path):
-            # Update existing clone
-            ctx.git.fetch(local_path, spec.git_ref.ref)
+            # Update existing clone, unless it is already at the pinned commit
+            ref = spec.git_ref.ref
+            if _COMMIT_REF_PATTERN.match(ref) is not None:
+                try:
+                    if _is_checked_out_commit(ctx.git.get_current_commit(local_path), ref):
+                        return
+                except ValueError:
+                    pass
+            ctx.git.fetch(local_path, ref)
         else:
             # Path exists but isn't a git repo - error
             raise DependencyResolutionError(
@@ -267,6 +666,12 @@ def _resolve_with_clone(
 def resolve_dependency(
     ctx: DependencyContext,
     spec: DependencySpec,
+    *,
+    abs_deps_directory: str | None = None,
+    use_submodules: bool | None = None,
+    existing: frozenset[str] | None = None,
+    graft_dir: Path | None = None,
+    link_prefix: str | None = None,
 ) -> DependencyResolution:
     """Resolve a single dependency.
 
@@ -276,6 +681,17 @@ def resolve_dependency(
     Args:
         ctx: Dependency context
         spec: Dependency specification
+        abs_deps_directory: Pre-resolved absolute deps_directory. Batch
+            callers pass this so the path is resolved once, not per dependency.
+        use_submodules: Pre-computed result of the submodule-support check.
+            Detected via _can_use_submodules when not given.
+        existing: Pre-scanned entries of deps_directory. Batch callers
+            pass this to replace a stat per dependency with one listing.
+        graft_dir: .graft directory from _ensure_graft_dir. Batch callers
+            pass this so it is created once; when not given, it is set up
+            here if deps_directory needs symlinks.
+        link_prefix: Result of _link_prefix for graft_dir. Batch callers
+            pass this so each symlink target is a string join.
 
     Returns:
         DependencyResolution with status and local path
@@ -303,7 +719,8 @@ def resolve_dependency(
     local_path = f"{ctx.deps_directory}/{spec.name}"
 
     # Check if we can use submodules (deps_directory must be inside the repo)
-    use_submodules = _can_use_submodules(ctx.deps_directory)
+    if use_submodules is None:
+        use_submodules = _can_use_submodules(ctx.deps_directory, ctx.filesystem.get_cwd())
 
     try:
         # Mark as cloning
@@ -311,19 +728,27 @@ def resolve_dependency(
 
         if use_submodules:
             # Submodule-based resolution
-            _resolve_with_submodule(ctx, spec, local_path)
+            _resolve_with_submodule(ctx, spec, local_path, existing)
         else:
             # Clone-based resolution (for deps outside the repository)
-            _resolve_with_clone(ctx, spec, local_path)
+            _resolve_with_clone(ctx, spec, local_path, existing)
 
         # Mark as resolved (convert to absolute path for resolution)
-        absolute_path = str(Path(local_path).resolve())
+        if abs_deps_directory is None:
+            abs_deps_directory = os.path.realpath(ctx.deps_directory)
+        absolute_path = os.path.join(abs_deps_directory, spec.name)
         resolution.mark_resolved(absolute_path)
 
         # Create symlink if using custom deps_directory
-        symlink_path = _create_symlink_if_needed(
-            ctx.deps_directory, spec.name, absolute_path
-        )
+        symlink_path = None
+        if graft_dir is not None:
+            symlink_path = _make_symlink(
+                graft_dir, spec.name, absolute_path, link_prefix
+            )
+        elif ctx.deps_directory != DEFAULT_DEPS_DIRECTORY:
+            symlink_path = _create_symlink_if_needed(
+                ctx.deps_directory, spec.name, absolute_path
+            )
         if symlink_path:
             resolution.symlink_path = symlink_path
 
@@ -345,8 +770,12 @@ def resolve_all_dependencies(
     Uses flat-only resolution model (Decision 0007): only direct dependencies
     declared in graft.yaml are resolved. There is no transitive resolution.
 
-    Resolves each dependency in sequence.
-    Continues on failure to attempt all dependencies.
+    Clone-based dependencies are resolved concurrently on a thread pool,
+    since each one touches only its own directory. Submodule-based
+    resolution runs in sequence because `git submodule add` writes the
+    parent repository's index and .gitmodules.
+    Continues on failure to attempt all dependencies. Results keep the
+    order of config.dependencies.
 
     Args:
         ctx: Dependency context
@@ -362,18 +791,42 @@ def resolve_all_dependencies(
         >>> all(r.status == DependencyStatus.RESOLVED for r in resolutions)
         True
     """
-    resolutions: list[DependencyResolution] = []
+    # Start the submodule-support check first so git runs during setup
+    probe = _SubmoduleSupportProbe(ctx.deps_directory, ctx.filesystem.get_cwd())
+
+    specs = list(config.dependencies.values())
+    abs_deps_directory = os.path.realpath(ctx.deps_directory)
+    existing = _list_existing_deps(ctx)
+    graft_dir = _ensure_graft_dir(ctx.deps_directory) if specs else None
+    link_prefix = (
+        _link_prefix(graft_dir, abs_deps_directory) if graft_dir is not None else None
+    )
+
+    use_submodules = probe.result()
+
+    def resolve(spec: DependencySpec) -> DependencyResolution:
+        return resolve_dependency(
+            ctx,
+            spec,
+            abs_deps_directory=abs_deps_directory,
+            use_submodules=use_submodules,
+            existing=existing,
+            graft_dir=graft_dir,
+            link_prefix=link_prefix,
+        )
 
-    for spec in config.dependencies.values():
-        resolution = resolve_dependency(ctx, spec)
-        resolutions.append(resolution)
+    if len(specs) <= 1 or use_submodules:
+        return [resolve(spec) for spec in specs]
 
-    return resolutions
+    max_workers = min(MAX_PARALLEL_RESOLUTIONS, len(specs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(resolve, specs))
 
 
 def resolve_to_lock_entries(
     ctx: DependencyContext,
     config: GraftConfig,
+    locked_entries: dict[str, LockEntry] | None = None,
 ) -> dict[str, LockEntry]:
     """Resolve all dependencies and return as lock entries.
 
@@ -384,6 +837,9 @@ def resolve_to_lock_entries(
     Args:
         ctx: Dependency context
         config: Parsed configuration with dependencies
+        locked_entries: Optional entries from the existing graft.lock.
+            Dependencies whose source and tag are unchanged and already
+            checked out at the locked commit skip the remote fetch.
 
     Returns:
         Dictionary mapping dependency name to LockEntry
@@ -400,10 +856,28 @@ def resolve_to_lock_entries(
     """
     lock_entries: dict[str, LockEntry] = {}
     consumed_at = datetime.now(UTC)
+    abs_deps_directory = os.path.realpath(ctx.deps_directory)
+    submodule_index = load_submodule_index(ctx.git)
+    existing = _list_existing_deps(ctx)
+    graft_dir = (
+        _ensure_graft_dir(ctx.deps_directory) if config.dependencies else None
+    )
+    link_prefix = (
+        _link_prefix(graft_dir, abs_deps_directory) if graft_dir is not None else None
+    )
 
     for name, spec in config.dependencies.items():
         local_path = f"{ctx.deps_directory}/{name}"
 
+        locked = locked_entries.get(name) if locked_entries else None
+        expected_commit = (
+            locked.commit
+            if locked is not None
+            and locked.source == spec.git_url.url
+            and locked.ref == spec.git_ref.ref
+            else None
+        )
+
         try:
             # Use shared helper to ensure submodule is at correct ref
             resolved_commit = _ensure_submodule_at_ref(
@@ -412,11 +886,15 @@ def resolve_to_lock_entries(
                 url=spec.git_url.url,
                 local_path=local_path,
                 ref=spec.git_ref.ref,
+                submodule_index=submodule_index,
+                expected_commit=expected_commit,
+                existing=existing,
             )
 
             # Create symlink if using custom deps_directory
-            absolute_path = str(Path(local_path).resolve())
-            _create_symlink_if_needed(ctx.deps_directory, name, absolute_path)
+            absolute_path = os.path.join(abs_deps_directory, name)
+            if graft_dir is not None:
+                _make_symlink(graft_dir, name, absolute_path, link_prefix)
 
             # Create lock entry
             lock_entry = LockEntry(
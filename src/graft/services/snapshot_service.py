@@ -4,8 +4,17 @@ Service layer for snapshot and rollback operations.
 Follows functional service pattern with dependency injection.
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+
+from graft.domain.snapshot import SnapshotInfo, is_snapshot_id
 from graft.protocols.snapshot import Snapshot
 
+# Upper bound on concurrent snapshot deletions
+MAX_PARALLEL_DELETIONS = 8
+
 
 def create_workspace_snapshot(
     snapshot: Snapshot,
@@ -65,31 +74,86 @@ def cleanup_snapshot(
 def cleanup_old_snapshots(
     snapshot: Snapshot,
     keep_count: int = 5,
+    max_age_days: int | None = None,
+    max_total_bytes: int | None = None,
 ) -> list[str]:
     """Delete old snapshots, keeping only the most recent.
 
+    Without age or size limits only snapshot IDs are listed. With them,
+    metadata for every snapshot is fetched in one call and the policy is
+    applied in memory. Either way, directories without a timestamp ID
+    (e.g. snapshot-foo) are neither counted nor deleted.
+
+    Deletions are independent directory removals, so several run
+    concurrently on a thread pool.
+
     Args:
         snapshot: Snapshot protocol implementation
-        keep_count: Number of recent snapshots to keep
+        keep_count: Maximum number of recent snapshots to keep
+        max_age_days: Also delete snapshots older than this many days
+        max_total_bytes: Also delete the oldest kept snapshots until the
+            rest fit within this total size
 
     Returns:
-        List of deleted snapshot IDs
+        List of deleted snapshot IDs, newest first
     """
-    all_snapshots = snapshot.list_snapshots()
-
-    # Snapshots are already sorted newest first
-    to_delete = all_snapshots[keep_count:]
-
-    deleted = []
-    for snapshot_id in to_delete:
+    to_delete: Iterable[str]
+    if max_age_days is None and max_total_bytes is None:
+        # Snapshots are already sorted newest first. Directories without a
+        # timestamp ID are skipped, as list_snapshot_info skips them.
+        snapshot_ids = (sid for sid in snapshot.list_snapshots() if is_snapshot_id(sid))
+        to_delete = islice(snapshot_ids, keep_count, None)
+    else:
+        to_delete = _select_snapshots_to_delete(
+            snapshot.list_snapshot_info(), keep_count, max_age_days, max_total_bytes
+        )
+
+    def delete(snapshot_id: str) -> str | None:
         try:
             snapshot.delete_snapshot(snapshot_id)
-            deleted.append(snapshot_id)
         except ValueError:
             # Snapshot might have been deleted by another process
-            pass
+            return None
+        return snapshot_id
+
+    # Worker threads are only started as deletions are submitted
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DELETIONS) as executor:
+        return [sid for sid in executor.map(delete, to_delete) if sid is not None]
 
-    return deleted
+
+def _select_snapshots_to_delete(
+    snapshots: list[SnapshotInfo],
+    keep_count: int,
+    max_age_days: int | None,
+    max_total_bytes: int | None,
+) -> list[str]:
+    """Apply the retention policy to snapshot metadata.
+
+    Args:
+        snapshots: Snapshot metadata, newest first
+        keep_count: Maximum number of recent snapshots to keep
+        max_age_days: Maximum snapshot age, if limited
+        max_total_bytes: Maximum total size of kept snapshots, if limited
+
+    Returns:
+        IDs of snapshots to delete, newest first
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=max_age_days) if max_age_days is not None else None
+
+    kept_bytes = 0
+    over_budget = False
+    to_delete = []
+    for index, info in enumerate(snapshots):
+        keep = index < keep_count and (cutoff is None or info.created_at >= cutoff)
+        if keep and max_total_bytes is not None:
+            # Once a snapshot doesn't fit, it and everything older goes
+            over_budget = over_budget or kept_bytes + info.size_bytes > max_total_bytes
+            keep = not over_budget
+        if keep:
+            kept_bytes += info.size_bytes
+        else:
+            to_delete.append(info.snapshot_id)
+    return to_delete
 
 
 def get_snapshot_paths_for_dependency(
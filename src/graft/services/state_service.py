@@ -18,18 +18,44 @@ For integration with domain analytics libraries (Layer 2/3), see:
     /docs/architecture/state-queries-layered-architecture.md
 """
 
+import functools
 import hashlib
 import json
+import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from graft.domain.state import StateQuery, StateResult
+from graft.protocols.git import GitOperations
 from graft.services.dependency_context import DependencyContext
 
 
+@functools.cache
+def _cache_base() -> Path:
+    """Root directory for all graft caches (home lookup done once)."""
+    return Path.home() / ".cache" / "graft"
+
+
+@functools.lru_cache(maxsize=128)
+def _workspace_hash(workspace_name: str) -> str:
+    """Short hash of a workspace name, used to avoid cache path conflicts."""
+    return hashlib.sha256(workspace_name.encode()).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=256)
+def _cache_root(workspace_name: str, repo_name: str) -> Path:
+    """State cache directory for a repository within a workspace."""
+    return _cache_base() / _workspace_hash(workspace_name) / repo_name / "state"
+
+
 def get_cache_path(
     ctx: DependencyContext,
     workspace_name: str,
@@ -56,15 +82,86 @@ def get_cache_path(
         >>> str(path)
         '~/.cache/graft/{workspace-hash}/my-repo/state/coverage/abc123.json'
     """
-    # Compute workspace hash to avoid path conflicts
-    workspace_hash = hashlib.sha256(workspace_name.encode()).hexdigest()[:16]
+    return _cache_root(workspace_name, repo_name) / query_name / f"{commit_hash}.json"
+
+
+# Parsed cache files kept in memory for repeat reads, least recently used first
+_MAX_MEMOIZED_RESULTS = 1024
+_memoized_results: OrderedDict[Path, StateResult] = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _recall(cache_path: Path) -> StateResult | None:
+    """Get a memoized cache entry, marking it most recently used."""
+    with _memo_lock:
+        result = _memoized_results.get(cache_path)
+        if result is not None:
+            _memoized_results.move_to_end(cache_path)
+        return result
+
 
-    # Build cache path
-    cache_root = Path.home() / ".cache" / "graft" / workspace_hash / repo_name / "state"
-    query_dir = cache_root / query_name
-    cache_file = query_dir / f"{commit_hash}.json"
+def _remember(cache_path: Path, result: StateResult) -> None:
+    """Memoize a cache entry, evicting the least recently used if full."""
+    with _memo_lock:
+        _memoized_results[cache_path] = result
+        _memoized_results.move_to_end(cache_path)
+        if len(_memoized_results) > _MAX_MEMOIZED_RESULTS:
+            _memoized_results.popitem(last=False)
 
-    return cache_file
+
+def _read_cache_path(cache_path: Path, query_name: str, commit_hash: str) -> StateResult | None:
+    """Read a state cache file, preferring the in-memory copy.
+
+    Corrupted cache files are reported and deleted.
+    """
+    memoized = _recall(cache_path)
+    if memoized is not None:
+        return memoized
+
+    try:
+        result = StateResult.from_cache_file(json.loads(cache_path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        # Cache file is corrupted - log warning and delete it
+        print(
+            f"Warning: Corrupted cache for {query_name} at commit {commit_hash[:7]}: {e}",
+            file=sys.stderr,
+        )
+
+        # Delete corrupted cache file
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+
+        return None
+
+    _remember(cache_path, result)
+    return result
+
+
+def _write_cache_path(cache_path: Path, result: StateResult) -> None:
+    """Write a state cache file and memoize it as a cache hit."""
+    # Ensure directory exists
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write cache file compactly: without indent, json uses its C encoder.
+    # Write to a sibling temp file and rename, so an interrupted write never
+    # leaves a truncated cache file behind.
+    tmp_path = cache_path.with_name(
+        f".{cache_path.name}.tmp.{os.getpid()}.{threading.get_ident()}"
+    )
+    encoded = json.dumps(result.to_cache_file(), separators=(",", ":"))
+    try:
+        tmp_path.write_text(encoded)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Memoize a copy parsed from what was written, so later changes to the
+    # caller's data can't leak into cache hits
+    _remember(cache_path, StateResult.from_cache_file(json.loads(encoded)))
 
 
 def read_cached_state(
@@ -76,6 +173,9 @@ def read_cached_state(
 ) -> StateResult | None:
     """Read cached state result if it exists.
 
+    Results read or written earlier in the same process are served from
+    memory without touching the disk.
+
     Args:
         ctx: Dependency context
         workspace_name: Workspace name
@@ -93,30 +193,7 @@ def read_cached_state(
         True
     """
     cache_path = get_cache_path(ctx, workspace_name, repo_name, query_name, commit_hash)
-
-    if not cache_path.exists():
-        return None
-
-    try:
-        with open(cache_path) as f:
-            data = json.load(f)
-        return StateResult.from_cache_file(data)
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
-        # Cache file is corrupted - log warning and delete it
-        import sys
-
-        print(
-            f"Warning: Corrupted cache for {query_name} at commit {commit_hash[:7]}: {e}",
-            file=sys.stderr,
-        )
-
-        # Delete corrupted cache file
-        try:
-            cache_path.unlink()
-        except OSError:
-            pass
-
-        return None
+    return _read_cache_path(cache_path, query_name, commit_hash)
 
 
 def write_cached_state(
@@ -149,13 +226,28 @@ def write_cached_state(
     cache_path = get_cache_path(
         ctx, workspace_name, repo_name, result.query_name, result.commit_hash
     )
+    _write_cache_path(cache_path, result)
 
-    # Ensure directory exists
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write cache file
-    with open(cache_path, "w") as f:
-        json.dump(result.to_cache_file(), f, indent=2)
+def _delete_query_cache(query_dir: str) -> int:
+    """Delete a query's cache directory in one pass, counting its cache files.
+
+    Raises:
+        FileNotFoundError: If query_dir doesn't exist
+    """
+    count = 0
+    with os.scandir(query_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                os.unlink(entry.path)
+                count += 1
+
+    try:
+        os.rmdir(query_dir)
+    except OSError:
+        # Something besides cache files was left behind
+        shutil.rmtree(query_dir, ignore_errors=True)
+    return count
 
 
 def invalidate_cached_state(
@@ -181,30 +273,127 @@ def invalidate_cached_state(
         >>> count >= 0
         True
     """
-    workspace_hash = hashlib.sha256(workspace_name.encode()).hexdigest()[:16]
-    cache_root = Path.home() / ".cache" / "graft" / workspace_hash / repo_name / "state"
-
-    if query_name is None:
-        # Delete entire state cache directory
-        if cache_root.exists():
-            import shutil
+    cache_root = _cache_root(workspace_name, repo_name)
+    with _memo_lock:
+        _memoized_results.clear()
 
+    try:
+        if query_name is None:
+            # Delete entire state cache directory
+            with os.scandir(cache_root) as entries:
+                query_dirs = [entry.path for entry in entries if entry.is_dir()]
+            count = sum(_delete_query_cache(query_dir) for query_dir in query_dirs)
             shutil.rmtree(cache_root)
-            # Count files (approximate)
-            return 1  # We don't track exact count
-        return 0
-    else:
-        # Delete specific query cache
-        query_dir = cache_root / query_name
-        if query_dir.exists():
-            count = sum(1 for _ in query_dir.glob("*.json"))
-            import shutil
-
-            shutil.rmtree(query_dir)
             return count
+        else:
+            # Delete specific query cache
+            return _delete_query_cache(os.path.join(cache_root, query_name))
+    except FileNotFoundError:
         return 0
 
 
+def _project(data: dict[str, Any], paths: tuple[str, ...]) -> dict[str, Any]:
+    """Keep only the given dotted field paths of a query's output.
+
+    Paths that are missing from the output are skipped.
+
+    Args:
+        data: Parsed query output
+        paths: Dotted field paths (e.g., 'totals.percent_covered')
+
+    Returns:
+        Nested dict containing only the requested fields
+
+    Example:
+        >>> _project({"totals": {"covered": 10, "missing": 2}, "files": {}}, ("totals.covered",))
+        {'totals': {'covered': 10}}
+    """
+    projected: dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        value: Any = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+    return projected
+
+
+# Characters that give a command line shell semantics (quoting, expansion,
+# redirection, chaining, globbing, comments)
+_SHELL_SYNTAX = frozenset("|&;<>()$`\\\"'\n*?[]{}~#!")
+
+# Shell builtins and keywords, which have no executable to run directly
+_SHELL_ONLY_WORDS = frozenset(
+    {
+        ".", ":", "alias", "case", "cd", "eval", "exec", "exit", "export", "for",
+        "function", "if", "read", "return", "set", "shift", "source", "trap",
+        "ulimit", "umask", "unset", "until", "wait", "while",
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_plain_command(command: str) -> tuple[str, ...] | None:
+    """Split a command that uses no shell syntax into its arguments.
+
+    Args:
+        command: Command line from a state query's `run` field
+
+    Returns:
+        Argument vector, or None if the command needs the shell
+
+    Example:
+        >>> _split_plain_command("pytest --cov")
+        ('pytest', '--cov')
+        >>> _split_plain_command("pytest --cov | tail -1") is None
+        True
+    """
+    if any(c in _SHELL_SYNTAX for c in command):
+        return None
+    argv = tuple(command.split())
+    if not argv:
+        return None
+
+    program = argv[0]
+    if program in _SHELL_ONLY_WORDS or "=" in program or "/" in program:
+        return None
+    return argv
+
+
+def _direct_argv(command: str, repo_path: str) -> tuple[str, ...] | None:
+    """Split a command that can run without a shell in repo_path.
+
+    The program lookup is not cached: it depends on the current PATH, and
+    relative PATH entries are resolved against repo_path as the child
+    process would resolve them.
+
+    Args:
+        command: Command line from a state query's `run` field
+        repo_path: Directory the command will run in
+
+    Returns:
+        Argument vector, or None if the command needs the shell
+    """
+    argv = _split_plain_command(command)
+    if argv is None:
+        return None
+
+    search_path = os.pathsep.join(
+        os.path.join(repo_path, entry)
+        for entry in os.environ.get("PATH", os.defpath).split(os.pathsep)
+    )
+    if shutil.which(argv[0], path=search_path) is None:
+        # Let the shell report unknown commands (exit code 127)
+        return None
+    return argv
+
+
 def execute_state_query(
     ctx: DependencyContext,
     query: StateQuery,
@@ -226,6 +415,10 @@ def execute_state_query(
     Users are responsible for the commands they define in their graft.yaml.
     This is equivalent to running arbitrary shell commands from their terminal.
 
+    Commands that use no shell syntax (plain words running a program on PATH)
+    are executed directly, without the intermediate shell process; the result
+    is the same as running them through the shell.
+
     Args:
         ctx: Dependency context
         query: State query to execute
@@ -257,13 +450,15 @@ def execute_state_query(
     # This is the same model as make, npm run, or shell aliases.
     timeout_seconds = query.timeout if query.timeout is not None else 300  # Default 5 minutes
 
+    # Simple commands skip the intermediate /bin/sh process
+    argv = _direct_argv(query.run, repo_path)
+
     try:
         proc = subprocess.run(
-            query.run,
-            shell=True,
+            argv if argv is not None else query.run,
+            shell=argv is None,
             cwd=repo_path,
             capture_output=True,
-            text=True,
             timeout=timeout_seconds,
             check=False,  # We'll handle errors manually
         )
@@ -272,27 +467,42 @@ def execute_state_query(
         raise subprocess.CalledProcessError(
             -1, query.run, output="", stderr=error_msg
         ) from e
+    except OSError as e:
+        if argv is None:
+            raise
+        # Report a failed exec the way the shell would (126, or 127 if the
+        # program vanished since the lookup)
+        returncode = 127 if isinstance(e, FileNotFoundError) else 126
+        error_msg = f"State query '{query.name}' failed to start: {e}"
+        raise subprocess.CalledProcessError(
+            returncode, query.run, output="", stderr=error_msg
+        ) from e
 
+    # Output stays as bytes; it is only decoded when shown to the user
     # Check exit code
     if proc.returncode != 0:
+        stdout = proc.stdout.decode("utf-8", errors="replace")
+        stderr = proc.stderr.decode("utf-8", errors="replace")
         error_msg = f"State query '{query.name}' failed with exit code {proc.returncode}"
-        if proc.stderr:
-            error_msg += f"\nstderr: {proc.stderr}"
-        if proc.stdout:
-            error_msg += f"\nstdout: {proc.stdout}"
+        if stderr:
+            error_msg += f"\nstderr: {stderr}"
+        if stdout:
+            error_msg += f"\nstdout: {stdout}"
         raise subprocess.CalledProcessError(
-            proc.returncode, query.run, output=proc.stdout, stderr=proc.stderr
+            proc.returncode, query.run, output=stdout, stderr=stderr
         )
 
-    # Parse JSON output
+    # Parse JSON output directly from bytes
     try:
         data = json.loads(proc.stdout)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        stdout = proc.stdout.decode("utf-8", errors="replace")
+        pos = e.pos if isinstance(e, json.JSONDecodeError) else e.start
         error_msg = f"State query '{query.name}' output is not valid JSON: {e}"
-        if proc.stdout:
-            error_msg += f"\nOutput was: {proc.stdout[:500]}"
+        if stdout:
+            error_msg += f"\nOutput was: {proc.stdout[:500].decode('utf-8', errors='replace')}"
         raise json.JSONDecodeError(
-            error_msg, proc.stdout, e.pos
+            error_msg, stdout, pos
         ) from e
 
     # Validate it's a JSON object (dict)
@@ -301,6 +511,10 @@ def execute_state_query(
             f"State query '{query.name}' must output a JSON object, got {type(data).__name__}"
         )
 
+    # Drop unused fields so they are neither kept in memory nor cached
+    if query.projection is not None:
+        data = _project(data, query.projection)
+
     # Create result
     return StateResult(
         query_name=query.name,
@@ -313,23 +527,115 @@ def execute_state_query(
     )
 
 
+def _remove_worktree(git: GitOperations, repo_path: str, worktree_path: str) -> None:
+    """Remove a temporary worktree, warning instead of failing on errors."""
+    try:
+        git.remove_worktree(repo_path, worktree_path)
+    except ValueError as e:
+        # Worktree removal failed, but continue with directory cleanup
+        print(
+            f"Warning: Failed to remove worktree {worktree_path}: {e}",
+            file=sys.stderr,
+        )
+
+    # Remove worktree directory
+    try:
+        shutil.rmtree(worktree_path, ignore_errors=True)
+    except OSError as e:
+        # Directory cleanup failed, but don't fail the query
+        print(
+            f"Warning: Failed to remove worktree directory {worktree_path}: {e}",
+            file=sys.stderr,
+        )
+
+
+class WorktreePool:
+    """Temporary git worktrees reused across temporal queries.
+
+    Keeps one worktree per repository and resets it to the requested commit
+    on every reuse, so a run of temporal queries pays for `git worktree add`
+    once per repository instead of once per query. The reset also deletes
+    untracked and ignored files, so artifacts written by one query never
+    leak into the next. Worktrees are removed when the pool is closed. Not
+    safe for concurrent use at different commits.
+
+    Example:
+        >>> with WorktreePool(ctx.git) as pool:
+        ...     for commit in commits:
+        ...         get_state(ctx, query, "ws", "repo", ".", commit, use_worktree=True, pool=pool)
+    """
+
+    def __init__(self, git: GitOperations) -> None:
+        self._git = git
+        self._worktrees: dict[str, str] = {}  # repo -> worktree
+
+    def acquire(self, repo_path: str, commit_hash: str) -> str:
+        """Get a worktree of repo_path checked out at commit_hash.
+
+        Args:
+            repo_path: Path to main repository
+            commit_hash: Git commit hash to check out
+
+        Returns:
+            Path to the worktree
+
+        Raises:
+            ValueError: If the worktree can't be created
+        """
+        worktree_path = self._worktrees.get(repo_path)
+        if worktree_path is not None:
+            try:
+                # Even at the same commit: an earlier query may have left
+                # build outputs behind
+                self._git.reset_worktree(worktree_path, commit_hash)
+                return worktree_path
+            except Exception:
+                # Start over with a fresh worktree
+                del self._worktrees[repo_path]
+                _remove_worktree(self._git, repo_path, worktree_path)
+
+        worktree_path = tempfile.mkdtemp(prefix="graft-state-")
+        try:
+            self._git.add_worktree(repo_path, worktree_path, commit_hash)
+        except Exception:
+            shutil.rmtree(worktree_path, ignore_errors=True)
+            raise
+        self._worktrees[repo_path] = worktree_path
+        return worktree_path
+
+    def close(self) -> None:
+        """Remove all pooled worktrees."""
+        while self._worktrees:
+            repo_path, worktree_path = self._worktrees.popitem()
+            _remove_worktree(self._git, repo_path, worktree_path)
+
+    def __enter__(self) -> "WorktreePool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 def execute_temporal_query(
     ctx: DependencyContext,
     query: StateQuery,
     repo_path: str,
     commit_hash: str,
+    pool: WorktreePool | None = None,
 ) -> StateResult:
     """Execute a state query at a specific historical commit using git worktree.
 
     Creates a temporary worktree at the target commit, executes the query there,
     and cleans up the worktree afterward. This allows querying historical state
-    without affecting the main working directory.
+    without affecting the main working directory. With a pool, the worktree
+    comes from the pool and is left in place for later queries.
 
     Args:
         ctx: Dependency context
         query: State query to execute
         repo_path: Path to main repository
         commit_hash: Git commit hash to query
+        pool: Optional pool of reusable worktrees
 
     Returns:
         State result from the historical commit
@@ -351,6 +657,10 @@ def execute_temporal_query(
         >>> result.data
         {'result': 'ok'}
     """
+    if pool is not None:
+        worktree_path = pool.acquire(repo_path, commit_hash)
+        return execute_state_query(ctx, query, worktree_path, commit_hash)
+
     # Create temporary worktree directory
     worktree_path = tempfile.mkdtemp(prefix="graft-state-")
 
@@ -365,28 +675,57 @@ def execute_temporal_query(
 
     finally:
         # Cleanup worktree (remove from git and delete directory)
-        try:
-            ctx.git.remove_worktree(repo_path, worktree_path)
-        except ValueError as e:
-            # Worktree removal failed, but continue with directory cleanup
-            import sys
+        _remove_worktree(ctx.git, repo_path, worktree_path)
 
-            print(
-                f"Warning: Failed to remove worktree {worktree_path}: {e}",
-                file=sys.stderr,
-            )
 
-        # Remove worktree directory
-        try:
-            shutil.rmtree(worktree_path, ignore_errors=True)
-        except OSError as e:
-            # Directory cleanup failed, but don't fail the query
-            import sys
+def execute_state_queries_batch(
+    ctx: DependencyContext,
+    queries: list[StateQuery],
+    repo_path: str,
+    commit_hash: str,
+    use_worktree: bool = False,
+    max_workers: int = 1,
+) -> list[StateResult]:
+    """Execute several state queries at one commit.
+
+    With use_worktree, a single worktree is created for all queries instead
+    of one per query. Queries that don't interfere with each other (e.g. they
+    write no shared output files) can run concurrently via max_workers.
 
-            print(
-                f"Warning: Failed to remove worktree directory {worktree_path}: {e}",
-                file=sys.stderr,
-            )
+    Args:
+        ctx: Dependency context
+        queries: State queries to execute
+        repo_path: Path to main repository
+        commit_hash: Git commit hash to query
+        use_worktree: If True, run the queries in a worktree at commit_hash
+        max_workers: Number of queries to run at once
+
+    Returns:
+        State results, in the same order as queries
+
+    Raises:
+        subprocess.CalledProcessError: If a command fails
+        json.JSONDecodeError: If an output is not valid JSON
+        ValueError: If an output structure is invalid or worktree operations fail
+    """
+    if not queries:
+        return []
+
+    def run_all(path: str) -> list[StateResult]:
+        def run(query: StateQuery) -> StateResult:
+            return execute_state_query(ctx, query, path, commit_hash)
+
+        if max_workers <= 1 or len(queries) == 1:
+            return [run(query) for query in queries]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(run, queries))
+
+    if not use_worktree:
+        return run_all(repo_path)
+
+    with WorktreePool(ctx.git) as pool:
+        return run_all(pool.acquire(repo_path, commit_hash))
 
 
 def get_state(
@@ -398,6 +737,7 @@ def get_state(
     commit_hash: str,
     refresh: bool = False,
     use_worktree: bool = False,
+    pool: WorktreePool | None = None,
 ) -> StateResult:
     """Get state query result, using cache if available.
 
@@ -410,6 +750,7 @@ def get_state(
         commit_hash: Git commit hash
         refresh: If True, invalidate cache and re-run
         use_worktree: If True, use git worktree for temporal execution
+        pool: Optional pool of reusable worktrees for temporal execution
 
     Returns:
         State result (from cache or fresh execution)
@@ -431,20 +772,78 @@ def get_state(
         >>> result.data
         {'result': 'ok'}
     """
+    cache_path = get_cache_path(ctx, workspace_name, repo_name, query.name, commit_hash)
+
     # Check cache (unless refresh requested)
     if not refresh:
-        cached = read_cached_state(ctx, workspace_name, repo_name, query.name, commit_hash)
+        cached = _read_cache_path(cache_path, query.name, commit_hash)
         if cached is not None:
             return cached
 
     # Execute query (temporal or current)
     if use_worktree:
-        result = execute_temporal_query(ctx, query, repo_path, commit_hash)
+        result = execute_temporal_query(ctx, query, repo_path, commit_hash, pool=pool)
     else:
         result = execute_state_query(ctx, query, repo_path, commit_hash)
 
     # Cache result if deterministic
     if result.deterministic:
-        write_cached_state(ctx, workspace_name, repo_name, result)
+        _write_cache_path(cache_path, result)
 
     return result
+
+
+def get_states(
+    ctx: DependencyContext,
+    queries: list[StateQuery],
+    workspace_name: str,
+    repo_name: str,
+    repo_path: str,
+    commit_hash: str,
+    refresh: bool = False,
+    use_worktree: bool = False,
+    max_workers: int = 1,
+) -> list[StateResult]:
+    """Get results for several state queries at one commit, using cache if available.
+
+    Batched peer of get_state: queries missing from the cache are executed
+    together via execute_state_queries_batch.
+
+    Args:
+        ctx: Dependency context
+        queries: State queries to execute
+        workspace_name: Workspace name for cache grouping
+        repo_name: Repository name
+        repo_path: Path to repository
+        commit_hash: Git commit hash
+        refresh: If True, ignore cache and re-run every query
+        use_worktree: If True, use one git worktree for temporal execution
+        max_workers: Number of queries to run at once
+
+    Returns:
+        State results (from cache or fresh execution), in the same order as queries
+
+    Raises:
+        subprocess.CalledProcessError: If a command fails
+        json.JSONDecodeError: If an output is not valid JSON
+        ValueError: If an output structure is invalid
+    """
+    results: dict[str, StateResult] = {}
+    if not refresh:
+        for query in queries:
+            cached = read_cached_state(ctx, workspace_name, repo_name, query.name, commit_hash)
+            if cached is not None:
+                results[query.name] = cached
+
+    pending = [query for query in queries if query.name not in results]
+    fresh = execute_state_queries_batch(
+        ctx, pending, repo_path, commit_hash, use_worktree=use_worktree, max_workers=max_workers
+    )
+
+    for result in fresh:
+        # Cache result if deterministic
+        if result.deterministic:
+            write_cached_state(ctx, workspace_name, repo_name, result)
+        results[result.query_name] = result
+
+    return [results[query.name] for query in queries]
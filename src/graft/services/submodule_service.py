@@ -0,0 +1,46 @@
+"""Submodule service.
+
+Service functions for looking up submodule status shared by resolution and
+validation.
+"""
+
+import os
+
+from graft.protocols.git import GitOperations
+
+
+def load_submodule_index(git: GitOperations) -> dict[str, dict[str, str]]:
+    """Load status of all submodules with a single git call.
+
+    Args:
+        git: Git operations
+
+    Returns:
+        Mapping of normalized submodule path to status info
+        ('commit', 'status'). Empty if submodules cannot be listed, in
+        which case lookups miss and callers fall back to per-path checks.
+    """
+    try:
+        submodules = git.list_submodules()
+    except Exception:
+        return {}
+
+    return {os.path.normpath(path): info for path, info in submodules.items()}
+
+
+def lookup_submodule(
+    submodule_index: dict[str, dict[str, str]] | None, local_path: str
+) -> dict[str, str] | None:
+    """Find the status entry for a path in a submodule index.
+
+    Args:
+        submodule_index: Result of load_submodule_index, or None
+        local_path: Path of the dependency
+
+    Returns:
+        The entry's 'commit' and 'status', or None if the path isn't in
+        the index (it may still be a submodule; ask git directly)
+    """
+    if submodule_index is None:
+        return None
+    return submodule_index.get(os.path.normpath(local_path))
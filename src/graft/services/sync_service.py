@@ -3,13 +3,24 @@
 Service functions for syncing .graft/ to match lock file state.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from graft.domain.exceptions import DomainError
 from graft.domain.lock_entry import LockEntry
 from graft.protocols.filesystem import FileSystem
 from graft.protocols.git import GitOperations
 
+# Upper bound on concurrent dependency syncs
+MAX_PARALLEL_SYNCS = 8
+
+# Guards writes to the superproject's .git/config and index, which git
+# protects with config.lock and index.lock. Only those writes are
+# serialized; submodule clones and fetches run outside the lock.
+_superproject_lock = threading.Lock()
+
 
 @dataclass
 class SyncResult:
@@ -55,13 +66,15 @@ def sync_dependency(
     try:
         # Check if it's a submodule
         if git.is_submodule(local_path):
-            # Update submodule
-            git.update_submodule(local_path, init=True)
+            # Register it in .git/config, then clone/fetch without the lock
+            with _superproject_lock:
+                git.init_submodule(local_path)
+            git.update_submodule(local_path, init=False)
 
             # Get current commit - fail if we can't read it (indicates corruption)
             try:
                 current_commit = git.get_current_commit(local_path)
-            except Exception as e:
+            except ValueError as e:
                 return SyncResult(
                     name=name,
                     success=False,
@@ -99,7 +112,7 @@ def sync_dependency(
             # Get current commit - fail if we can't read it (indicates corruption)
             try:
                 current_commit = git.get_current_commit(local_path)
-            except Exception as e:
+            except ValueError as e:
                 return SyncResult(
                     name=name,
                     success=False,
@@ -126,12 +139,15 @@ def sync_dependency(
             )
 
         else:
-            # Dependency doesn't exist - add as submodule
-            git.add_submodule(
-                url=entry.source,
-                path=local_path,
-                ref=entry.ref,
-            )
+            # Dependency doesn't exist - add as submodule. `git submodule
+            # add` clones and writes .gitmodules and the index in one
+            # command, so missing dependencies are added one at a time.
+            with _superproject_lock:
+                git.add_submodule(
+                    url=entry.source,
+                    path=local_path,
+                    ref=entry.ref,
+                )
             # Checkout the exact commit
             git.checkout(local_path, entry.commit)
             return SyncResult(
@@ -141,7 +157,10 @@ def sync_dependency(
                 message=f"Added submodule and checked out {entry.commit[:7]}",
             )
 
-    except Exception as e:
+    except (DomainError, ValueError, OSError) as e:
+        # Git adapter failures: DependencyResolutionError subclasses and
+        # SubmoduleOperationError (DomainError), ValueError for unreadable
+        # repositories, OSError if git itself can't be run
         return SyncResult(
             name=name,
             success=False,
@@ -158,6 +177,12 @@ def sync_all_dependencies(
 ) -> list[SyncResult]:
     """Sync all dependencies to match lock file state.
 
+    Dependencies are synced concurrently, since each sync is dominated by
+    git subprocess and network latency. Registered submodules are cloned
+    and fetched in parallel; dependencies missing from .gitmodules are
+    added one at a time, because `git submodule add` clones while holding
+    the superproject's index.
+
     Args:
         filesystem: Filesystem operations
         git: Git operations
@@ -165,12 +190,17 @@ def sync_all_dependencies(
         lock_entries: Dictionary of lock entries
 
     Returns:
-        List of sync results
+        List of sync results, ordered by dependency name
     """
-    results = []
+    items = sorted(lock_entries.items())
+
+    def sync(item: tuple[str, LockEntry]) -> SyncResult:
+        name, entry = item
+        return sync_dependency(filesystem, git, deps_directory, name, entry)
 
-    for name, entry in sorted(lock_entries.items()):
-        result = sync_dependency(filesystem, git, deps_directory, name, entry)
-        results.append(result)
+    if len(items) <= 1:
+        return [sync(item) for item in items]
 
-    return results
+    max_workers = min(MAX_PARALLEL_SYNCS, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(sync, items))
@@ -4,7 +4,7 @@ Service layer for atomic dependency upgrades with rollback support.
 """
 
 import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from graft.domain.config import GraftConfig
 from graft.protocols.command_executor import CommandExecutor, CommandResult
@@ -39,6 +39,129 @@ class UpgradeResult:
     error: str | None = None
 
 
+@dataclass(frozen=True)
+class DependencyUpgrade:
+    """A single dependency upgrade within a batch.
+
+    Attributes:
+        config: Dependency's GraftConfig
+        dep_name: Name of dependency
+        to_ref: Target ref to upgrade to
+        source: Git URL or path
+        commit: Resolved commit hash for to_ref
+    """
+
+    config: GraftConfig
+    dep_name: str
+    to_ref: str
+    source: str
+    commit: str
+
+
+def _run_upgrade_steps(
+    executor: CommandExecutor,
+    lock_file: LockFile,
+    upgrade: DependencyUpgrade,
+    base_dir: str,
+    lock_path: str,
+    skip_migration: bool,
+    skip_verify: bool,
+) -> UpgradeResult:
+    """Run migration, verification and lock update for one upgrade.
+
+    Does no snapshotting or rollback; on failure the caller restores its
+    snapshot.
+
+    Returns:
+        UpgradeResult without snapshot_id
+    """
+    config = upgrade.config
+    change = config.get_change(upgrade.to_ref)
+
+    # Run migration command (if defined and not skipped)
+    migration_result = None
+    if change.migration and not skip_migration:
+        try:
+            migration_result = execute_command_by_name(
+                executor,
+                config.commands,
+                change.migration,
+                base_dir=base_dir,
+            )
+            if not migration_result.success:
+                raise RuntimeError(
+                    f"Migration command failed with exit code {migration_result.exit_code}"
+                )
+        except (KeyError, RuntimeError, OSError) as e:
+            return UpgradeResult(
+                success=False,
+                migration_result=migration_result,
+                error=f"Migration failed: {e}",
+            )
+
+    # Run verification command (if defined and not skipped)
+    verify_result = None
+    if change.verify and not skip_verify:
+        try:
+            verify_result = execute_command_by_name(
+                executor,
+                config.commands,
+                change.verify,
+                base_dir=base_dir,
+            )
+            if not verify_result.success:
+                raise RuntimeError(
+                    f"Verification command failed with exit code {verify_result.exit_code}"
+                )
+        except (KeyError, RuntimeError, OSError) as e:
+            return UpgradeResult(
+                success=False,
+                migration_result=migration_result,
+                verify_result=verify_result,
+                error=f"Verification failed: {e}",
+            )
+
+    # Update lock file
+    try:
+        update_dependency_lock(
+            lock_file,
+            lock_path,
+            upgrade.dep_name,
+            upgrade.source,
+            upgrade.to_ref,
+            upgrade.commit,
+        )
+    except OSError as e:
+        return UpgradeResult(
+            success=False,
+            migration_result=migration_result,
+            verify_result=verify_result,
+            error=f"Failed to update lock file: {e}",
+        )
+
+    return UpgradeResult(
+        success=True,
+        migration_result=migration_result,
+        verify_result=verify_result,
+    )
+
+
+def _cleanup_after_success(snapshot: Snapshot, snapshot_id: str, auto_cleanup: bool) -> str | None:
+    """Optionally delete the snapshot of a successful upgrade.
+
+    Returns:
+        snapshot_id if the snapshot was kept, None if it was deleted
+    """
+    if auto_cleanup:
+        try:
+            cleanup_snapshot(snapshot, snapshot_id)
+            return None  # Mark as cleaned up
+        except ValueError:
+            # Snapshot cleanup failed, but upgrade succeeded
+            pass
+    return snapshot_id
+
+
 def upgrade_dependency(
     snapshot: Snapshot,
     executor: CommandExecutor,
@@ -91,8 +214,6 @@ def upgrade_dependency(
             error=f"Change not found: {to_ref}",
         )
 
-    change = config.get_change(to_ref)
-
     # Step 1: Create snapshot for rollback
     snapshot_paths = get_snapshot_paths_for_dependency(dep_name)
     try:
@@ -104,92 +225,24 @@ def upgrade_dependency(
         )
 
     try:
-        # Step 2: Run migration command (if defined and not skipped)
-        migration_result = None
-        if change.migration and not skip_migration:
-            try:
-                migration_result = execute_command_by_name(
-                    executor,
-                    config.commands,
-                    change.migration,
-                    base_dir=base_dir,
-                )
-                if not migration_result.success:
-                    raise RuntimeError(
-                        f"Migration command failed with exit code {migration_result.exit_code}"
-                    )
-            except (KeyError, RuntimeError, OSError) as e:
-                # Rollback on migration failure
-                restore_workspace_snapshot(snapshot, snapshot_id)
-                return UpgradeResult(
-                    success=False,
-                    snapshot_id=snapshot_id,
-                    migration_result=migration_result,
-                    error=f"Migration failed: {e}",
-                )
-
-        # Step 3: Run verification command (if defined and not skipped)
-        verify_result = None
-        if change.verify and not skip_verify:
-            try:
-                verify_result = execute_command_by_name(
-                    executor,
-                    config.commands,
-                    change.verify,
-                    base_dir=base_dir,
-                )
-                if not verify_result.success:
-                    raise RuntimeError(
-                        f"Verification command failed with exit code {verify_result.exit_code}"
-                    )
-            except (KeyError, RuntimeError, OSError) as e:
-                # Rollback on verification failure
-                restore_workspace_snapshot(snapshot, snapshot_id)
-                return UpgradeResult(
-                    success=False,
-                    snapshot_id=snapshot_id,
-                    migration_result=migration_result,
-                    verify_result=verify_result,
-                    error=f"Verification failed: {e}",
-                )
-
-        # Step 4: Update lock file
-        try:
-            update_dependency_lock(
-                lock_file,
-                lock_path,
-                dep_name,
-                source,
-                to_ref,
-                commit,
-            )
-        except OSError as e:
-            # Rollback on lock file update failure
+        # Steps 2-4: Migration, verification, lock file update
+        result = _run_upgrade_steps(
+            executor,
+            lock_file,
+            DependencyUpgrade(config, dep_name, to_ref, source, commit),
+            base_dir,
+            lock_path,
+            skip_migration,
+            skip_verify,
+        )
+        if not result.success:
+            # Rollback on failure
             restore_workspace_snapshot(snapshot, snapshot_id)
-            return UpgradeResult(
-                success=False,
-                snapshot_id=snapshot_id,
-                migration_result=migration_result,
-                verify_result=verify_result,
-                error=f"Failed to update lock file: {e}",
-            )
+            return replace(result, snapshot_id=snapshot_id)
 
         # Success! Optionally cleanup snapshot
-        final_snapshot_id: str | None = snapshot_id
-        if auto_cleanup:
-            try:
-                cleanup_snapshot(snapshot, snapshot_id)
-                final_snapshot_id = None  # Mark as cleaned up
-            except ValueError:
-                # Snapshot cleanup failed, but upgrade succeeded
-                pass
-
-        return UpgradeResult(
-            success=True,
-            snapshot_id=final_snapshot_id,
-            migration_result=migration_result,
-            verify_result=verify_result,
-        )
+        final_snapshot_id = _cleanup_after_success(snapshot, snapshot_id, auto_cleanup)
+        return replace(result, snapshot_id=final_snapshot_id)
 
     except Exception as e:
         # Catch-all rollback for unexpected errors
@@ -205,6 +258,111 @@ def upgrade_dependency(
         )
 
 
+def upgrade_dependencies_batch(
+    snapshot: Snapshot,
+    executor: CommandExecutor,
+    lock_file: LockFile,
+    upgrades: list[DependencyUpgrade],
+    base_dir: str,
+    lock_path: str,
+    skip_migration: bool = False,
+    skip_verify: bool = False,
+    auto_cleanup: bool = True,
+) -> list[UpgradeResult]:
+    """Upgrade several dependencies atomically under a single snapshot.
+
+    The snapshot paths of all upgrades are combined and snapshotted once.
+    Upgrades then run in order. If any of them fails, the snapshot is
+    restored, undoing every upgrade in the batch, and the remaining upgrades
+    are not attempted.
+
+    Args:
+        snapshot: Snapshot protocol for creating backups
+        executor: Command executor protocol
+        lock_file: Lock file operations protocol
+        upgrades: Upgrades to apply, in order
+        base_dir: Base directory for command execution
+        lock_path: Path to graft.lock
+        skip_migration: Skip migration commands
+        skip_verify: Skip verification commands
+        auto_cleanup: Automatically delete snapshot on success
+
+    Returns:
+        One UpgradeResult per upgrade, in the same order as upgrades
+    """
+    if not upgrades:
+        return []
+
+    def fail_all(error: str, snapshot_id: str | None = None) -> list[UpgradeResult]:
+        return [
+            UpgradeResult(success=False, snapshot_id=snapshot_id, error=error) for _ in upgrades
+        ]
+
+    # Validate every upgrade before touching the workspace
+    missing = [u.to_ref for u in upgrades if not u.config.has_change(u.to_ref)]
+    if missing:
+        return [
+            UpgradeResult(
+                success=False,
+                error=f"Change not found: {u.to_ref}"
+                if u.to_ref in missing
+                else "Not attempted: batch contains unknown changes",
+            )
+            for u in upgrades
+        ]
+
+    # One snapshot covering the union of all upgrades' paths
+    snapshot_paths = list(
+        dict.fromkeys(
+            path for u in upgrades for path in get_snapshot_paths_for_dependency(u.dep_name)
+        )
+    )
+    try:
+        snapshot_id = create_workspace_snapshot(snapshot, snapshot_paths, base_dir)
+    except (FileNotFoundError, OSError) as e:
+        return fail_all(f"Failed to create snapshot: {e}")
+
+    try:
+        results: list[UpgradeResult] = []
+        for index, upgrade in enumerate(upgrades):
+            result = _run_upgrade_steps(
+                executor,
+                lock_file,
+                upgrade,
+                base_dir,
+                lock_path,
+                skip_migration,
+                skip_verify,
+            )
+            if not result.success:
+                # Rollback the whole batch
+                restore_workspace_snapshot(snapshot, snapshot_id)
+                reason = f"upgrade of {upgrade.dep_name} failed"
+                rolled_back = [
+                    replace(
+                        done, success=False, snapshot_id=snapshot_id, error=f"Rolled back: {reason}"
+                    )
+                    for done in results
+                ]
+                not_attempted = [
+                    UpgradeResult(
+                        success=False, snapshot_id=snapshot_id, error=f"Not attempted: {reason}"
+                    )
+                    for _ in upgrades[index + 1 :]
+                ]
+                return [*rolled_back, replace(result, snapshot_id=snapshot_id), *not_attempted]
+            results.append(result)
+
+        final_snapshot_id = _cleanup_after_success(snapshot, snapshot_id, auto_cleanup)
+        return [replace(result, snapshot_id=final_snapshot_id) for result in results]
+
+    except Exception as e:
+        # Catch-all rollback for unexpected errors
+        with contextlib.suppress(ValueError, OSError):
+            restore_workspace_snapshot(snapshot, snapshot_id)
+        return fail_all(f"Unexpected error: {e}", snapshot_id)
+
+
 def rollback_upgrade(
     snapshot: Snapshot,
     snapshot_id: str,
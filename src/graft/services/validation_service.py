@@ -3,26 +3,72 @@
 Provides functions for validating configuration files and lock state.
 """
 
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
+from enum import StrEnum
+from typing import TypeVar
 
 from graft.domain.config import GraftConfig
 from graft.domain.lock_entry import LockEntry
 from graft.protocols.filesystem import FileSystem
 from graft.protocols.git import GitOperations
+from graft.services.submodule_service import load_submodule_index, lookup_submodule
 
+# Default cap on dependencies validated at once; each check is a handful of
+# blocking git subprocess calls
+MAX_PARALLEL_VALIDATIONS = 8
 
-@dataclass(frozen=True)
+_T = TypeVar("_T")
+
+
+def _map_dependencies(
+    check: Callable[[str, LockEntry], _T],
+    items: list[tuple[str, LockEntry]],
+    max_workers: int,
+) -> list[_T]:
+    """Run a per-dependency check over lock entries, in input order.
+
+    Checks run on a thread pool when there is more than one dependency.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [check(name, entry) for name, entry in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda item: check(*item), items))
+
+
+class Severity(StrEnum):
+    """Severity of a validation error.
+
+    Members compare equal to their string values, so callers may pass
+    'error' or 'warning'.
+    """
+
+    ERROR = "error"
+    WARNING = "warning"
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Represents a validation error.
 
     Attributes:
         message: Human-readable error message
-        severity: 'error' or 'warning'
+        severity: Severity.ERROR or Severity.WARNING
+
+    Raises:
+        ValueError: If severity is not 'error' or 'warning'
     """
 
     message: str
-    severity: str = "error"  # 'error' or 'warning'
+    severity: Severity = Severity.ERROR
+
+    def __post_init__(self) -> None:
+        """Normalize severity strings to Severity members."""
+        # Use object.__setattr__ for frozen dataclass
+        object.__setattr__(self, "severity", Severity(self.severity))
 
 
 def validate_config_schema(config: GraftConfig) -> list[ValidationError]:
@@ -64,18 +110,22 @@ def validate_refs_exist(
     Returns:
         List of validation errors
     """
-    errors = []
+    refs = list(config.changes)
 
-    for ref in config.changes:
-        try:
-            # Try to resolve ref to commit
-            git.resolve_ref(dep_path, ref)
-        except Exception as e:
-            errors.append(
-                ValidationError(f"Ref '{ref}' does not exist in git repository: {e}")
-            )
+    # One git process resolves every ref, instead of one per ref
+    try:
+        resolved = git.batch_resolve_refs(dep_path, refs)
+    except Exception as e:
+        return [
+            ValidationError(f"Ref '{ref}' does not exist in git repository: {e}")
+            for ref in refs
+        ]
 
-    return errors
+    return [
+        ValidationError(f"Ref '{ref}' does not exist in git repository")
+        for ref in refs
+        if resolved.get(ref) is None
+    ]
 
 
 def validate_lock_entry(
@@ -107,7 +157,7 @@ def validate_lock_entry(
                 ValidationError(
                     f"Ref '{entry.ref}' has moved: expected commit {entry.commit[:7]}, "
                     f"now at {current_commit[:7]}",
-                    severity="warning",
+                    severity=Severity.WARNING,
                 )
             )
     except Exception as e:
@@ -118,22 +168,27 @@ def validate_lock_entry(
     return errors
 
 
-def get_validation_summary(errors: list[ValidationError]) -> tuple[list[str], list[str]]:
+def get_validation_summary(errors: Iterable[ValidationError]) -> tuple[list[str], list[str]]:
     """Separate errors and warnings from validation results.
 
     Args:
-        errors: List of ValidationError objects
+        errors: ValidationError objects; any iterable, consumed once
 
     Returns:
         Tuple of (errors, warnings) as string lists
     """
-    error_messages = [e.message for e in errors if e.severity == "error"]
-    warning_messages = [e.message for e in errors if e.severity == "warning"]
+    error_messages: list[str] = []
+    warning_messages: list[str] = []
+    for e in errors:
+        if e.severity is Severity.ERROR:
+            error_messages.append(e.message)
+        else:
+            warning_messages.append(e.message)
 
     return (error_messages, warning_messages)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegrityResult:
     """Result of integrity validation for a single dependency.
 
@@ -152,111 +207,142 @@ class IntegrityResult:
     message: str
 
 
+def _check_integrity(
+    filesystem: FileSystem,
+    git: GitOperations,
+    deps_directory: str,
+    name: str,
+    entry: LockEntry,
+) -> IntegrityResult:
+    """Check that one dependency in .graft/ matches its lock entry."""
+    local_path = os.path.join(deps_directory, name)
+
+    # Check if dependency exists
+    if not filesystem.exists(local_path):
+        return IntegrityResult(
+            name=name,
+            valid=False,
+            expected_commit=entry.commit,
+            actual_commit=None,
+            message="Dependency not found in .graft/",
+        )
+
+    # Check if it's a git repository
+    if not git.is_repository(local_path):
+        return IntegrityResult(
+            name=name,
+            valid=False,
+            expected_commit=entry.commit,
+            actual_commit=None,
+            message="Path exists but is not a git repository",
+        )
+
+    # Check if it's registered as a submodule
+    is_submodule = git.is_submodule(local_path)
+    # (Note: legacy clones are still valid, we just track if it's a submodule)
+
+    # Get current commit
+    try:
+        actual_commit = git.get_current_commit(local_path)
+    except Exception as e:
+        return IntegrityResult(
+            name=name,
+            valid=False,
+            expected_commit=entry.commit,
+            actual_commit=None,
+            message=f"Failed to get commit: {e}",
+        )
+
+    # Compare commits
+    if actual_commit == entry.commit:
+        message = "Commit matches"
+        if not is_submodule:
+            message += " (legacy clone - delete .graft/ and re-run resolve)"
+        return IntegrityResult(
+            name=name,
+            valid=True,
+            expected_commit=entry.commit,
+            actual_commit=actual_commit,
+            message=message,
+        )
+
+    message = f"Commit mismatch: expected {entry.commit[:7]}, got {actual_commit[:7]}"
+    if not is_submodule:
+        message += " (legacy clone)"
+    return IntegrityResult(
+        name=name,
+        valid=False,
+        expected_commit=entry.commit,
+        actual_commit=actual_commit,
+        message=message,
+    )
+
+
 def validate_integrity(
     filesystem: FileSystem,
     git: GitOperations,
     deps_directory: str,
     lock_entries: dict[str, LockEntry],
+    max_workers: int = MAX_PARALLEL_VALIDATIONS,
 ) -> list[IntegrityResult]:
     """Validate that .graft/ matches the lock file.
 
     Compares actual commit hashes in .graft/ against expected
-    commits in graft.lock.
+    commits in graft.lock. Dependencies are checked concurrently.
 
     Args:
         filesystem: Filesystem operations
         git: Git operations
         deps_directory: Path to deps directory (e.g., ".graft")
         lock_entries: Dictionary of lock entries
+        max_workers: Maximum number of dependencies checked at once
 
     Returns:
-        List of integrity results, one per dependency
+        List of integrity results, one per dependency, ordered by name
     """
-    results = []
-
-    for name, entry in sorted(lock_entries.items()):
-        local_path = str(Path(deps_directory) / name)
-
-        # Check if dependency exists
-        if not filesystem.exists(local_path):
-            results.append(
-                IntegrityResult(
-                    name=name,
-                    valid=False,
-                    expected_commit=entry.commit,
-                    actual_commit=None,
-                    message="Dependency not found in .graft/",
-                )
-            )
-            continue
-
-        # Check if it's a git repository
-        if not git.is_repository(local_path):
-            results.append(
-                IntegrityResult(
-                    name=name,
-                    valid=False,
-                    expected_commit=entry.commit,
-                    actual_commit=None,
-                    message="Path exists but is not a git repository",
-                )
-            )
-            continue
+    return _map_dependencies(
+        lambda name, entry: _check_integrity(filesystem, git, deps_directory, name, entry),
+        sorted(lock_entries.items()),
+        max_workers,
+    )
 
-        # Check if it's registered as a submodule
-        is_submodule = git.is_submodule(local_path)
-        # (Note: legacy clones are still valid, we just track if it's a submodule)
 
-        # Get current commit
-        try:
-            actual_commit = git.get_current_commit(local_path)
-        except Exception as e:
-            results.append(
-                IntegrityResult(
-                    name=name,
-                    valid=False,
-                    expected_commit=entry.commit,
-                    actual_commit=None,
-                    message=f"Failed to get commit: {e}",
-                )
-            )
-            continue
-
-        # Compare commits
-        if actual_commit == entry.commit:
-            message = "Commit matches"
-            if not is_submodule:
-                message += " (legacy clone - delete .graft/ and re-run resolve)"
-            results.append(
-                IntegrityResult(
-                    name=name,
-                    valid=True,
-                    expected_commit=entry.commit,
-                    actual_commit=actual_commit,
-                    message=message,
-                )
-            )
-        else:
-            message = f"Commit mismatch: expected {entry.commit[:7]}, got {actual_commit[:7]}"
-            if not is_submodule:
-                message += " (legacy clone)"
-            results.append(
-                IntegrityResult(
-                    name=name,
-                    valid=False,
-                    expected_commit=entry.commit,
-                    actual_commit=actual_commit,
-                    message=message,
-                )
-            )
+def _check_lock_commit(
+    git: GitOperations,
+    deps_directory: str,
+    name: str,
+    entry: LockEntry,
+) -> ValidationError | None:
+    """Check that one dependency's locked commit exists in its repository."""
+    local_path = os.path.join(deps_directory, name)
+
+    # Report if repo doesn't exist locally
+    if not git.is_repository(local_path):
+        return ValidationError(
+            f"Dependency '{name}' not found at {local_path}. "
+            "Run 'graft resolve' to fetch dependencies.",
+            severity=Severity.ERROR,
+        )
 
-    return results
+    try:
+        # Try to resolve the locked commit
+        git.resolve_ref(local_path, entry.commit)
+    except Exception:
+        return ValidationError(
+            f"Lock file commit {entry.commit[:8]} for '{name}' is not available. "
+            "The commit may have been removed by a force push or rebase. "
+            "Run 'graft resolve' to update to the latest commit.",
+            severity=Severity.ERROR,
+        )
+
+    return None
 
 
 def validate_lock_commits_exist(
     git: GitOperations,
     deps_directory: str,
     lock_entries: dict[str, LockEntry],
+    max_workers: int = MAX_PARALLEL_VALIDATIONS,
 ) -> list[ValidationError]:
     """Validate that all commits in lock file exist in their repositories.
 
@@ -265,47 +351,26 @@ def validate_lock_commits_exist(
     - Repositories are rebased
     - Repositories are deleted and recreated
 
+    Dependencies are checked concurrently.
+
     Args:
         git: Git operations
         deps_directory: Path to deps directory (e.g., ".graft")
         lock_entries: Dictionary of lock entries
+        max_workers: Maximum number of dependencies checked at once
 
     Returns:
         List of validation errors for missing commits or missing repos
     """
-    errors = []
+    errors = _map_dependencies(
+        lambda name, entry: _check_lock_commit(git, deps_directory, name, entry),
+        list(lock_entries.items()),
+        max_workers,
+    )
+    return [error for error in errors if error is not None]
 
-    for name, entry in lock_entries.items():
-        local_path = f"{deps_directory}/{name}"
 
-        # Report if repo doesn't exist locally
-        if not git.is_repository(local_path):
-            errors.append(
-                ValidationError(
-                    f"Dependency '{name}' not found at {local_path}. "
-                    "Run 'graft resolve' to fetch dependencies.",
-                    severity="error",
-                )
-            )
-            continue
-
-        try:
-            # Try to resolve the locked commit
-            git.resolve_ref(local_path, entry.commit)
-        except Exception:
-            errors.append(
-                ValidationError(
-                    f"Lock file commit {entry.commit[:8]} for '{name}' is not available. "
-                    "The commit may have been removed by a force push or rebase. "
-                    "Run 'graft resolve' to update to the latest commit.",
-                    severity="error",
-                )
-            )
-
-    return errors
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubmoduleValidationResult:
     """Result of submodule-specific validation.
 
@@ -328,10 +393,98 @@ class SubmoduleValidationResult:
     message: str
 
 
+def _check_submodule_state(
+    git: GitOperations,
+    deps_directory: str,
+    name: str,
+    entry: LockEntry,
+    submodule_index: dict[str, dict[str, str]] | None = None,
+) -> SubmoduleValidationResult:
+    """Check one dependency's submodule state against its lock entry.
+
+    Paths found in submodule_index are known submodules; others fall back
+    to querying git directly.
+    """
+    local_path = os.path.join(deps_directory, name)
+
+    indexed = lookup_submodule(submodule_index, local_path)
+
+    # Check if it's a submodule
+    is_submodule = indexed is not None or git.is_submodule(local_path)
+
+    if not is_submodule:
+        return SubmoduleValidationResult(
+            name=name,
+            path=local_path,
+            is_submodule=False,
+            has_uncommitted_changes=None,
+            is_ahead_of_lock=None,
+            is_behind_ref=None,
+            message="Not registered as submodule (legacy clone)",
+        )
+
+    # Check for uncommitted changes
+    has_uncommitted_changes = None
+    try:
+        has_uncommitted_changes = not git.is_working_directory_clean(local_path)
+    except Exception:
+        pass
+
+    # HEAD is compared against both the lock and the tracked ref
+    # A clean index entry means HEAD is at the recorded commit
+    current_commit: str | None
+    if indexed is not None and indexed["status"] == " ":
+        current_commit = indexed["commit"]
+    else:
+        try:
+            current_commit = git.get_current_commit(local_path)
+        except Exception:
+            current_commit = None
+
+    # Check if ahead of locked commit
+    is_ahead_of_lock = None
+    if current_commit is not None:
+        is_ahead_of_lock = current_commit != entry.commit
+
+    # Check if behind tracked ref
+    is_behind_ref = None
+    if current_commit is not None:
+        try:
+            ref_commit = git.resolve_ref(local_path, entry.ref)
+            is_behind_ref = current_commit != ref_commit
+        except Exception:
+            pass
+
+    # Build message
+    messages = []
+    if has_uncommitted_changes:
+        messages.append("has uncommitted changes")
+    if is_ahead_of_lock:
+        messages.append("ahead of lock file")
+    if is_behind_ref:
+        messages.append(f"behind {entry.ref}")
+
+    if messages:
+        message = "; ".join(messages)
+    else:
+        message = "OK"
+
+    return SubmoduleValidationResult(
+        name=name,
+        path=local_path,
+        is_submodule=True,
+        has_uncommitted_changes=has_uncommitted_changes,
+        is_ahead_of_lock=is_ahead_of_lock,
+        is_behind_ref=is_behind_ref,
+        message=message,
+    )
+
+
 def validate_submodule_state(
     git: GitOperations,
     deps_directory: str,
     lock_entries: dict[str, LockEntry],
+    max_workers: int = MAX_PARALLEL_VALIDATIONS,
 ) -> list[SubmoduleValidationResult]:
     """Validate submodule state against lock file.
 
@@ -341,84 +494,23 @@ def validate_submodule_state(
     - Submodule ahead of locked commit
     - Submodule behind tracked ref
 
+    Submodule registration is read for all dependencies with one git call.
+    Dependencies are checked concurrently.
+
     Args:
         git: Git operations
         deps_directory: Path to deps directory
         lock_entries: Dictionary of lock entries
+        max_workers: Maximum number of dependencies checked at once
 
     Returns:
-        List of validation results for each dependency
+        List of validation results for each dependency, ordered by name
     """
-    results = []
-
-    for name, entry in sorted(lock_entries.items()):
-        local_path = f"{deps_directory}/{name}"
-
-        # Check if it's a submodule
-        is_submodule = git.is_submodule(local_path)
-
-        if not is_submodule:
-            results.append(
-                SubmoduleValidationResult(
-                    name=name,
-                    path=local_path,
-                    is_submodule=False,
-                    has_uncommitted_changes=None,
-                    is_ahead_of_lock=None,
-                    is_behind_ref=None,
-                    message="Not registered as submodule (legacy clone)",
-                )
-            )
-            continue
-
-        # Check for uncommitted changes
-        has_uncommitted_changes = None
-        try:
-            has_uncommitted_changes = not git.is_working_directory_clean(local_path)
-        except Exception:
-            pass
-
-        # Check if ahead of locked commit
-        is_ahead_of_lock = None
-        try:
-            current_commit = git.get_current_commit(local_path)
-            is_ahead_of_lock = current_commit != entry.commit
-        except Exception:
-            pass
-
-        # Check if behind tracked ref
-        is_behind_ref = None
-        try:
-            ref_commit = git.resolve_ref(local_path, entry.ref)
-            current_commit = git.get_current_commit(local_path)
-            is_behind_ref = current_commit != ref_commit
-        except Exception:
-            pass
-
-        # Build message
-        messages = []
-        if has_uncommitted_changes:
-            messages.append("has uncommitted changes")
-        if is_ahead_of_lock:
-            messages.append("ahead of lock file")
-        if is_behind_ref:
-            messages.append(f"behind {entry.ref}")
-
-        if messages:
-            message = "; ".join(messages)
-        else:
-            message = "OK"
-
-        results.append(
-            SubmoduleValidationResult(
-                name=name,
-                path=local_path,
-                is_submodule=True,
-                has_uncommitted_changes=has_uncommitted_changes,
-                is_ahead_of_lock=is_ahead_of_lock,
-                is_behind_ref=is_behind_ref,
-                message=message,
-            )
-        )
-
-    return results
+    submodule_index = load_submodule_index(git)
+    return _map_dependencies(
+        lambda name, entry: _check_submodule_state(
+            git, deps_directory, name, entry, submodule_index
+        ),
+        sorted(lock_entries.items()),
+        max_workers,
+    )
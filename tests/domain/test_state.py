@@ -1,5 +1,6 @@
 """Tests for state domain models."""
 
+from dataclasses import replace
 from datetime import datetime
 
 import pytest
@@ -73,50 +74,59 @@ class TestStateQuery:
         with pytest.raises(ValueError, match="missing required field 'run'"):
             StateQuery.from_dict("coverage", {})
 
+    def test_from_dict_with_projection(self):
+        """Test StateQuery parses projection paths."""
+        query = StateQuery.from_dict(
+            "coverage",
+            {"run": "cat coverage.json", "projection": ["totals.percent_covered", "meta"]},
+        )
+
+        assert query.projection == ("totals.percent_covered", "meta")
+
+    def test_from_dict_invalid_projection(self):
+        """Test StateQuery rejects non-list projection."""
+        with pytest.raises(ValueError, match="projection must be a list"):
+            StateQuery.from_dict("coverage", {"run": "cat coverage.json", "projection": "totals"})
+
+
+TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def sample_result() -> StateResult:
+    """Provide a canonical state result shared by the module (do not mutate its data)."""
+    return StateResult(
+        query_name="coverage",
+        commit_hash="abc123",
+        data={"percent_covered": 85.0},
+        timestamp=TIMESTAMP,
+        command="pytest --cov",
+        deterministic=True,
+    )
+
 
 class TestStateResult:
     """Tests for StateResult."""
 
-    def test_create_result(self):
+    def test_create_result(self, sample_result: StateResult):
         """Test creating a state result."""
-        now = datetime.now()
-        result = StateResult(
-            query_name="coverage",
-            commit_hash="abc123",
-            data={"percent_covered": 85.0},
-            timestamp=now,
-            command="pytest --cov",
-            deterministic=True,
-            cached=False,
-        )
-
-        assert result.query_name == "coverage"
-        assert result.commit_hash == "abc123"
-        assert result.data == {"percent_covered": 85.0}
-        assert result.timestamp == now
-        assert result.command == "pytest --cov"
-        assert result.deterministic is True
-        assert result.cached is False
-
-    def test_to_cache_file(self):
+        assert sample_result.query_name == "coverage"
+        assert sample_result.commit_hash == "abc123"
+        assert sample_result.data == {"percent_covered": 85.0}
+        assert sample_result.timestamp == TIMESTAMP
+        assert sample_result.command == "pytest --cov"
+        assert sample_result.deterministic is True
+        assert sample_result.cached is False
+
+    def test_to_cache_file(self, sample_result: StateResult):
         """Test serializing result to cache file format."""
-        now = datetime.now()
-        result = StateResult(
-            query_name="coverage",
-            commit_hash="abc123",
-            data={"percent_covered": 85.0},
-            timestamp=now,
-            command="pytest --cov",
-            deterministic=True,
-        )
-
-        cache_data = result.to_cache_file()
+        cache_data = sample_result.to_cache_file()
 
         assert cache_data == {
             "metadata": {
                 "query_name": "coverage",
                 "commit_hash": "abc123",
-                "timestamp": now.isoformat(),
+                "timestamp": "2024-01-01T12:00:00",
                 "command": "pytest --cov",
                 "deterministic": True,
             },
@@ -125,12 +135,11 @@ class TestStateResult:
 
     def test_from_cache_file(self):
         """Test loading result from cache file format."""
-        now = datetime.now()
         cache_data = {
             "metadata": {
                 "query_name": "coverage",
                 "commit_hash": "abc123",
-                "timestamp": now.isoformat(),
+                "timestamp": "2024-01-01T12:00:00",
                 "command": "pytest --cov",
                 "deterministic": True,
             },
@@ -142,30 +151,15 @@ class TestStateResult:
         assert result.query_name == "coverage"
         assert result.commit_hash == "abc123"
         assert result.data == {"percent_covered": 85.0}
-        assert result.timestamp == now
+        assert result.timestamp == TIMESTAMP
         assert result.command == "pytest --cov"
         assert result.deterministic is True
         assert result.cached is True  # from_cache_file sets cached=True
 
-    def test_roundtrip_cache_file(self):
+    def test_roundtrip_cache_file(self, sample_result: StateResult):
         """Test result can roundtrip through cache file format."""
-        now = datetime.now()
-        original = StateResult(
-            query_name="test",
-            commit_hash="def456",
-            data={"tests_passed": 42},
-            timestamp=now,
-            command="pytest",
-            deterministic=True,
-        )
-
         # Serialize and deserialize
-        cache_data = original.to_cache_file()
+        cache_data = sample_result.to_cache_file()
         restored = StateResult.from_cache_file(cache_data)
 
-        assert restored.query_name == original.query_name
-        assert restored.commit_hash == original.commit_hash
-        assert restored.data == original.data
-        assert restored.timestamp == original.timestamp
-        assert restored.command == original.command
-        assert restored.deterministic == original.deterministic
+        assert restored == replace(sample_result, cached=True)
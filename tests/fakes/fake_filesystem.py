@@ -3,6 +3,7 @@
 In-memory filesystem implementation with test helpers.
 """
 
+import os
 from pathlib import Path
 
 
@@ -31,8 +32,15 @@ class FakeFileSystem:
         """Initialize empty fake filesystem."""
         self._files: dict[str, str] = {}  # path -> content
         self._dirs: set[str] = set()
+        self._children: dict[str, set[str]] = {}  # parent path -> entry names
         self._cwd: str = "/fake/cwd"
 
+    def _index(self, path: str) -> None:
+        """Record path as an entry of its parent directory."""
+        parent, sep, name = path.rpartition("/")
+        if sep and name:
+            self._children.setdefault(parent, set()).add(name)
+
     def read_text(self, path: str) -> str:
         """Read text file.
 
@@ -82,15 +90,17 @@ class FakeFileSystem:
             FileExistsError: If directory exists and parents=False
         """
         if parents:
-            # Create all parent directories
-            parts = Path(path).parts
-            for i in range(1, len(parts) + 1):
-                dir_path = str(Path(*parts[:i]))
+            # Create all parent directories, extending one component at a time
+            dir_path = ""
+            for part in Path(path).parts:
+                dir_path = os.path.join(dir_path, part)
                 self._dirs.add(dir_path)
+                self._index(dir_path)
         else:
             if path in self._dirs:
                 raise FileExistsError(f"Directory already exists: {path}")
             self._dirs.add(path)
+            self._index(path)
 
     def get_cwd(self) -> str:
         """Get current working directory.
@@ -110,6 +120,7 @@ class FakeFileSystem:
             content: File content
         """
         self._files[path] = content
+        self._index(path)
 
     def write_text(self, path: str, content: str) -> None:
         """Write text to file (protocol method).
@@ -119,6 +130,7 @@ class FakeFileSystem:
             content: File content
         """
         self._files[path] = content
+        self._index(path)
 
     def list_directory(self, path: str) -> list[str]:
         """List directory contents.
@@ -138,29 +150,7 @@ class FakeFileSystem:
         if not self.is_dir(path):
             raise NotADirectoryError(f"Not a directory: {path}")
 
-        # Find all items that are direct children of this path
-        items = []
-        path_with_slash = path.rstrip("/") + "/"
-
-        # Check files
-        for file_path in self._files:
-            if file_path.startswith(path_with_slash):
-                # Get relative path from directory
-                relative = file_path[len(path_with_slash):]
-                # Only include direct children (no slashes in relative path)
-                if "/" not in relative:
-                    items.append(relative)
-
-        # Check directories
-        for dir_path in self._dirs:
-            if dir_path.startswith(path_with_slash):
-                # Get relative path from directory
-                relative = dir_path[len(path_with_slash):]
-                # Only include direct children
-                if relative and "/" not in relative:
-                    items.append(relative)
-
-        return sorted(set(items))
+        return sorted(self._children.get(path.rstrip("/"), ()))
 
     def remove_directory(self, path: str) -> None:
         """Remove a directory and all its contents.
@@ -179,17 +169,19 @@ class FakeFileSystem:
 
         # Remove the directory
         self._dirs.discard(path)
-
-        # Remove all files in the directory
-        path_with_slash = path.rstrip("/") + "/"
-        files_to_remove = [f for f in self._files if f.startswith(path_with_slash)]
-        for f in files_to_remove:
-            del self._files[f]
-
-        # Remove all subdirectories
-        dirs_to_remove = [d for d in self._dirs if d.startswith(path_with_slash)]
-        for d in dirs_to_remove:
-            self._dirs.discard(d)
+        if path not in self._files:
+            parent, sep, name = path.rpartition("/")
+            if sep:
+                self._children.get(parent, set()).discard(name)
+
+        # Remove all files and subdirectories, one parent directory at a time
+        key = path.rstrip("/")
+        prefix = key + "/"
+        for parent in [p for p in self._children if p == key or p.startswith(prefix)]:
+            for name in self._children.pop(parent):
+                entry = f"{parent}/{name}"
+                self._files.pop(entry, None)
+                self._dirs.discard(entry)
 
     def set_cwd(self, path: str) -> None:
         """Set current working directory (test helper).
@@ -206,4 +198,5 @@ class FakeFileSystem:
         """
         self._files.clear()
         self._dirs.clear()
+        self._children.clear()
         self._cwd = "/fake/cwd"
@@ -3,8 +3,14 @@
 In-memory git operations implementation with test helpers.
 """
 
+import hashlib
+import re
+
 from graft.domain.exceptions import DependencyResolutionError
 
+# Full 40-character commit hash, as passed to checkout by resolution
+_FULL_COMMIT_PATTERN = re.compile(r"[0-9a-f]{40}")
+
 
 class FakeGitOperations:
     """Fake git operations for testing.
@@ -30,6 +36,9 @@ class FakeGitOperations:
         self._cloned_repos: dict[str, tuple[str, str]] = {}  # path -> (url, ref)
         self._clone_calls: list[tuple[str, str, str]] = []  # (url, dest, ref)
         self._fetch_calls: list[tuple[str, str]] = []  # (path, ref)
+        self._fetch_all_calls: list[str] = []  # paths
+        self._fetch_ref_calls: list[tuple[str, str]] = []  # (path, ref)
+        self._fetch_ref_failures: set[str] = set()  # repo paths
         self._checkout_calls: list[tuple[str, str]] = []  # (path, ref)
         self._should_fail: dict[str, str] = {}  # url -> error message
         self._refs: dict[tuple[str, str], str] = {}  # (repo_path, ref) -> commit hash
@@ -39,12 +48,16 @@ class FakeGitOperations:
         self._submodules: dict[str, dict[str, str]] = {}  # path -> {url, ref, status}
         self._add_submodule_calls: list[tuple[str, str, str | None]] = []  # (url, path, ref)
         self._update_submodule_calls: list[tuple[str, bool, bool]] = []  # (path, init, recursive)
+        self._init_submodule_calls: list[str] = []  # paths
         self._remove_submodule_calls: list[str] = []  # paths
+        self._is_submodule_calls: list[str] = []  # paths
+        self._list_submodules_calls = 0
         self._submodule_branches: dict[str, str] = {}  # path -> branch
         # Worktree tracking
         self._worktrees: dict[str, str] = {}  # worktree_path -> commit
         self._add_worktree_calls: list[tuple[str, str, str]] = []  # (repo_path, worktree_path, commit)
         self._remove_worktree_calls: list[tuple[str, str]] = []  # (repo_path, worktree_path)
+        self._reset_worktree_calls: list[tuple[str, str]] = []  # (worktree_path, commit)
 
     def clone(self, url: str, destination: str, ref: str) -> None:
         """Fake clone operation.
@@ -131,10 +144,25 @@ class FakeGitOperations:
 
         # Return a fake but valid commit hash based on ref
         # Use deterministic hash for consistent testing
-        import hashlib
-        hash_input = f"{repo_path}:{ref}".encode()
-        commit_hash = hashlib.sha1(hash_input).hexdigest()
-        return commit_hash
+        return self._generate_commit_hash(f"{repo_path}:{ref}")
+
+    def batch_resolve_refs(self, repo_path: str, refs: list[str]) -> dict[str, str | None]:
+        """Resolve many git refs at once.
+
+        Args:
+            repo_path: Path to git repository
+            refs: Git references
+
+        Returns:
+            Mapping of each ref to its commit hash, or None if not found
+        """
+        resolved: dict[str, str | None] = {}
+        for ref in refs:
+            try:
+                resolved[ref] = self.resolve_ref(repo_path, ref)
+            except ValueError:
+                resolved[ref] = None
+        return resolved
 
     # Test helpers below
 
@@ -176,6 +204,30 @@ class FakeGitOperations:
         """
         return len(self._fetch_calls)
 
+    def get_fetch_all_count(self) -> int:
+        """Get number of fetch_all calls (test helper).
+
+        Returns:
+            Total number of fetch_all calls
+        """
+        return len(self._fetch_all_calls)
+
+    def get_fetch_ref_calls(self) -> list[tuple[str, str]]:
+        """Get fetch_ref call history (test helper).
+
+        Returns:
+            List of (repo_path, ref) tuples in call order
+        """
+        return list(self._fetch_ref_calls)
+
+    def configure_fetch_ref_failure(self, repo_path: str) -> None:
+        """Configure fetch_ref to fail for a repository (test helper).
+
+        Args:
+            repo_path: Repository path whose single-ref fetch should fail
+        """
+        self._fetch_ref_failures.add(repo_path)
+
     def get_cloned_repos(self) -> dict[str, tuple[str, str]]:
         """Get all cloned repositories (test helper).
 
@@ -193,6 +245,8 @@ class FakeGitOperations:
         Raises:
             DependencyResolutionError: If repository doesn't exist
         """
+        self._fetch_all_calls.append(repo_path)
+
         # Must be a known repository or submodule
         if repo_path not in self._cloned_repos and repo_path not in self._submodules:
             raise DependencyResolutionError(
@@ -205,6 +259,32 @@ class FakeGitOperations:
         # Note: For submodules, the configured refs via configure_ref() will be used
         # when resolving refs like "origin/main"
 
+    def fetch_ref(self, repo_path: str, ref: str) -> None:
+        """Fetch a single ref from remote without checking out (fake).
+
+        Args:
+            repo_path: Path to existing git repository
+            ref: Git reference to fetch
+
+        Raises:
+            DependencyResolutionError: If repository doesn't exist or
+                failure was configured
+        """
+        self._fetch_ref_calls.append((repo_path, ref))
+
+        # Must be a known repository or submodule
+        if repo_path not in self._cloned_repos and repo_path not in self._submodules:
+            raise DependencyResolutionError(
+                dependency_name=repo_path,
+                reason="Not a git repository",
+            )
+
+        if repo_path in self._fetch_ref_failures:
+            raise DependencyResolutionError(
+                dependency_name=repo_path,
+                reason=f"couldn't find remote ref {ref}",
+            )
+
     def checkout(self, repo_path: str, ref: str) -> None:
         """Checkout a specific ref in a repository (fake).
 
@@ -228,7 +308,7 @@ class FakeGitOperations:
             )
 
         # Determine the commit hash for this checkout
-        if len(ref) == 40 and all(c in "0123456789abcdef" for c in ref):
+        if _FULL_COMMIT_PATTERN.fullmatch(ref):
             # Direct commit hash
             commit = ref
         else:
@@ -305,6 +385,9 @@ class FakeGitOperations:
         self._cloned_repos.clear()
         self._clone_calls.clear()
         self._fetch_calls.clear()
+        self._fetch_all_calls.clear()
+        self._fetch_ref_calls.clear()
+        self._fetch_ref_failures.clear()
         self._checkout_calls.clear()
         self._should_fail.clear()
         self._refs.clear()
@@ -313,11 +396,15 @@ class FakeGitOperations:
         self._submodules.clear()
         self._add_submodule_calls.clear()
         self._update_submodule_calls.clear()
+        self._init_submodule_calls.clear()
         self._remove_submodule_calls.clear()
+        self._is_submodule_calls.clear()
+        self._list_submodules_calls = 0
         self._submodule_branches.clear()
         self._worktrees.clear()
         self._add_worktree_calls.clear()
         self._remove_worktree_calls.clear()
+        self._reset_worktree_calls.clear()
 
     def configure_working_directory_clean(self, repo_path: str, is_clean: bool) -> None:
         """Configure whether a working directory should appear clean (test helper).
@@ -409,6 +496,34 @@ class FakeGitOperations:
             "status": info["status"],
         }
 
+    def list_submodules(self) -> dict[str, dict[str, str]]:
+        """Get status info for every submodule (fake).
+
+        Returns:
+            Dictionary mapping submodule path to 'commit' and 'status'
+        """
+        self._list_submodules_calls += 1
+        return {
+            path: {
+                "commit": self._current_commits.get(path, info["commit"]),
+                "status": info["status"],
+            }
+            for path, info in self._submodules.items()
+        }
+
+    def init_submodule(self, path: str) -> None:
+        """Register a submodule (fake).
+
+        Args:
+            path: Path to the submodule
+
+        Raises:
+            ValueError: If no submodule is recorded at path
+        """
+        self._init_submodule_calls.append(path)
+        if path not in self._submodules:
+            raise ValueError(f"No submodule at {path}")
+
     def sync_submodule(self, path: str) -> None:
         """Sync submodule URL (fake no-op).
 
@@ -449,6 +564,7 @@ class FakeGitOperations:
         Returns:
             True if path is a registered submodule
         """
+        self._is_submodule_calls.append(path)
         return path in self._submodules
 
     def is_working_directory_clean(self, repo_path: str) -> bool:
@@ -485,6 +601,23 @@ class FakeGitOperations:
         # Record worktree
         self._worktrees[worktree_path] = commit
 
+    def reset_worktree(self, worktree_path: str, commit: str) -> None:
+        """Reset a worktree to a commit and delete untracked files (fake).
+
+        Args:
+            worktree_path: Path to existing worktree
+            commit: Git commit hash to reset to
+
+        Raises:
+            ValueError: If worktree doesn't exist
+        """
+        self._reset_worktree_calls.append((worktree_path, commit))
+
+        if worktree_path not in self._worktrees:
+            raise ValueError(f"Not a worktree: {worktree_path}")
+
+        self._worktrees[worktree_path] = commit
+
     def remove_worktree(self, repo_path: str, worktree_path: str) -> None:
         """Remove a git worktree (fake).
 
@@ -540,6 +673,14 @@ class FakeGitOperations:
         """
         return self._update_submodule_calls.copy()
 
+    def get_init_submodule_calls(self) -> list[str]:
+        """Get all init_submodule calls.
+
+        Returns:
+            List of submodule paths
+        """
+        return self._init_submodule_calls.copy()
+
     def get_remove_submodule_calls(self) -> list[str]:
         """Get all remove_submodule calls.
 
@@ -548,6 +689,22 @@ class FakeGitOperations:
         """
         return self._remove_submodule_calls.copy()
 
+    def get_is_submodule_calls(self) -> list[str]:
+        """Get all is_submodule calls.
+
+        Returns:
+            List of checked paths
+        """
+        return self._is_submodule_calls.copy()
+
+    def get_list_submodules_count(self) -> int:
+        """Get number of list_submodules calls.
+
+        Returns:
+            Total number of list_submodules calls
+        """
+        return self._list_submodules_calls
+
     def _generate_commit_hash(self, seed: str) -> str:
         """Generate a deterministic fake commit hash.
 
@@ -557,7 +714,6 @@ class FakeGitOperations:
         Returns:
             40-character hex string
         """
-        import hashlib
         return hashlib.sha1(seed.encode()).hexdigest()
 
     # Worktree test helpers
@@ -610,3 +766,11 @@ class FakeGitOperations:
             List of (repo_path, worktree_path) tuples
         """
         return self._remove_worktree_calls.copy()
+
+    def get_reset_worktree_calls(self) -> list[tuple[str, str]]:
+        """Get all reset_worktree calls.
+
+        Returns:
+            List of (worktree_path, commit) tuples
+        """
+        return self._reset_worktree_calls.copy()
@@ -2,6 +2,8 @@
 
 from datetime import UTC, datetime
 
+from graft.domain.snapshot import SNAPSHOT_ID_PREFIX, SnapshotInfo, is_snapshot_id
+
 
 class FakeSnapshot:
     """In-memory snapshot implementation for testing.
@@ -92,6 +94,39 @@ class FakeSnapshot:
         """
         return sorted(self._snapshots.keys(), reverse=True)
 
+    def list_snapshot_info(self) -> list[SnapshotInfo]:
+        """List all snapshots with their metadata.
+
+        Returns:
+            SnapshotInfo for every snapshot, newest first; size is the
+            total length of the stored contents. IDs without a timestamp
+            are skipped, as in the filesystem implementation.
+        """
+        return [
+            SnapshotInfo.from_id(
+                snapshot_id,
+                size_bytes=sum(len(c.encode()) for c in self._snapshots[snapshot_id].values()),
+            )
+            for snapshot_id in self.list_snapshots()
+            if is_snapshot_id(snapshot_id)
+        ]
+
+    def add_snapshot(self, created_at: datetime, files: dict[str, str]) -> str:
+        """Store a snapshot taken at a given time.
+
+        Helper method for testing retention policies.
+
+        Args:
+            created_at: Creation time to encode in the snapshot ID
+            files: Snapshotted file contents (path -> content)
+
+        Returns:
+            Snapshot ID
+        """
+        snapshot_id = f"{SNAPSHOT_ID_PREFIX}{int(created_at.timestamp() * 1000000)}"
+        self._snapshots[snapshot_id] = dict(files)
+        return snapshot_id
+
     def set_file_content(self, path: str, content: str) -> None:
         """Set file content in fake filesystem.
 
@@ -0,0 +1,21 @@
+"""Pytest configuration for integration tests."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at a per-test directory.
+
+    Graft caches under ~/.cache/graft/, so integration tests would otherwise
+    leave files in the developer's home directory.
+
+    Returns:
+        The temporary home directory
+    """
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return home
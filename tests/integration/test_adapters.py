@@ -3,12 +3,14 @@
 Tests using real adapter implementations (not fakes).
 """
 
+import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from graft.adapters.command_executor import SubprocessCommandExecutor
+from graft.adapters.git import SubprocessGitOperations
 from graft.adapters.lock_file import YamlLockFile
 from graft.adapters.repository import InMemoryRepository
 from graft.domain.entities import Entity
@@ -313,6 +315,61 @@ class TestYamlLockFile:
         assert "dep1" in entries
         assert "dep2" in entries
 
+    def test_repeated_reads_reuse_parsed_entries(
+        self, lock_file: YamlLockFile, temp_lock_path: str
+    ) -> None:
+        """Should serve unchanged lock files from the read cache."""
+        entry = LockEntry(
+            source="git@github.com:org/repo1.git",
+            ref="v1.0.0",
+            commit="a" * 40,
+            consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        lock_file.write_lock_file(temp_lock_path, {"dep1": entry})
+
+        first = lock_file.read_lock_file(temp_lock_path)
+        first["mutated"] = entry  # Callers get their own dict
+        second = lock_file.read_lock_file(temp_lock_path)
+
+        assert list(second) == ["dep1"]
+        assert second["dep1"] is first["dep1"]
+
+    def test_read_sees_rewritten_file(
+        self, lock_file: YamlLockFile, temp_lock_path: str
+    ) -> None:
+        """Should not return stale entries after the file is rewritten."""
+        entry = LockEntry(
+            source="git@github.com:org/repo1.git",
+            ref="v1.0.0",
+            commit="a" * 40,
+            consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        lock_file.write_lock_file(temp_lock_path, {"dep1": entry})
+        lock_file.read_lock_file(temp_lock_path)
+
+        # Rewrite outside the adapter so the cache isn't told
+        content = Path(temp_lock_path).read_text()
+        Path(temp_lock_path).write_text(content.replace("dep1:", "renamed-dep:"))
+
+        assert set(lock_file.read_lock_file(temp_lock_path)) == {"renamed-dep"}
+
+    def test_read_cache_shared_across_instances(
+        self, lock_file: YamlLockFile, temp_lock_path: str
+    ) -> None:
+        """Should reuse a parse made by another adapter instance."""
+        entry = LockEntry(
+            source="git@github.com:org/repo1.git",
+            ref="v1.0.0",
+            commit="a" * 40,
+            consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        lock_file.write_lock_file(temp_lock_path, {"dep1": entry})
+
+        first = lock_file.read_lock_file(temp_lock_path)
+        second = YamlLockFile().read_lock_file(temp_lock_path)
+
+        assert second["dep1"] is first["dep1"]
+
     def test_lock_file_exists(
         self, lock_file: YamlLockFile, temp_lock_path: str
     ) -> None:
@@ -509,3 +566,57 @@ class TestSubprocessCommandExecutor:
 
         # Type checker should accept this without error
         assert protocol_executor is not None
+
+
+class TestSubprocessGitBatchResolveRefs:
+    """Integration tests for SubprocessGitOperations.batch_resolve_refs."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """Create a repository with one commit tagged v1.0.0."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for cmd in (
+            ["git", "init", "-b", "main"],
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com",
+             "commit", "--allow-empty", "-m", "Initial commit"],
+            ["git", "tag", "v1.0.0"],
+        ):
+            subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+        return repo
+
+    def test_resolves_known_and_missing_refs(self, repo: Path) -> None:
+        """Should match resolve_ref for known refs and map missing ones to None."""
+        git = SubprocessGitOperations()
+        head = git.resolve_ref(str(repo), "HEAD")
+
+        resolved = git.batch_resolve_refs(str(repo), ["main", "v1.0.0", "v9.9.9"])
+
+        assert resolved == {"main": head, "v1.0.0": head, "v9.9.9": None}
+
+    def test_invalid_repository_raises(self, tmp_path: Path) -> None:
+        """Should raise ValueError outside a git repository."""
+        with pytest.raises(ValueError):
+            SubprocessGitOperations().batch_resolve_refs(str(tmp_path), ["main"])
+
+    def test_resolves_refs_in_sha256_repository(self, tmp_path: Path) -> None:
+        """Should accept 64-character object names from SHA-256 repositories."""
+        repo = tmp_path / "sha256-repo"
+        repo.mkdir()
+        for cmd in (
+            ["git", "init", "-b", "main", "--object-format=sha256"],
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com",
+             "commit", "--allow-empty", "-m", "Initial commit"],
+        ):
+            subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+
+        resolved = SubprocessGitOperations().batch_resolve_refs(
+            str(repo), ["main", "missing"]
+        )
+
+        assert len(head) == 64
+        assert resolved == {"main": head, "missing": None}
@@ -1,11 +1,13 @@
 """Integration tests for filesystem snapshot adapter."""
 
 import tempfile
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from graft.adapters.snapshot import FilesystemSnapshot
+from graft.services.snapshot_service import cleanup_old_snapshots
 
 
 class TestFilesystemSnapshot:
@@ -145,6 +147,41 @@ class TestFilesystemSnapshot:
 
         assert snapshots == []
 
+    def test_list_snapshot_info_reports_age_and_size(self, snapshot, temp_dir):
+        """Should report creation time and stored size for each snapshot."""
+        (Path(temp_dir) / "graft.lock").write_text("x" * 100)
+
+        before = datetime.now(UTC)
+        snapshot_id = snapshot.create_snapshot(["graft.lock"], temp_dir)
+
+        [info] = snapshot.list_snapshot_info()
+        assert info.snapshot_id == snapshot_id
+        assert info.size_bytes == 100
+        assert abs(info.created_at - before) < timedelta(seconds=5)
+
+    def test_list_snapshot_info_skips_stray_directories(self, snapshot, temp_dir):
+        """Should ignore snapshot-named directories without a timestamp ID."""
+        (Path(temp_dir) / "graft.lock").write_text("x")
+        snapshot_id = snapshot.create_snapshot(["graft.lock"], temp_dir)
+        (Path(snapshot._snapshot_dir) / "snapshot-foo").mkdir()
+
+        assert [info.snapshot_id for info in snapshot.list_snapshot_info()] == [snapshot_id]
+
+    @pytest.mark.parametrize("max_age_days", [None, 365])
+    def test_cleanup_ignores_stray_directories(self, snapshot, temp_dir, max_age_days):
+        """Should neither count nor delete directories without a timestamp ID."""
+        (Path(temp_dir) / "graft.lock").write_text("x")
+        old_id = snapshot.create_snapshot(["graft.lock"], temp_dir)
+        new_id = snapshot.create_snapshot(["graft.lock"], temp_dir)
+        stray = Path(snapshot._snapshot_dir) / "snapshot-foo"
+        stray.mkdir()
+
+        deleted = cleanup_old_snapshots(snapshot, keep_count=1, max_age_days=max_age_days)
+
+        assert deleted == [old_id]
+        assert snapshot.snapshot_exists(new_id)
+        assert stray.is_dir()
+
     def test_snapshot_preserves_file_metadata(self, snapshot, temp_dir):
         """Should preserve file modification time."""
         # Create test file
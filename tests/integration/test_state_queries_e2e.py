@@ -16,6 +16,9 @@ from pathlib import Path
 
 import pytest
 
+from graft.adapters.git import SubprocessGitOperations
+from graft.services.state_service import WorktreePool
+
 
 @pytest.fixture
 def git_repo_with_state_queries():
@@ -391,6 +394,42 @@ class TestTemporalQueries:
         assert output["data"]["status"] == "ok"
         assert output["metadata"]["commit_hash"] == prev_commit
 
+    def test_pooled_worktree_drops_artifacts_between_commits(self, git_repo_with_state_queries):
+        """Should not carry files written at one commit into a query at another."""
+        repo_dir = git_repo_with_state_queries
+        commits = subprocess.run(
+            ["git", "rev-list", "--reverse", "HEAD"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        (repo_dir / ".gitignore").write_text("*.out\n")
+        subprocess.run(["git", "add", ".gitignore"], cwd=repo_dir, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Ignore outputs"],
+            cwd=repo_dir,
+            check=True,
+            capture_output=True,
+        )
+        commit_a = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo_dir, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        commit_b = commits[0]
+
+        with WorktreePool(SubprocessGitOperations()) as pool:
+            worktree = Path(pool.acquire(str(repo_dir), commit_a))
+            (worktree / "coverage.out").write_text("ignored artifact")
+            (worktree / "build").mkdir()
+            (worktree / "build" / "output.json").write_text("untracked artifact")
+            (worktree / "graft.yaml").write_text("modified")
+
+            assert Path(pool.acquire(str(repo_dir), commit_b)) == worktree
+            assert sorted(p.name for p in worktree.iterdir() if p.name != ".git") == [
+                "graft.yaml"
+            ]
+            assert "new-query" not in (worktree / "graft.yaml").read_text()
+
     def test_query_at_head_notation(self, git_repo_with_state_queries):
         """Should support HEAD~N notation."""
         result = subprocess.run(
@@ -3,7 +3,9 @@
 End-to-end tests for git submodule functionality.
 """
 
+import json
 import os
+import shutil
 import subprocess
 import tempfile
 from datetime import UTC, datetime
@@ -24,37 +26,15 @@ from graft.services.dependency_context import DependencyContext
 def enable_file_protocol():
     """Enable file:// protocol for git submodules in tests.
 
-    This is a module-scoped fixture that saves and restores the global
-    git config to avoid polluting the user's environment.
+    Set through git's environment config rather than the global config,
+    which lives under the per-test HOME and must not be touched in the
+    user's environment.
     """
-    # Check current value
-    result = subprocess.run(
-        ["git", "config", "--global", "protocol.file.allow"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    original_value = result.stdout.strip() if result.returncode == 0 else None
-
-    # Set to 'always' for tests
-    subprocess.run(
-        ["git", "config", "--global", "protocol.file.allow", "always"],
-        check=True,
-    )
-
-    yield
-
-    # Restore original value
-    if original_value is None:
-        subprocess.run(
-            ["git", "config", "--global", "--unset", "protocol.file.allow"],
-            check=False,
-        )
-    else:
-        subprocess.run(
-            ["git", "config", "--global", "protocol.file.allow", original_value],
-            check=False,
-        )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_COUNT", "1")
+        mp.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+        mp.setenv("GIT_CONFIG_VALUE_0", "always")
+        yield
 
 
 def _create_test_repo(path: Path, branch: str = "main") -> str:
@@ -564,3 +544,228 @@ class TestCloneBasedResolution:
 
             finally:
                 os.chdir(original_cwd)
+
+    def test_clone_at_commit_sha(self):
+        """Test that clone-based resolution accepts a commit SHA as ref."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+
+            # Create dependency repo with a second commit after the pinned one
+            dep_repo = tmpdir / "dep-repo"
+            commit = _create_test_repo(dep_repo)
+            (dep_repo / "CHANGELOG.md").write_text("later")
+            subprocess.run(["git", "add", "."], cwd=dep_repo, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", "Later commit"],
+                cwd=dep_repo,
+                check=True,
+                capture_output=True,
+            )
+
+            project_dir = tmpdir / "projects" / "myproject"
+            _init_project_repo(project_dir)
+
+            deps_dir = tmpdir / "shared-deps"
+            deps_dir.mkdir()
+
+            original_cwd = os.getcwd()
+            os.chdir(project_dir)
+
+            try:
+                ctx = DependencyContext(
+                    filesystem=RealFilesystem(),
+                    git=SubprocessGitOperations(),
+                    deps_directory=str(deps_dir),
+                )
+
+                spec = DependencySpec(
+                    name="test-dep",
+                    git_url=GitUrl(f"file://{dep_repo}"),
+                    git_ref=GitRef(commit),
+                )
+
+                resolution = resolution_service.resolve_dependency(ctx, spec)
+
+                assert resolution.status == DependencyStatus.RESOLVED, resolution.error_message
+                assert ctx.git.get_current_commit(str(deps_dir / "test-dep")) == commit
+                assert (deps_dir / "test-dep" / "README.md").exists()
+                assert not (deps_dir / "test-dep" / "CHANGELOG.md").exists()
+
+            finally:
+                os.chdir(original_cwd)
+
+    def test_resolve_all_links_custom_deps_into_graft_dir(self):
+        """Test that each clone outside the repo gets a .graft/<name> symlink."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+
+            dep_repos = {name: tmpdir / f"{name}-repo" for name in ["dep1", "dep2"]}
+            for repo in dep_repos.values():
+                _create_test_repo(repo)
+
+            project_dir = tmpdir / "projects" / "myproject"
+            _init_project_repo(project_dir)
+
+            deps_dir = tmpdir / "shared-deps"
+            deps_dir.mkdir()
+
+            original_cwd = os.getcwd()
+            os.chdir(project_dir)
+
+            try:
+                ctx = DependencyContext(
+                    filesystem=RealFilesystem(),
+                    git=SubprocessGitOperations(),
+                    deps_directory=str(deps_dir),
+                )
+                config = GraftConfig(
+                    api_version="graft/v0",
+                    dependencies={
+                        name: DependencySpec(
+                            name=name,
+                            git_url=GitUrl(f"file://{repo}"),
+                            git_ref=GitRef("main"),
+                        )
+                        for name, repo in dep_repos.items()
+                    },
+                )
+
+                resolutions = resolution_service.resolve_all_dependencies(ctx, config)
+
+                for resolution in resolutions:
+                    assert resolution.status == DependencyStatus.RESOLVED, resolution.error_message
+                    link = project_dir / ".graft" / resolution.name
+                    assert link.is_symlink()
+                    assert not os.path.isabs(os.readlink(link))
+                    assert link.resolve() == (deps_dir / resolution.name).resolve()
+                    assert resolution.symlink_path == str(link)
+
+            finally:
+                os.chdir(original_cwd)
+
+
+class TestSubmoduleSupportCache:
+    """Test that the submodule-support check persists across invocations."""
+
+    def _detect(self, deps_directory: str) -> bool:
+        # Drop the in-process memo to simulate a fresh CLI invocation
+        resolution_service._submodule_support_cache.clear()
+        return resolution_service._can_use_submodules(deps_directory, os.getcwd())
+
+    def _cache_file(self) -> Path:
+        return Path(resolution_service._submodule_support_cache_path(os.getcwd()))
+
+    def test_result_written_to_user_cache(self, isolated_home: Path):
+        """Test that the first detection is stored outside the project."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir = Path(tmpdir) / "myproject"
+            _init_project_repo(project_dir)
+            (project_dir / ".graft").mkdir()
+
+            original_cwd = os.getcwd()
+            os.chdir(project_dir)
+
+            try:
+                assert self._detect(".graft") is True
+
+                cache_file = self._cache_file()
+                assert cache_file.is_relative_to(isolated_home / ".cache" / "graft")
+                cache = json.loads(cache_file.read_text())
+                entry = cache["submodule_support"][".graft"]
+                assert entry["can_use_submodules"] is True
+                assert entry["repo_root"] == os.path.realpath(project_dir)
+                assert os.listdir(project_dir / ".graft") == []
+
+            finally:
+                os.chdir(original_cwd)
+
+    def test_warm_run_uses_cached_result(self):
+        """Test that a valid cache entry answers without running git."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir = Path(tmpdir) / "myproject"
+            _init_project_repo(project_dir)
+
+            original_cwd = os.getcwd()
+            os.chdir(project_dir)
+
+            try:
+                self._detect(".graft")
+
+                # Flip the stored answer; only a cache read can return it
+                cache_file = self._cache_file()
+                cache = json.loads(cache_file.read_text())
+                cache["submodule_support"][".graft"]["can_use_submodules"] = False
+                cache_file.write_text(json.dumps(cache))
+
+                assert self._detect(".graft") is False
+
+            finally:
+                os.chdir(original_cwd)
+
+    def test_cache_ignored_when_repository_removed(self):
+        """Test that a cached answer is dropped once its repo root is gone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir = Path(tmpdir) / "myproject"
+            _init_project_repo(project_dir)
+
+            original_cwd = os.getcwd()
+            os.chdir(project_dir)
+
+            try:
+                assert self._detect(".graft") is True
+
+                shutil.rmtree(project_dir / ".git")
+
+                assert self._detect(".graft") is False
+
+            finally:
+                os.chdir(original_cwd)
+
+
+class TestGraftDirSymlinks:
+    """Test .graft/<name> symlinks for custom deps directories."""
+
+    def test_existing_link_is_replaced(self):
+        """Test that a stale link is swapped for one to the new checkout."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            (tmpdir / "old" / "dep").mkdir(parents=True)
+            (tmpdir / "new" / "dep").mkdir(parents=True)
+            (tmpdir / ".graft").mkdir()
+            (tmpdir / ".graft" / "dep").symlink_to("../old/dep")
+
+            original_cwd = os.getcwd()
+            os.chdir(tmpdir)
+
+            try:
+                link = resolution_service._create_symlink_if_needed(
+                    "new", "dep", str(tmpdir / "new" / "dep")
+                )
+
+                assert link == str(tmpdir / ".graft" / "dep")
+                assert os.readlink(tmpdir / ".graft" / "dep") == "../new/dep"
+                assert sorted(os.listdir(tmpdir / ".graft")) == ["dep"]
+
+            finally:
+                os.chdir(original_cwd)
+
+    def test_real_directory_is_not_overwritten(self):
+        """Test that a non-symlink entry in .graft is left alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            (tmpdir / "new" / "dep").mkdir(parents=True)
+            (tmpdir / ".graft" / "dep").mkdir(parents=True)
+
+            original_cwd = os.getcwd()
+            os.chdir(tmpdir)
+
+            try:
+                link = resolution_service._create_symlink_if_needed(
+                    "new", "dep", str(tmpdir / "new" / "dep")
+                )
+
+                assert link is None
+                assert not (tmpdir / ".graft" / "dep").is_symlink()
+
+            finally:
+                os.chdir(original_cwd)
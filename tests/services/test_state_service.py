@@ -10,10 +10,13 @@ import pytest
 from graft.domain.state import StateCache, StateQuery
 from graft.services.dependency_context import DependencyContext
 from graft.services.state_service import (
+    WorktreePool,
+    _direct_argv,
     execute_state_query,
     execute_temporal_query,
     get_cache_path,
     get_state,
+    get_states,
     invalidate_cached_state,
     read_cached_state,
     write_cached_state,
@@ -102,6 +105,123 @@ class TestCacheOperations:
         assert cached.deterministic is True
         assert cached.cached is True  # Loaded from cache
 
+    def test_rewritten_cache_is_not_served_from_memory(
+        self, dependency_context: DependencyContext
+    ):
+        """Test repeat reads are memoized but see results written later."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        def make_result(value: int) -> StateResult:
+            return StateResult(
+                query_name="memo-query",
+                commit_hash="abc123def",
+                data={"value": value},
+                timestamp=datetime.now(UTC),
+                command="echo test",
+                deterministic=True,
+            )
+
+        def read() -> StateResult | None:
+            return read_cached_state(
+                dependency_context, "test-workspace", "test-repo", "memo-query", "abc123def"
+            )
+
+        write_cached_state(dependency_context, "test-workspace", "test-repo", make_result(1))
+        first = read()
+        assert first is not None
+        assert read() is first
+
+        write_cached_state(dependency_context, "test-workspace", "test-repo", make_result(2))
+        second = read()
+        assert second is not None
+        assert second.data == {"value": 2}
+
+    def test_written_result_is_read_from_memory(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test a read right after a write doesn't go back to disk."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        workspace = f"memo-{tmp_path.name}"
+        result = StateResult(
+            query_name="written",
+            commit_hash="abc123def",
+            data={"value": 1},
+            timestamp=datetime.now(UTC),
+            command="echo test",
+            deterministic=True,
+        )
+        write_cached_state(dependency_context, workspace, "test-repo", result)
+        get_cache_path(
+            dependency_context, workspace, "test-repo", "written", "abc123def"
+        ).unlink()
+
+        cached = read_cached_state(dependency_context, workspace, "test-repo", "written", "abc123def")
+
+        assert cached is not None
+        assert cached.data == {"value": 1}
+        assert cached.cached is True
+
+        invalidate_cached_state(dependency_context, workspace, "test-repo")
+
+    def test_memoized_write_is_independent_of_caller_data(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test changing the written result's data doesn't change cache hits."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        workspace = f"memo-copy-{tmp_path.name}"
+        result = StateResult(
+            query_name="written",
+            commit_hash="abc123def",
+            data={"value": 1},
+            timestamp=datetime.now(UTC),
+            command="echo test",
+            deterministic=True,
+        )
+        write_cached_state(dependency_context, workspace, "test-repo", result)
+        result.data["value"] = 2
+
+        cached = read_cached_state(dependency_context, workspace, "test-repo", "written", "abc123def")
+
+        assert cached is not None
+        assert cached.data == {"value": 1}
+
+        invalidate_cached_state(dependency_context, workspace, "test-repo")
+
+    def test_write_leaves_only_cache_file(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test the temporary file used for the atomic write is renamed away."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        workspace = f"atomic-{tmp_path.name}"
+        result = StateResult(
+            query_name="atomic",
+            commit_hash="abc123def",
+            data={"value": 1},
+            timestamp=datetime.now(UTC),
+            command="echo test",
+            deterministic=True,
+        )
+        write_cached_state(dependency_context, workspace, "test-repo", result)
+
+        cache_path = get_cache_path(
+            dependency_context, workspace, "test-repo", "atomic", "abc123def"
+        )
+        assert sorted(p.name for p in cache_path.parent.iterdir()) == ["abc123def.json"]
+        assert json.loads(cache_path.read_text())["data"] == {"value": 1}
+
+        invalidate_cached_state(dependency_context, workspace, "test-repo")
+
     def test_read_cache_nonexistent(self, dependency_context: DependencyContext):
         """Test reading nonexistent cache returns None."""
         cached = read_cached_state(
@@ -114,6 +234,42 @@ class TestCacheOperations:
 
         assert cached is None
 
+    def test_invalidate_missing_cache_returns_zero(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test invalidating a cache that was never written deletes nothing."""
+        workspace = f"missing-{tmp_path.name}"
+
+        assert invalidate_cached_state(dependency_context, workspace, "repo", "query") == 0
+        assert invalidate_cached_state(dependency_context, workspace, "repo", None) == 0
+
+    def test_invalidate_counts_deleted_cache_files(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test invalidation reports the exact number of cache files deleted."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        workspace = f"count-{tmp_path.name}"
+        for query_name, commit in [("q1", "a" * 40), ("q1", "b" * 40), ("q2", "a" * 40)]:
+            write_cached_state(
+                dependency_context,
+                workspace,
+                "repo",
+                StateResult(
+                    query_name=query_name,
+                    commit_hash=commit,
+                    data={},
+                    timestamp=datetime.now(UTC),
+                    command="echo {}",
+                    deterministic=True,
+                ),
+            )
+
+        assert invalidate_cached_state(dependency_context, workspace, "repo", "q1") == 2
+        assert invalidate_cached_state(dependency_context, workspace, "repo", None) == 1
+
     def test_invalidate_specific_query(self, dependency_context: DependencyContext):
         """Test invalidating cache for specific query."""
         from datetime import UTC, datetime
@@ -269,6 +425,27 @@ class TestExecuteStateQuery:
         with pytest.raises(ValueError, match="must output a JSON object"):
             execute_state_query(dependency_context, query, str(repo_path), "abc123")
 
+    def test_execute_query_with_projection(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test query output is reduced to the projected fields."""
+        repo_path = tmp_path / "test-repo"
+        repo_path.mkdir()
+        (repo_path / "report.json").write_text(
+            json.dumps({"totals": {"covered": 10, "missing": 2}, "files": {"a.py": {}}})
+        )
+
+        query = StateQuery(
+            name="coverage",
+            run="cat report.json",
+            cache=StateCache(deterministic=True),
+            projection=("totals.covered", "absent.field"),
+        )
+
+        result = execute_state_query(dependency_context, query, str(repo_path), "abc123")
+
+        assert result.data == {"totals": {"covered": 10}}
+
     def test_execute_query_command_failure(self, dependency_context: DependencyContext, tmp_path: Path):
         """Test query with failing command raises error."""
         repo_path = tmp_path / "test-repo"
@@ -283,6 +460,94 @@ class TestExecuteStateQuery:
         with pytest.raises(subprocess.CalledProcessError):
             execute_state_query(dependency_context, query, str(repo_path), "abc123")
 
+    def test_execute_query_failure_output_is_text(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test failing query exposes decoded stdout/stderr on the error."""
+        repo_path = tmp_path / "test-repo"
+        repo_path.mkdir()
+
+        query = StateQuery(
+            name="failing",
+            run="echo out; echo err >&2; exit 1",
+            cache=StateCache(deterministic=True),
+        )
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            execute_state_query(dependency_context, query, str(repo_path), "abc123")
+
+        assert exc_info.value.stdout == "out\n"
+        assert exc_info.value.stderr == "err\n"
+
+
+class TestDirectExecution:
+    """Tests for running simple state query commands without a shell."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "cat report.json | head -1",
+            "echo '{}'",
+            "exit 1",
+            "FOO=1 env",
+            "./report.sh",
+            "graft-no-such-command",
+            "true\nfalse",
+        ],
+    )
+    def test_shell_syntax_uses_shell(self, command: str):
+        """Test commands relying on the shell are not split."""
+        assert _direct_argv(command, ".") is None
+
+    def test_plain_command_runs_directly(self):
+        """Test a plain program invocation is split into arguments."""
+        assert _direct_argv("git log -1 --format=%H", ".") == (
+            "git", "log", "-1", "--format=%H"
+        )
+
+    def test_program_lookup_follows_path_and_repo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the program lookup uses the current PATH relative to the repo."""
+        tool = tmp_path / "repo" / "bin" / "graft-test-tool"
+        tool.parent.mkdir(parents=True)
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+
+        monkeypatch.setenv("PATH", "/nonexistent")
+        assert _direct_argv("graft-test-tool", str(tmp_path / "repo")) is None
+
+        monkeypatch.setenv("PATH", "bin")
+        assert _direct_argv("graft-test-tool", str(tmp_path / "repo")) == ("graft-test-tool",)
+        assert _direct_argv("graft-test-tool", str(tmp_path)) is None
+
+    def test_exec_failure_raises_called_process_error(
+        self,
+        dependency_context: DependencyContext,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a program that cannot be executed fails like the shell would."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        tool = bin_dir / "graft-broken-tool"
+        tool.write_text("#!/nonexistent/interpreter\n")
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        query = StateQuery(
+            name="broken",
+            run="graft-broken-tool",
+            cache=StateCache(deterministic=True),
+        )
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            execute_state_query(dependency_context, query, str(repo_path), "abc123")
+
+        assert exc_info.value.returncode == 127
+
 
 class TestTemporalQueryExecution:
     """Tests for temporal query execution with git worktree."""
@@ -352,6 +617,40 @@ class TestTemporalQueryExecution:
         remove_calls = dependency_context.git.get_remove_worktree_calls()
         assert len(remove_calls) == 1
 
+    def test_execute_temporal_query_reuses_pooled_worktree(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test pooled temporal queries add one worktree and reset it on reuse."""
+        repo_path = str(tmp_path / "repo")
+        dependency_context.git.clone("https://example.com/repo.git", repo_path, "main")
+
+        query = StateQuery(
+            name="test",
+            run='echo \'{"test": "value"}\'',
+            cache=StateCache(deterministic=True),
+        )
+        commit_a = "a" * 40
+        commit_b = "b" * 40
+
+        with WorktreePool(dependency_context.git) as pool:
+            for commit in (commit_a, commit_a, commit_b):
+                result = execute_temporal_query(
+                    dependency_context, query, repo_path, commit, pool=pool
+                )
+                assert result.commit_hash == commit
+
+            worktree_calls = dependency_context.git.get_add_worktree_calls()
+            assert len(worktree_calls) == 1
+            worktree_path = worktree_calls[0][1]
+            assert dependency_context.git.get_reset_worktree_calls() == [
+                (worktree_path, commit_a),
+                (worktree_path, commit_b),
+            ]
+            assert dependency_context.git.get_remove_worktree_calls() == []
+
+        # Closing the pool removes the worktree
+        assert dependency_context.git.get_remove_worktree_calls() == [(repo_path, worktree_path)]
+
 
 class TestGetState:
     """Tests for get_state function with caching."""
@@ -508,3 +807,64 @@ class TestGetState:
         assert len(worktree_calls) == 1
 
         assert result.data == {"historical": True}
+
+
+class TestGetStates:
+    """Tests for batched state queries."""
+
+    def test_get_states_runs_misses_in_one_worktree(
+        self, dependency_context: DependencyContext, tmp_path: Path
+    ):
+        """Test uncached queries share a worktree and results keep query order."""
+        from datetime import UTC, datetime
+
+        from graft.domain.state import StateResult
+
+        repo_path = str(tmp_path / "repo")
+        dependency_context.git.clone("https://example.com/repo.git", repo_path, "main")
+        workspace = f"batch-{tmp_path.name}"
+        commit = "c" * 40
+
+        write_cached_state(
+            dependency_context,
+            workspace,
+            "repo",
+            StateResult(
+                query_name="cached",
+                commit_hash=commit,
+                data={"from": "cache"},
+                timestamp=datetime.now(UTC),
+                command="exit 1",
+                deterministic=True,
+            ),
+        )
+        queries = [
+            StateQuery(name=name, run=run, cache=StateCache(deterministic=True))
+            for name, run in [
+                ("first", 'echo \'{"n": 1}\''),
+                ("cached", "exit 1"),
+                ("second", 'echo \'{"n": 2}\''),
+            ]
+        ]
+
+        results = get_states(
+            dependency_context,
+            queries,
+            workspace_name=workspace,
+            repo_name="repo",
+            repo_path=repo_path,
+            commit_hash=commit,
+            use_worktree=True,
+            max_workers=2,
+        )
+
+        assert [r.data for r in results] == [{"n": 1}, {"from": "cache"}, {"n": 2}]
+        assert len(dependency_context.git.get_add_worktree_calls()) == 1
+        assert len(dependency_context.git.get_remove_worktree_calls()) == 1
+
+        # Fresh deterministic results were cached
+        cached = read_cached_state(dependency_context, workspace, "repo", "second", commit)
+        assert cached is not None
+        assert cached.data == {"n": 2}
+
+        invalidate_cached_state(dependency_context, workspace, "repo")
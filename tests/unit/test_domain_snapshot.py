@@ -0,0 +1,42 @@
+"""Tests for SnapshotInfo domain model."""
+
+import dataclasses
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from graft.domain.snapshot import SnapshotInfo
+
+
+class TestSnapshotInfo:
+    """Tests for SnapshotInfo value object."""
+
+    def test_from_id_decodes_creation_time(self) -> None:
+        """Should take created_at from the microsecond timestamp in the ID."""
+        created = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+        micros = (created - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(microseconds=1)
+        snapshot_id = f"snapshot-{micros}"
+
+        info = SnapshotInfo.from_id(snapshot_id, size_bytes=7)
+
+        assert info.snapshot_id == snapshot_id
+        assert info.created_at == created
+        assert info.size_bytes == 7
+
+    def test_from_id_rejects_foreign_id(self) -> None:
+        """Should raise ValueError for IDs without the snapshot prefix."""
+        with pytest.raises(ValueError, match="Not a snapshot ID"):
+            SnapshotInfo.from_id("backup-123", size_bytes=0)
+
+    @pytest.mark.parametrize("snapshot_id", ["snapshot-foo", "snapshot-", "snapshot--5"])
+    def test_from_id_rejects_non_timestamp_id(self, snapshot_id: str) -> None:
+        """Should raise ValueError for prefixed IDs without a timestamp."""
+        with pytest.raises(ValueError, match="Not a snapshot ID"):
+            SnapshotInfo.from_id(snapshot_id, size_bytes=0)
+
+    def test_is_immutable(self) -> None:
+        """Should be frozen."""
+        info = SnapshotInfo.from_id("snapshot-0", size_bytes=0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.size_bytes = 1  # type: ignore[misc]
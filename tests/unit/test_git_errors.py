@@ -234,3 +234,15 @@ class TestIsRepository:
 
         # Exercise & Verify
         assert git.is_repository(str(non_existent)) is False
+
+    def test_git_file_is_not_a_clone(self, tmp_path):
+        """Should return False when .git is a file rather than a directory.
+
+        Rationale: Submodule checkouts have a .git file pointing at the
+        parent's modules dir; they are not standalone clones.
+        """
+        (tmp_path / ".git").write_text("gitdir: ../.git/modules/dep\n")
+        git = SubprocessGitOperations()
+
+        # Exercise & Verify
+        assert git.is_repository(str(tmp_path)) is False
@@ -141,6 +141,35 @@ class TestUpdateDependencyLock:
         entries = fake_lock_file.read_lock_file("/test/graft.lock")
         assert "new-dep" in entries
 
+    def test_force_overwrite_replaces_existing_entries(
+        self, fake_lock_file: FakeLockFile
+    ) -> None:
+        """Should write a fresh lock file when force_overwrite is set."""
+        # Setup: Lock file with an unrelated dependency
+        existing_entry = LockEntry(
+            source="git@github.com:org/repo1.git",
+            ref="v1.0.0",
+            commit="a" * 40,
+            consumed_at=datetime.now(UTC),
+        )
+        fake_lock_file.write_lock_file("/test/graft.lock", {"dep1": existing_entry})
+
+        # Execute
+        lock_service.update_dependency_lock(
+            fake_lock_file,
+            "/test/graft.lock",
+            "dep2",
+            "git@github.com:org/repo2.git",
+            "v2.0.0",
+            "b" * 40,
+            force_overwrite=True,
+        )
+
+        # Verify: Only the new entry remains
+        entries = fake_lock_file.read_lock_file("/test/graft.lock")
+        assert list(entries) == ["dep2"]
+        assert entries["dep2"].commit == "b" * 40
+
 
 class TestGetAllLockEntries:
     """Tests for get_all_lock_entries function."""
@@ -167,7 +167,7 @@ class TestGetChangesForDependency:
 
     def test_get_all_changes(self, sample_config: GraftConfig) -> None:
         """Should return all changes from config."""
-        changes = query_service.get_changes_for_dependency(sample_config)
+        changes = list(query_service.get_changes_for_dependency(sample_config))
 
         assert len(changes) == 3
         assert changes[0].ref == "v1.1.0"
@@ -188,7 +188,7 @@ class TestGetChangesForDependency:
 
         changes = query_service.get_changes_for_dependency(config)
 
-        assert changes == []
+        assert list(changes) == []
 
 
 class TestFilterChangesByType:
@@ -259,6 +259,31 @@ class TestFilterBreakingChanges:
         assert breaking == []
 
 
+class TestGetChangesByType:
+    """Tests for index-backed get_changes_by_type / get_breaking_changes."""
+
+    def test_matches_filter_over_all_changes(self, sample_config: GraftConfig) -> None:
+        """Should agree with filtering the full change list."""
+        all_changes = query_service.get_changes_for_dependency(sample_config)
+
+        for change_type in ("breaking", "feature", "fix", "nonexistent"):
+            assert query_service.get_changes_by_type(
+                sample_config, change_type
+            ) == query_service.filter_changes_by_type(all_changes, change_type)
+
+    def test_get_breaking_changes(self, sample_config: GraftConfig) -> None:
+        """Should return breaking changes from the index."""
+        breaking = query_service.get_breaking_changes(sample_config)
+
+        assert [c.ref for c in breaking] == ["v2.0.0"]
+
+    def test_result_does_not_alias_index(self, sample_config: GraftConfig) -> None:
+        """Should return a new list so callers cannot corrupt the index."""
+        query_service.get_changes_by_type(sample_config, "fix").clear()
+
+        assert len(query_service.get_changes_by_type(sample_config, "fix")) == 1
+
+
 class TestGetChangeByRef:
     """Tests for get_change_by_ref function."""
 
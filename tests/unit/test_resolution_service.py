@@ -19,10 +19,13 @@ Rationale:
     - Flat-only model (no transitive resolution)
 """
 
+from datetime import UTC, datetime
+
 import pytest
 
 from graft.domain.config import GraftConfig
 from graft.domain.dependency import DependencySpec, DependencyStatus, GitRef, GitUrl
+from graft.domain.lock_entry import LockEntry
 from graft.services import resolution_service
 from graft.services.dependency_context import DependencyContext
 from tests.fakes.fake_filesystem import FakeFileSystem
@@ -120,6 +123,38 @@ class TestResolveDependency:
         assert fake_git.get_fetch_count() == 1
         assert fake_git.get_clone_count() == 0
 
+    def test_existing_clone_at_pinned_commit_skips_fetch(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+        fake_filesystem: FakeFileSystem,
+    ) -> None:
+        """Should not fetch when the clone is already at the pinned SHA.
+
+        Rationale: A commit SHA cannot move, so a checkout already at it
+        is up to date without a network round trip.
+        """
+        # Setup
+        sha = "a" * 40
+        spec = DependencySpec(
+            name="test-repo",
+            git_url=GitUrl("https://github.com/user/repo.git"),
+            git_ref=GitRef(sha[:12]),
+        )
+        fake_filesystem.mkdir("/fake/deps/test-repo")
+        fake_git._cloned_repos["/fake/deps/test-repo"] = (
+            "https://github.com/user/repo.git",
+            sha,
+        )
+        fake_git.configure_current_commit("/fake/deps/test-repo", sha)
+
+        # Exercise
+        resolution = resolution_service.resolve_dependency(full_dependency_context, spec)
+
+        # Verify
+        assert resolution.status == DependencyStatus.RESOLVED
+        assert fake_git.get_fetch_count() == 0
+
     def test_failed_clone_marks_resolution_failed(
         self,
         full_dependency_context: DependencyContext,
@@ -372,6 +407,77 @@ class TestResolveAllDependencies:
         # Verify
         assert len(resolutions) == 0
 
+    def test_parallel_resolution_preserves_order(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should return resolutions in config order when cloning concurrently.
+
+        Rationale: Clone-based deps resolve on a thread pool; callers
+        still rely on results matching graft.yaml order.
+        """
+        # Setup
+        names = [f"dep{i}" for i in range(12)]
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                name: DependencySpec(
+                    name=name,
+                    git_url=GitUrl(f"https://github.com/user/{name}.git"),
+                    git_ref=GitRef("main"),
+                )
+                for name in names
+            },
+        )
+
+        # Exercise
+        resolutions = resolution_service.resolve_all_dependencies(
+            full_dependency_context, config
+        )
+
+        # Verify
+        assert [r.name for r in resolutions] == names
+        assert all(r.status == DependencyStatus.RESOLVED for r in resolutions)
+        assert fake_git.get_clone_count() == len(names)
+
+    def test_existing_paths_detected_from_directory_listing(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_filesystem: FakeFileSystem,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should detect existing dep paths from one listing of deps_directory.
+
+        Rationale: Existence is looked up in a single scan instead of a
+        stat per dependency; the outcome must match the per-path check.
+        """
+        # Setup
+        fake_filesystem.mkdir("/fake/deps/stale", parents=True)
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                name: DependencySpec(
+                    name=name,
+                    git_url=GitUrl(f"https://github.com/user/{name}.git"),
+                    git_ref=GitRef("main"),
+                )
+                for name in ["fresh", "stale"]
+            },
+        )
+
+        # Exercise
+        resolutions = resolution_service.resolve_all_dependencies(
+            full_dependency_context, config
+        )
+
+        # Verify
+        fresh, stale = resolutions
+        assert fresh.status == DependencyStatus.RESOLVED
+        assert stale.status == DependencyStatus.FAILED
+        assert "not a git repository" in stale.error_message
+        assert fake_git.get_clone_count() == 1
+
 
 class TestResolveToLockEntries:
     """Tests for resolve_to_lock_entries service function.
@@ -477,3 +583,248 @@ class TestResolveToLockEntries:
         assert "dep2" in lock_entries
         assert lock_entries["dep1"].ref == "v1.0.0"
         assert lock_entries["dep2"].ref == "v2.0.0"
+
+    def test_existing_submodules_use_batched_index(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should list submodules once instead of checking each path.
+
+        Rationale: One `git submodule status` replaces a per-dependency
+        is_submodule subprocess.
+        """
+        # Setup: Two dependencies already registered as submodules
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                name: DependencySpec(
+                    name=name,
+                    git_url=GitUrl(f"https://github.com/user/{name}.git"),
+                    git_ref=GitRef("v1.0.0"),
+                )
+                for name in ("dep1", "dep2")
+            },
+        )
+        for name in ("dep1", "dep2"):
+            fake_git.add_submodule(
+                f"https://github.com/user/{name}.git", f"/fake/deps/{name}", "v1.0.0"
+            )
+
+        # Exercise
+        lock_entries = resolution_service.resolve_to_lock_entries(
+            full_dependency_context, config
+        )
+
+        # Verify
+        assert fake_git.get_list_submodules_count() == 1
+        assert fake_git.get_is_submodule_calls() == []
+        assert lock_entries["dep1"].commit == fake_git.get_current_commit("/fake/deps/dep1")
+        assert lock_entries["dep2"].commit == fake_git.get_current_commit("/fake/deps/dep2")
+
+    def test_unchanged_pinned_dependency_skips_fetch(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should not fetch when a pinned ref is already at its locked commit.
+
+        Rationale: The network fetch dominates resolve time; a tag whose
+        lock entry still matches the checkout cannot have moved.
+        """
+        # Setup: Submodule checked out at the locked commit
+        url = "https://github.com/user/repo.git"
+        fake_git.add_submodule(url, "/fake/deps/my-dep", "v1.0.0")
+        locked_commit = fake_git.get_current_commit("/fake/deps/my-dep")
+        fake_git.configure_ref("/fake/deps/my-dep", "refs/tags/v1.0.0^{commit}", locked_commit)
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                "my-dep": DependencySpec(
+                    name="my-dep", git_url=GitUrl(url), git_ref=GitRef("v1.0.0")
+                )
+            },
+        )
+        locked = {
+            "my-dep": LockEntry(
+                source=url,
+                ref="v1.0.0",
+                commit=locked_commit,
+                consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+            )
+        }
+
+        # Exercise
+        lock_entries = resolution_service.resolve_to_lock_entries(
+            full_dependency_context, config, locked
+        )
+
+        # Verify
+        assert fake_git.get_fetch_ref_calls() == []
+        assert fake_git.get_fetch_all_count() == 0
+        assert lock_entries["my-dep"].commit == locked_commit
+
+    def test_branch_ref_still_fetches(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should still fetch branches even if the locked commit matches."""
+        # Setup
+        url = "https://github.com/user/repo.git"
+        fake_git.add_submodule(url, "/fake/deps/my-dep", "main")
+        locked_commit = fake_git.get_current_commit("/fake/deps/my-dep")
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                "my-dep": DependencySpec(
+                    name="my-dep", git_url=GitUrl(url), git_ref=GitRef("main")
+                )
+            },
+        )
+        locked = {
+            "my-dep": LockEntry(
+                source=url,
+                ref="main",
+                commit=locked_commit,
+                consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+            )
+        }
+
+        # Exercise
+        resolution_service.resolve_to_lock_entries(full_dependency_context, config, locked)
+
+        # Verify
+        assert fake_git.get_fetch_ref_calls() == [("/fake/deps/my-dep", "main")]
+        assert fake_git.get_fetch_all_count() == 0
+
+    def test_version_like_branch_still_fetches(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should fetch a branch named like a version if no such tag exists.
+
+        Rationale: Maintenance branches are often named "3.11" or "v1.2";
+        only a local tag at the locked commit proves the ref cannot move.
+        """
+        # Setup: "3.11" is a branch, so refs/tags/3.11 does not resolve
+        url = "https://github.com/user/repo.git"
+        fake_git.add_submodule(url, "/fake/deps/my-dep", "3.11")
+        locked_commit = fake_git.get_current_commit("/fake/deps/my-dep")
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                "my-dep": DependencySpec(
+                    name="my-dep", git_url=GitUrl(url), git_ref=GitRef("3.11")
+                )
+            },
+        )
+        locked = {
+            "my-dep": LockEntry(
+                source=url,
+                ref="3.11",
+                commit=locked_commit,
+                consumed_at=datetime(2025, 1, 1, tzinfo=UTC),
+            )
+        }
+
+        # Exercise
+        resolution_service.resolve_to_lock_entries(full_dependency_context, config, locked)
+
+        # Verify
+        assert fake_git.get_fetch_ref_calls() == [("/fake/deps/my-dep", "3.11")]
+
+    def test_failed_ref_fetch_falls_back_to_fetch_all(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should fetch every ref when the single-ref fetch fails.
+
+        Rationale: Some servers refuse fetching a bare ref (e.g. an
+        unadvertised commit); a full fetch is the safe fallback.
+        """
+        # Setup
+        url = "https://github.com/user/repo.git"
+        fake_git.add_submodule(url, "/fake/deps/my-dep", "main")
+        fake_git.configure_fetch_ref_failure("/fake/deps/my-dep")
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                "my-dep": DependencySpec(
+                    name="my-dep", git_url=GitUrl(url), git_ref=GitRef("main")
+                )
+            },
+        )
+
+        # Exercise
+        lock_entries = resolution_service.resolve_to_lock_entries(
+            full_dependency_context, config
+        )
+
+        # Verify
+        assert fake_git.get_fetch_all_count() == 1
+        assert "my-dep" in lock_entries
+
+    def test_submodule_at_pinned_commit_skips_fetch_without_lock(
+        self,
+        full_dependency_context: DependencyContext,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should not fetch when a SHA ref is already checked out, even unlocked."""
+        # Setup
+        url = "https://github.com/user/repo.git"
+        fake_git.add_submodule(url, "/fake/deps/my-dep", "main")
+        sha = fake_git.get_current_commit("/fake/deps/my-dep")
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                "my-dep": DependencySpec(name="my-dep", git_url=GitUrl(url), git_ref=GitRef(sha))
+            },
+        )
+
+        # Exercise
+        lock_entries = resolution_service.resolve_to_lock_entries(
+            full_dependency_context, config
+        )
+
+        # Verify
+        assert fake_git.get_fetch_ref_calls() == []
+        assert fake_git.get_fetch_all_count() == 0
+        assert lock_entries["my-dep"].commit == sha
+
+
+class TestCanUseSubmodules:
+    """Tests for the memoized submodule-support check.
+
+    Rationale: The check spawns `git rev-parse`; it must run once per
+    batch, not once per dependency.
+    """
+
+    def test_check_runs_once_per_batch(
+        self,
+        full_dependency_context: DependencyContext,
+    ) -> None:
+        """Should only detect submodule support once for many dependencies."""
+        # Setup
+        resolution_service._submodule_support_cache.clear()
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={
+                name: DependencySpec(
+                    name=name,
+                    git_url=GitUrl(f"https://github.com/user/{name}.git"),
+                    git_ref=GitRef("main"),
+                )
+                for name in ("dep1", "dep2", "dep3")
+            },
+        )
+
+        # Exercise
+        resolution_service.resolve_all_dependencies(full_dependency_context, config)
+
+        # Verify
+        assert list(resolution_service._submodule_support_cache) == [
+            ("/fake/deps", "/fake/cwd")
+        ]
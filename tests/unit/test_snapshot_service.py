@@ -1,5 +1,7 @@
 """Tests for snapshot service."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 from graft.services.snapshot_service import (
@@ -170,6 +172,20 @@ class TestCleanupOldSnapshots:
 
         assert deleted == []
 
+    def test_parallel_deletion_preserves_listing_order(self):
+        """Should report every deleted ID in listing order when deleting many."""
+        fake = FakeSnapshot()
+        fake.set_file_content("file.txt", "content")
+
+        for _ in range(12):
+            create_workspace_snapshot(fake, ["file.txt"], "/base")
+        expected = fake.list_snapshots()[2:]
+
+        deleted = cleanup_old_snapshots(fake, keep_count=2)
+
+        assert deleted == expected
+        assert len(fake.list_snapshots()) == 2
+
     def test_handles_zero_snapshots(self):
         """Should handle case with no snapshots."""
         fake = FakeSnapshot()
@@ -179,6 +195,48 @@ class TestCleanupOldSnapshots:
         assert deleted == []
 
 
+class TestCleanupOldSnapshotsPolicies:
+    """Tests for age and size limits in cleanup_old_snapshots()."""
+
+    def test_deletes_snapshots_older_than_max_age(self):
+        """Should delete snapshots past max_age_days even under keep_count."""
+        fake = FakeSnapshot()
+        now = datetime.now(UTC)
+        recent = fake.add_snapshot(now - timedelta(days=1), {"graft.lock": "a"})
+        stale = fake.add_snapshot(now - timedelta(days=30), {"graft.lock": "b"})
+
+        deleted = cleanup_old_snapshots(fake, keep_count=5, max_age_days=7)
+
+        assert deleted == [stale]
+        assert fake.snapshot_exists(recent)
+
+    def test_deletes_oldest_snapshots_over_size_budget(self):
+        """Should keep the newest snapshots that fit within max_total_bytes."""
+        fake = FakeSnapshot()
+        now = datetime.now(UTC)
+        oldest = fake.add_snapshot(now - timedelta(hours=3), {"graft.lock": "x"})
+        middle = fake.add_snapshot(now - timedelta(hours=2), {"graft.lock": "x" * 10})
+        newest = fake.add_snapshot(now - timedelta(hours=1), {"graft.lock": "x" * 10})
+
+        deleted = cleanup_old_snapshots(fake, keep_count=5, max_total_bytes=15)
+
+        assert deleted == [middle, oldest]
+        assert fake.snapshot_exists(newest)
+
+    def test_keep_count_still_applies_with_limits(self):
+        """Should enforce keep_count alongside age and size limits."""
+        fake = FakeSnapshot()
+        now = datetime.now(UTC)
+        ids = [
+            fake.add_snapshot(now - timedelta(minutes=minutes), {"graft.lock": "x"})
+            for minutes in (3, 2, 1)
+        ]
+
+        deleted = cleanup_old_snapshots(fake, keep_count=1, max_age_days=7, max_total_bytes=1000)
+
+        assert deleted == [ids[1], ids[0]]
+
+
 class TestGetSnapshotPathsForDependency:
     """Tests for get_snapshot_paths_for_dependency()."""
 
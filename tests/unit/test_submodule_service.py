@@ -0,0 +1,31 @@
+"""Unit tests for submodule service."""
+
+from graft.services import submodule_service
+from tests.fakes.fake_git import FakeGitOperations
+
+
+class TestLoadSubmoduleIndex:
+    """Tests for load_submodule_index and lookup_submodule."""
+
+    def test_lookup_uses_normalized_paths(self) -> None:
+        """Should find submodules regardless of path spelling."""
+        git = FakeGitOperations()
+        git.add_submodule("https://example.com/dep.git", ".graft/dep")
+
+        index = submodule_service.load_submodule_index(git)
+
+        assert submodule_service.lookup_submodule(index, "./.graft/dep") is not None
+        assert submodule_service.lookup_submodule(index, ".graft/other") is None
+
+    def test_listing_failure_gives_empty_index(self) -> None:
+        """Should return an empty index when submodules can't be listed."""
+
+        class FailingGit(FakeGitOperations):
+            def list_submodules(self) -> dict[str, dict[str, str]]:
+                raise ValueError("not a git repository")
+
+        assert submodule_service.load_submodule_index(FailingGit()) == {}
+
+    def test_lookup_without_index(self) -> None:
+        """Should miss every path when no index was loaded."""
+        assert submodule_service.lookup_submodule(None, ".graft/dep") is None
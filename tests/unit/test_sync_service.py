@@ -3,6 +3,7 @@
 Tests for sync_dependency and sync_all_dependencies service functions.
 """
 
+import threading
 from datetime import UTC, datetime
 
 import pytest
@@ -150,6 +151,32 @@ class TestSyncDependency:
         assert result.action == "failed"
         assert "not a git repository" in result.message
 
+    def test_sync_reports_git_failure(
+        self,
+        fake_filesystem: FakeFileSystem,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should report git errors as a failed sync."""
+        fake_git.configure_failure("https://github.com/user/repo.git", "network unreachable")
+        entry = LockEntry(
+            source="https://github.com/user/repo.git",
+            ref="v1.0.0",
+            commit="a" * 40,
+            consumed_at=datetime.now(UTC),
+        )
+
+        result = sync_service.sync_dependency(
+            filesystem=fake_filesystem,
+            git=fake_git,
+            deps_directory="/deps",
+            name="my-dep",
+            entry=entry,
+        )
+
+        assert result.success is False
+        assert result.action == "failed"
+        assert "network unreachable" in result.message
+
 
 class TestSyncAllDependencies:
     """Tests for sync_all_dependencies service function."""
@@ -222,3 +249,79 @@ class TestSyncAllDependencies:
         assert results[0].success is False
         assert results[1].name == "dep2"
         assert results[1].success is True
+
+    def test_sync_all_orders_results_by_name(
+        self,
+        fake_filesystem: FakeFileSystem,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should return results in name order when syncing in parallel."""
+        names = [f"dep{i}" for i in range(12, 0, -1)]
+        entries = {
+            name: LockEntry(
+                source=f"https://github.com/user/{name}.git",
+                ref="main",
+                commit="c" * 40,
+                consumed_at=datetime.now(UTC),
+            )
+            for name in names
+        }
+
+        results = sync_service.sync_all_dependencies(
+            filesystem=fake_filesystem,
+            git=fake_git,
+            deps_directory="/deps",
+            lock_entries=entries,
+        )
+
+        assert [r.name for r in results] == sorted(names)
+        assert all(r.success for r in results)
+
+    def test_sync_all_updates_registered_submodules_concurrently(
+        self,
+        fake_filesystem: FakeFileSystem,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should clone registered submodules outside the superproject lock.
+
+        Rationale: The clone/fetch in `submodule update` is the slow part of
+        a cold sync; only the .git/config write in `submodule init` needs
+        serializing.
+        """
+        names = ["dep1", "dep2"]
+        for name in names:
+            fake_git.add_submodule(f"https://github.com/user/{name}.git", f"/deps/{name}")
+        entries = {
+            name: LockEntry(
+                source=f"https://github.com/user/{name}.git",
+                ref="main",
+                commit=fake_git.get_current_commit(f"/deps/{name}"),
+                consumed_at=datetime.now(UTC),
+            )
+            for name in names
+        }
+
+        # Each update waits for the other; a lock held around the updates
+        # would break the barrier
+        barrier = threading.Barrier(len(names), timeout=5)
+        update_submodule = fake_git.update_submodule
+
+        def blocking_update(path: str, init: bool = True, recursive: bool = False) -> None:
+            barrier.wait()
+            update_submodule(path, init=init, recursive=recursive)
+
+        fake_git.update_submodule = blocking_update  # type: ignore[method-assign]
+
+        results = sync_service.sync_all_dependencies(
+            filesystem=fake_filesystem,
+            git=fake_git,
+            deps_directory="/deps",
+            lock_entries=entries,
+        )
+
+        assert all(r.action == "up_to_date" for r in results)
+        assert sorted(fake_git.get_init_submodule_calls()) == ["/deps/dep1", "/deps/dep2"]
+        assert sorted(fake_git.get_update_submodule_calls()) == [
+            ("/deps/dep1", False, False),
+            ("/deps/dep2", False, False),
+        ]
@@ -5,7 +5,12 @@ import pytest
 from graft.domain.change import Change
 from graft.domain.command import Command
 from graft.domain.config import GraftConfig
-from graft.services.upgrade_service import rollback_upgrade, upgrade_dependency
+from graft.services.upgrade_service import (
+    DependencyUpgrade,
+    rollback_upgrade,
+    upgrade_dependencies_batch,
+    upgrade_dependency,
+)
 from tests.fakes.fake_command_executor import FakeCommandExecutor
 from tests.fakes.fake_lock_file import FakeLockFile
 from tests.fakes.fake_snapshot import FakeSnapshot
@@ -426,6 +431,121 @@ class TestUpgradeDependency:
         assert fake_snapshot.snapshot_exists(result.snapshot_id)
 
 
+class TestUpgradeDependenciesBatch:
+    """Tests for upgrade_dependencies_batch()."""
+
+    @pytest.fixture
+    def fake_snapshot(self):
+        """Create fake snapshot."""
+        snap = FakeSnapshot()
+        snap.set_file_content("graft.lock", "old lock")
+        return snap
+
+    @pytest.fixture
+    def plain_config(self):
+        """Create config with a change that has no commands."""
+        return GraftConfig(
+            api_version="graft/v0",
+            changes={"v2.0.0": Change(ref="v2.0.0", type="feature")},
+        )
+
+    @pytest.fixture
+    def migrating_config(self):
+        """Create config with a change that runs a migration."""
+        return GraftConfig(
+            api_version="graft/v0",
+            commands={
+                "migrate": Command(name="migrate", run="echo migrating", description="Migration"),
+            },
+            changes={"v3.0.0": Change(ref="v3.0.0", type="breaking", migration="migrate")},
+        )
+
+    def test_shares_one_snapshot(self, fake_snapshot, plain_config, migrating_config):
+        """Should snapshot once for the whole batch and update every lock entry."""
+        lock_file = FakeLockFile()
+        lock_file.write_lock_file("/project/graft.lock", {})
+
+        results = upgrade_dependencies_batch(
+            fake_snapshot,
+            FakeCommandExecutor(),
+            lock_file,
+            [
+                DependencyUpgrade(
+                    plain_config, "dep-a", "v2.0.0", "git@example.com:a.git", "a" * 40
+                ),
+                DependencyUpgrade(
+                    migrating_config, "dep-b", "v3.0.0", "git@example.com:b.git", "b" * 40
+                ),
+            ],
+            base_dir="/project",
+            lock_path="/project/graft.lock",
+            auto_cleanup=False,
+        )
+
+        assert [r.success for r in results] == [True, True]
+        assert fake_snapshot.list_snapshots() == [results[0].snapshot_id]
+        assert results[1].snapshot_id == results[0].snapshot_id
+        entries = lock_file.read_lock_file("/project/graft.lock")
+        assert entries["dep-a"].commit == "a" * 40
+        assert entries["dep-b"].commit == "b" * 40
+
+    def test_failure_rolls_back_whole_batch(self, fake_snapshot, plain_config, migrating_config):
+        """Should roll back earlier upgrades and skip later ones when one fails."""
+        executor = FakeCommandExecutor()
+        executor.set_next_result(1, "", "migration failed")
+        lock_file = FakeLockFile()
+        lock_file.write_lock_file("/project/graft.lock", {})
+
+        results = upgrade_dependencies_batch(
+            fake_snapshot,
+            executor,
+            lock_file,
+            [
+                DependencyUpgrade(
+                    plain_config, "dep-a", "v2.0.0", "git@example.com:a.git", "a" * 40
+                ),
+                DependencyUpgrade(
+                    migrating_config, "dep-b", "v3.0.0", "git@example.com:b.git", "b" * 40
+                ),
+                DependencyUpgrade(
+                    plain_config, "dep-c", "v2.0.0", "git@example.com:c.git", "c" * 40
+                ),
+            ],
+            base_dir="/project",
+            lock_path="/project/graft.lock",
+        )
+
+        assert [r.success for r in results] == [False, False, False]
+        assert results[0].error == "Rolled back: upgrade of dep-b failed"
+        assert "Migration failed" in results[1].error
+        assert results[2].error == "Not attempted: upgrade of dep-b failed"
+        # Snapshot kept for inspection
+        assert fake_snapshot.snapshot_exists(results[1].snapshot_id)
+        assert "dep-c" not in lock_file.read_lock_file("/project/graft.lock")
+
+    def test_unknown_change_fails_before_snapshot(self, fake_snapshot, plain_config):
+        """Should reject the batch without snapshotting if any change is unknown."""
+        results = upgrade_dependencies_batch(
+            fake_snapshot,
+            FakeCommandExecutor(),
+            FakeLockFile(),
+            [
+                DependencyUpgrade(
+                    plain_config, "dep-a", "v2.0.0", "git@example.com:a.git", "a" * 40
+                ),
+                DependencyUpgrade(
+                    plain_config, "dep-b", "v9.0.0", "git@example.com:b.git", "b" * 40
+                ),
+            ],
+            base_dir="/project",
+            lock_path="/project/graft.lock",
+        )
+
+        assert results[0].error == "Not attempted: batch contains unknown changes"
+        assert results[1].error == "Change not found: v9.0.0"
+        assert fake_snapshot.list_snapshots() == []
+
+
 class TestRollbackUpgrade:
     """Tests for rollback_upgrade()."""
 
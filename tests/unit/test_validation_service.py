@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 
 import pytest
 
+from graft.domain.change import Change
 from graft.domain.config import GraftConfig
 from graft.domain.dependency import DependencySpec, GitRef, GitUrl
 from graft.domain.lock_entry import LockEntry
@@ -77,6 +78,44 @@ class TestValidateConfigSchema:
 # Tests for domain validation belong in tests/unit/test_config.py instead.
 
 
+class TestValidateRefsExist:
+    """Tests for validate_refs_exist function."""
+
+    def test_reports_missing_refs_in_config_order(self, fake_git: FakeGitOperations):
+        """Should report each unresolvable ref, in the order changes are declared."""
+        refs = ["v1.0.0", "v2.0.0", "v3.0.0", "v4.0.0"]
+        config = GraftConfig(
+            api_version="graft/v0",
+            dependencies={},
+            changes={ref: Change(ref=ref) for ref in refs},
+            commands={},
+            metadata={},
+        )
+        fake_git.configure_ref("/deps/lib", "v1.0.0", "a" * 40)
+        fake_git.configure_ref("/deps/lib", "v3.0.0", "c" * 40)
+
+        errors = validation_service.validate_refs_exist(config, fake_git, "/deps/lib")
+
+        assert [e.message.split("'")[1] for e in errors] == ["v2.0.0", "v4.0.0"]
+        assert all(e.severity == "error" for e in errors)
+
+
+class TestValidationErrorSeverity:
+    """Tests for ValidationError severity normalization."""
+
+    def test_string_severity_is_normalized(self):
+        """Should store string severities as Severity members."""
+        error = validation_service.ValidationError("Warning", severity="warning")
+
+        assert error.severity is validation_service.Severity.WARNING
+        assert error.severity == "warning"
+
+    def test_unknown_severity_rejected(self):
+        """Should reject severities other than error and warning."""
+        with pytest.raises(ValueError):
+            validation_service.ValidationError("Note", severity="info")
+
+
 class TestGetValidationSummary:
     """Tests for get_validation_summary function."""
 
@@ -99,6 +138,18 @@ class TestGetValidationSummary:
         assert "Warning 1" in warnings
         assert "Warning 2" in warnings
 
+    def test_accepts_iterator(self):
+        """Should consume a generator of errors in one pass."""
+        validation_errors = (
+            validation_service.ValidationError(f"Error {i}", severity=severity)
+            for i, severity in enumerate(["error", "warning", "error"])
+        )
+
+        errors, warnings = validation_service.get_validation_summary(validation_errors)
+
+        assert errors == ["Error 0", "Error 2"]
+        assert warnings == ["Error 1"]
+
     def test_empty_list(self):
         """Should return empty lists for empty input."""
         errors, warnings = validation_service.get_validation_summary([])
@@ -314,3 +365,66 @@ class TestValidateIntegrity:
         # Second should fail
         dep2_result = next(r for r in results if r.name == "dep2")
         assert dep2_result.valid is False
+
+    def test_integrity_results_ordered_by_name(
+        self,
+        fake_filesystem: FakeFileSystem,
+        fake_git: FakeGitOperations,
+    ) -> None:
+        """Should return results in name order when checking in parallel."""
+        names = [f"dep{i:02d}" for i in range(10, 0, -1)]
+        for name in names:
+            fake_filesystem.mkdir(f"/deps/{name}")
+            fake_git._cloned_repos[f"/deps/{name}"] = (f"url-{name}", "main")
+            fake_git.configure_current_commit(f"/deps/{name}", "a" * 40)
+
+        lock_entries = {
+            name: LockEntry(
+                source=f"url-{name}",
+                ref="main",
+                commit="a" * 40,
+                consumed_at=datetime.now(UTC),
+            )
+            for name in names
+        }
+
+        results = validation_service.validate_integrity(
+            filesystem=fake_filesystem,
+            git=fake_git,
+            deps_directory="/deps",
+            lock_entries=lock_entries,
+            max_workers=4,
+        )
+
+        assert [r.name for r in results] == sorted(names)
+        assert all(r.valid for r in results)
+
+
+class TestValidateSubmoduleState:
+    """Tests for validate_submodule_state function."""
+
+    def test_registration_read_with_one_git_call(self, fake_git: FakeGitOperations) -> None:
+        """Should look up submodules once instead of per dependency."""
+        names = ["dep-a", "dep-b", "dep-c"]
+        lock_entries = {}
+        for name in names:
+            fake_git.add_submodule(f"url-{name}", f".graft/{name}", "main")
+            fake_git.configure_ref(f".graft/{name}", "main", "a" * 40)
+            fake_git.configure_current_commit(f".graft/{name}", "a" * 40)
+            lock_entries[name] = LockEntry(
+                source=f"url-{name}",
+                ref="main",
+                commit="a" * 40,
+                consumed_at=datetime.now(UTC),
+            )
+
+        results = validation_service.validate_submodule_state(
+            git=fake_git,
+            deps_directory=".graft",
+            lock_entries=lock_entries,
+        )
+
+        assert [r.name for r in results] == names
+        assert all(r.is_submodule and r.message == "OK" for r in results)
+        assert fake_git.get_is_submodule_calls() == []
+        assert fake_git.get_list_submodules_count() == 1